@@ -0,0 +1,63 @@
+"""
+Comparing many strategies with `Chart.backtest(strategies=...)`: one chart with every strategy
+against one `backtest` call per strategy, both rendered with `engine='native'`.
+
+Usage:
+    python benchmarks/backtest_strategies.py --bars 5000 --strategies 1 10 50
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.strategies import align_strategies
+
+from candle_engine import make_ohlc
+
+
+def make_strategy(df, seed, n_trades=100):
+    """Random trades on the bars of `df` and an equity/drawdown portfolio starting at a random bar."""
+    rng = np.random.default_rng(seed)
+    equity = 1e8 * np.exp(np.cumsum(rng.normal(0, 0.005, len(df))))
+    start = int(rng.integers(0, len(df) // 10))
+    portfolio = pd.DataFrame({'equity': equity[start:]}, index=df.index[start:])
+    portfolio['drawdown'] = portfolio['equity'] / portfolio['equity'].cummax() - 1
+    bars = np.sort(rng.choice(len(df), n_trades, replace=False))
+    trades = pd.DataFrame({'time': df.index[bars], 'type': np.where(np.arange(n_trades) % 2, 'BAN', 'MUA'),
+                           'price': df['Close'].to_numpy()[bars]})
+    return trades, portfolio
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, default=5000)
+    parser.add_argument('--strategies', type=int, nargs='+', default=[1, 10, 50])
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    df = make_ohlc(args.bars)
+    print(f"{args.bars:,} bars, engine='native'")
+    print(f"{'strategies':>10}{'align':>10}{'one chart':>12}{'N charts':>11}")
+    for n in args.strategies:
+        strategies = {f'S{i}': make_strategy(df, i) for i in range(n)}
+        align, _ = timed(lambda: align_strategies(strategies, df.index))
+        combined, _ = timed(lambda: Chart.backtest(df, strategies=strategies, engine='native', output='png', cache=False))
+        separate, _ = timed(lambda: [Chart.backtest(df, trades=trades, portfolio=portfolio, engine='native',
+                                                    output='png', cache=False)
+                                     for trades, portfolio in strategies.values()])
+        print(f"{n:>10}{align * 1e3:>8.1f}ms{combined:>11.2f}s{separate:>10.2f}s")
@@ -0,0 +1,128 @@
+"""
+Throughput of `Chart.render_batch` against one interpreter per chart.
+
+The subprocess scenario mirrors `examples/run_all.py`: every chart pays for a
+fresh interpreter, the library import, font registration and the first draw.
+The batch scenario renders the same theme x language x chart matrix on a
+persistent pool of warmed workers (measured cold, including pool start-up,
+and warm, reusing the pool).
+
+Usage:
+    python benchmarks/batch_render.py --workers 4
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+THEMES = ['vnstock', 'academic', 'minimal']
+LANGS = ['vi', 'en']
+METHODS = ['candle', 'line', 'equity_curve', 'returns_heatmap', 'hist', 'boxplot', 'backtest']
+
+SUBPROCESS_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+import matplotlib
+matplotlib.use('Agg')
+sys.path.insert(0, {bench_dir!r})
+from batch_render import make_spec
+from vnstock_ezchart import Chart
+Chart.set_theme(theme_name={theme!r}, lang={lang!r})
+spec = make_spec({method!r}, {output!r})
+result = getattr(Chart, spec['method'])(spec['data'], **spec.get('kwargs', {{}}))
+fig = result[0] if isinstance(result, tuple) else result
+fig.savefig(spec['output'], dpi=150, bbox_inches='tight')
+"""
+
+
+def make_data(n=500):
+    rng = np.random.default_rng(42)
+    dates = pd.date_range('2022-01-03', periods=n, freq='B')
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    ohlc = pd.DataFrame({'Open': close * (1 + rng.normal(0, 0.005, n)), 'High': close * 1.01, 'Low': close * 0.99,
+                         'Close': close, 'Volume': rng.integers(100000, 5000000, n)}, index=dates)
+    returns = ohlc['Close'].pct_change().fillna(0)
+    equity = (1 + returns).cumprod()
+    portfolio = pd.DataFrame({'equity': equity, 'drawdown': equity / equity.cummax() - 1})
+    trades = pd.DataFrame({'time': dates[[20, 80, 150, 300]], 'type': ['MUA', 'BAN', 'MUA', 'BAN'],
+                           'price': close[[20, 80, 150, 300]]})
+    return ohlc, returns, equity, portfolio, trades
+
+
+def make_spec(method, output):
+    ohlc, returns, equity, portfolio, trades = make_data()
+    specs = {
+        'candle': {'data': ohlc.iloc[-120:], 'kwargs': {'title': 'Candle', 'show': False}},
+        'line': {'data': ohlc['Close'], 'kwargs': {'title': 'Close', 'show': False}},
+        'equity_curve': {'data': equity, 'kwargs': {}},
+        'returns_heatmap': {'data': returns, 'kwargs': {}},
+        'hist': {'data': returns, 'kwargs': {'bins': 50, 'show': False}},
+        'boxplot': {'data': ohlc[['Open', 'Close']], 'kwargs': {'show': False}},
+        'backtest': {'data': ohlc.iloc[-350:], 'kwargs': {'trades': trades, 'portfolio': portfolio.iloc[-350:], 'show': False}},
+    }
+    return {'method': method, 'output': output, **specs[method]}
+
+
+def run_subprocesses(out_dir):
+    bench_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.dirname(bench_dir)
+    for theme in THEMES:
+        for lang in LANGS:
+            for method in METHODS:
+                output = os.path.join(out_dir, f'sub_{theme}_{lang}_{method}.png')
+                script = SUBPROCESS_SCRIPT.format(root=root, bench_dir=bench_dir, theme=theme, lang=lang,
+                                                  method=method, output=output)
+                subprocess.run([sys.executable, '-c', script], check=True, capture_output=True)
+
+
+def batch_specs(out_dir):
+    specs = []
+    for theme in THEMES:
+        for lang in LANGS:
+            for method in METHODS:
+                spec = make_spec(method, os.path.join(out_dir, f'batch_{theme}_{lang}_{method}.png'))
+                spec['theme'] = {'theme_name': theme, 'lang': lang}
+                specs.append(spec)
+    return specs
+
+
+if __name__ == '__main__':
+    import matplotlib
+    matplotlib.use('Agg')
+    from vnstock_ezchart import Chart
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--skip-subprocess', action='store_true')
+    args = parser.parse_args()
+
+    n_charts = len(THEMES) * len(LANGS) * len(METHODS)
+    with tempfile.TemporaryDirectory() as out_dir:
+        rows = []
+        if not args.skip_subprocess:
+            t0 = time.perf_counter()
+            run_subprocesses(out_dir)
+            rows.append(('subprocess per chart', time.perf_counter() - t0))
+
+        specs = batch_specs(out_dir)
+        t0 = time.perf_counter()
+        errors = [r['error'] for r in Chart.render_batch(specs, workers=args.workers) if r['error']]
+        rows.append((f'render_batch cold ({args.workers} workers)', time.perf_counter() - t0))
+        t0 = time.perf_counter()
+        errors += [r['error'] for r in Chart.render_batch(specs, workers=args.workers) if r['error']]
+        rows.append((f'render_batch warm ({args.workers} workers)', time.perf_counter() - t0))
+        Chart.shutdown_batch_pool()
+
+    if errors:
+        print('errors:', errors[:3])
+    print(f"{n_charts} charts ({len(METHODS)} methods x {len(THEMES)} themes x {len(LANGS)} languages)")
+    print(f"{'scenario':<36}{'total (s)':>10}{'charts/s':>10}")
+    for name, elapsed in rows:
+        print(f"{name:<36}{elapsed:>10.2f}{n_charts / elapsed:>10.2f}")
@@ -0,0 +1,65 @@
+"""
+`Chart.candle(engine='native')` against the default mplfinance engine across bar counts,
+end to end (building the figure and rendering it with `output='png'`).
+
+Usage:
+    python benchmarks/candle_engine.py --bars 500 2000 5000 20000 --repeat 3
+    python benchmarks/candle_engine.py --bars 100000 --engines native
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+
+def make_ohlc(n):
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2020-01-01 09:15', periods=n, freq='min')
+    close = 100 + np.cumsum(rng.normal(0, 0.2, n))
+    open_ = close + rng.normal(0, 0.1, n)
+    return pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + rng.random(n) * 0.2,
+                         'Low': np.minimum(open_, close) - rng.random(n) * 0.2, 'Close': close,
+                         'Volume': rng.integers(100_000, 1_000_000, n).astype(float)}, index=index)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, nargs='+', default=[500, 2000, 5000, 20000])
+    parser.add_argument('--engines', nargs='+', choices=['mplfinance', 'native'], default=['mplfinance', 'native'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # mplfinance warns on every call with more than a few hundred bars
+    warnings.filterwarnings('ignore', message='(?s).*YOU ARE PLOTTING SO MUCH DATA')
+    warm = make_ohlc(50)
+    for engine in args.engines:
+        Chart.candle(warm, engine=engine, output='png', output_dpi=100)
+
+    print(f"{'bars':>8}" + ''.join(f'{e:>14}' for e in args.engines) + '   (median s, candle + volume + 2 overlays + 1 subplot)')
+    for n in args.bars:
+        df = make_ohlc(n)
+        overlays = [df['Close'].rolling(20).mean(), df['Close'].rolling(50).mean()]
+        subplots = [{'data': df['Close'].diff().rolling(14).mean(), 'ylabel': 'Momentum'}]
+        row = [timed(lambda: Chart.candle(df, title='FPT', overlays=overlays, subplots=subplots, engine=engine,
+                                          output='png', output_dpi=100), args.repeat) for engine in args.engines]
+        print(f'{n:>8}' + ''.join(f'{v:>14.2f}' for v in row))
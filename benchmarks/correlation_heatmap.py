@@ -0,0 +1,69 @@
+"""
+Correlation heatmap of many tickers: `DataFrame.corr()` drawn with `seaborn.heatmap` against
+`Chart.correlation_heatmap` (float32 blocked correlations, clustered order, one raster image).
+
+Usage:
+    python benchmarks/correlation_heatmap.py --tickers 400 --days 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.correlation import correlation_frame
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def seaborn_heatmap(returns):
+    fig, ax = plt.subplots(figsize=(10, 8))
+    sns.heatmap(returns.corr(), cmap='RdYlGn', vmin=-1, vmax=1, ax=ax)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def raster_heatmap(returns):
+    fig, ax, _ = Chart.correlation_heatmap(returns)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickers', type=int, default=400)
+    parser.add_argument('--days', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Sector factors so the clustering has blocks to find, and a few gaps for pairwise handling
+    sectors = rng.integers(0, 8, args.tickers)
+    factors = rng.normal(0, 0.015, (args.days, 8))
+    values = factors[:, sectors] + rng.normal(0, 0.015, (args.days, args.tickers))
+    values[rng.random(values.shape) < 0.01] = np.nan
+    returns = pd.DataFrame(values, columns=[f'T{i:03d}' for i in range(args.tickers)])
+
+    print(f'{args.tickers} tickers x {args.days:,} daily returns')
+    elapsed, _ = timed(lambda: returns.corr())
+    print(f'  DataFrame.corr:                   {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: correlation_frame(returns, cluster=False))
+    print(f'  float32 blocks:                   {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: correlation_frame(returns))
+    print(f'  float32 blocks + clustering:      {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: seaborn_heatmap(returns))
+    print(f'  corr + seaborn.heatmap, drawn:    {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: raster_heatmap(returns))
+    print(f'  correlation_heatmap, drawn:       {elapsed * 1e3:8.1f} ms')
@@ -0,0 +1,49 @@
+"""
+Return-vs-volume scatter of every ticker-day: one marker per point (`density=False`, the former
+`DataFrame.plot(kind='scatter')` path) against the binned density image, also fed in chunks.
+Times include encoding the PNG, whose size is reported too.
+
+Usage:
+    python benchmarks/density_scatter.py --points 1000000 --chunk 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--points', type=int, default=1_000_000)
+    parser.add_argument('--chunk', type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    volume = rng.normal(5.0, 0.5, args.points)
+    returns = rng.standard_t(4, args.points) * 0.01 * (1 + 0.3 * (6.0 - volume).clip(0))
+    days = pd.DataFrame({'log_volume': volume, 'return': returns})
+
+    print(f'{args.points:,} points')
+    cases = [
+        ('marker per point', lambda: Chart.scatter(days, 'log_volume', 'return', density=False, output='png')),
+        ('density', lambda: Chart.scatter(days, 'log_volume', 'return', density=True, output='png')),
+        (f'density, {args.chunk:,}-row chunks',
+         lambda: Chart.scatter((days.iloc[i:i + args.chunk] for i in range(0, args.points, args.chunk)),
+                               'log_volume', 'return', output='png')),
+    ]
+    for name, fn in cases:
+        elapsed, png = timed(fn)
+        print(f'  {name:<32} {elapsed * 1e3:8.0f} ms  {len(png) / 1024:8.0f} KB')
@@ -0,0 +1,58 @@
+"""
+The derived series of a job that charts every ticker as a candle, a backtest (both with indicators) and
+an equity curve: with the derived-data cache disabled (each chart recomputes them) and enabled
+(`Chart.set_derived_cache`). Plotting itself is left out; it does not change with the cache.
+
+Usage:
+    python benchmarks/derived_cache.py --tickers 20 --bars 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.indicators import indicator_plots
+from vnstock_ezchart.core.returns import drawdown_series
+from vnstock_ezchart.utils import Utils
+
+from candle_engine import make_ohlc
+
+INDICATORS = ['sma20', 'ema50', 'bbands20', 'rsi14', 'macd']
+PALETTE = Utils.brand_palettes['vnstock']
+
+
+def job(frames):
+    for df in frames:
+        # candle and backtest lay out the same indicators, equity_curve draws the drawdown (never cached)
+        indicator_plots(df, INDICATORS, PALETTE, PALETTE[0], PALETTE[3])
+        indicator_plots(df, INDICATORS, PALETTE, PALETTE[0], PALETTE[3])
+        drawdown_series(df['Close'] / df['Close'].iloc[0])
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickers', type=int, default=20)
+    parser.add_argument('--bars', type=int, default=5000)
+    args = parser.parse_args()
+
+    base = make_ohlc(args.bars)
+    frames = [base * (1 + i / 1000) for i in range(args.tickers)]
+    print(f"{args.tickers} tickers x {args.bars:,} bars, {', '.join(INDICATORS)}")
+    Chart.set_derived_cache(enabled=False)
+    off, _ = timed(lambda: job(frames))
+    Chart.set_derived_cache(enabled=True)
+    on, _ = timed(lambda: job(frames))
+    print(f'  cache off: {off * 1e3:8.1f} ms')
+    print(f'  cache on:  {on * 1e3:8.1f} ms  {Chart.derived_cache_stats()}')
@@ -0,0 +1,53 @@
+"""
+Equity curves of a parameter sweep: one `equity_curve` figure per strategy (the only option before
+wide DataFrames were supported) against one figure with every strategy as a LineCollection.
+
+Usage:
+    python benchmarks/equity_curves.py --bars 1000 --strategies 100 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.returns import drawdown
+
+
+def make_curves(n_bars, n_strategies):
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0003, 0.01, (n_bars, n_strategies))
+    return pd.DataFrame(np.exp(np.cumsum(returns, axis=0)), index=pd.bdate_range('2015-01-01', periods=n_bars),
+                        columns=[f'S{i}' for i in range(n_strategies)])
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, default=1000)
+    parser.add_argument('--strategies', type=int, nargs='+', default=[100, 2000])
+    parser.add_argument('--sample', type=int, default=10, help='Per-strategy figures actually drawn; the rest is extrapolated')
+    args = parser.parse_args()
+
+    for n in args.strategies:
+        curves = make_curves(args.bars, n)
+        pandas_dd, _ = timed(lambda: [(curves[c] - curves[c].cummax()) / curves[c].cummax() for c in curves.columns])
+        numpy_dd, _ = timed(lambda: drawdown(curves.to_numpy()))
+        sample = min(n, args.sample)
+        separate, _ = timed(lambda: [Chart.equity_curve(curves[c], output='png', cache=False) for c in curves.columns[:sample]])
+        combined, _ = timed(lambda: Chart.equity_curve(curves, output='png', cache=False))
+        print(f'{n:>6,} strategies x {args.bars:,} bars: drawdowns per column {pandas_dd * 1e3:7.1f} ms, '
+              f'all at once {numpy_dd * 1e3:6.1f} ms; one figure each ~{separate / sample * n:7.1f} s, '
+              f'one LineCollection figure {combined:5.2f} s')
@@ -0,0 +1,73 @@
+"""
+First-chart latency: cold interpreter vs. a pre-forked warm worker (`Chart.prefork`).
+
+Usage:
+    python benchmarks/first_chart_latency.py --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+COLD_SCRIPT = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+import matplotlib
+matplotlib.use('Agg')
+import io
+import numpy as np, pandas as pd
+from vnstock_ezchart import Chart
+Chart.set_theme('vnstock', lang='en')
+n = 120
+idx = pd.date_range('2024-01-01', periods=n, freq='B')
+c = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+df = pd.DataFrame({{'Open': c, 'High': c + 1, 'Low': c - 1, 'Close': c, 'Volume': np.full(n, 1e6)}}, index=idx)
+fig, _ = Chart.candle(df, title='FPT', show=False)
+fig.savefig(io.BytesIO(), format='png', dpi=150, bbox_inches='tight')
+print(time.perf_counter() - t0)
+"""
+
+
+def make_df():
+    import numpy as np
+    import pandas as pd
+
+    n = 120
+    idx = pd.date_range('2024-01-01', periods=n, freq='B')
+    c = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+    return pd.DataFrame({'Open': c, 'High': c + 1, 'Low': c - 1, 'Close': c, 'Volume': np.full(n, 1e6)}, index=idx)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    cold = [float(subprocess.run([sys.executable, '-c', COLD_SCRIPT.format(root=ROOT)], check=True,
+                                 capture_output=True, text=True).stdout.strip().splitlines()[-1])
+            for _ in range(args.repeat)]
+
+    from vnstock_ezchart import Chart
+
+    df = make_df()
+    first, steady = [], []
+    for _ in range(args.repeat):
+        with Chart.prefork(workers=1, theme_name='vnstock', lang='en') as pool:
+            t0 = time.perf_counter()
+            pool.render('candle', df, title='FPT', show=False)
+            first.append(time.perf_counter() - t0)
+            for _ in range(3):
+                t0 = time.perf_counter()
+                pool.render('candle', df, title='FPT', show=False)
+                steady.append(time.perf_counter() - t0)
+
+    print(f"{'scenario':<40}{'median (s)':>12}")
+    print(f"{'cold interpreter, first chart':<40}{statistics.median(cold):>12.3f}")
+    print(f"{'prefork worker, first chart':<40}{statistics.median(first):>12.3f}")
+    print(f"{'prefork worker, steady state':<40}{statistics.median(steady):>12.3f}")
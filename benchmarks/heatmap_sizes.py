@@ -0,0 +1,53 @@
+"""
+Annotated `Chart.heatmap` from a 10 x 12 monthly returns table up to 2000 x 2000 cells: the seaborn
+path (one patch and one text per cell) against the raster path (one image, unreadable annotations
+culled). Seaborn is skipped above `--seaborn-max` cells, where it takes minutes.
+
+Usage:
+    python benchmarks/heatmap_sizes.py --seaborn-max 10000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+SHAPES = [(10, 12), (30, 30), (100, 100), (500, 500), (2000, 2000)]
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def draw(values, raster):
+    fig, ax = Chart.heatmap(values, annot=True, fmt='.1%', center=0, raster=raster)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seaborn-max', type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f'{"cells":>11}  {"seaborn":>10}  {"raster":>10}')
+    for rows, cols in SHAPES:
+        values = pd.DataFrame(rng.normal(0.01, 0.05, (rows, cols)))
+        seaborn = '-'
+        if rows * cols <= args.seaborn_max:
+            elapsed, _ = timed(lambda: draw(values, False))
+            seaborn = f'{elapsed * 1e3:8.0f} ms'
+        elapsed, _ = timed(lambda: draw(values, True))
+        print(f'{rows:>5}x{cols:<5}  {seaborn:>10}  {elapsed * 1e3:7.0f} ms')
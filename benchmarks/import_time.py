@@ -0,0 +1,54 @@
+"""
+Cold-start benchmark for `import vnstock_ezchart`.
+
+Every measurement runs in a fresh interpreter so that nothing is cached in
+`sys.modules`. The "eager" scenario imports the same heavy dependencies the
+package used to pull in at import time (seaborn, mplfinance, wordcloud,
+squarify, requests) to show what the lazy import graph saves.
+
+Usage:
+    python benchmarks/import_time.py --repeat 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SCENARIOS = {
+    'lazy (import vnstock_ezchart)': "import vnstock_ezchart",
+    'eager (previous import graph)': "import vnstock_ezchart, seaborn, mplfinance, wordcloud, squarify, requests",
+    'lazy + first Chart.line': (
+        "import matplotlib; matplotlib.use('Agg'); import pandas as pd; "
+        "from vnstock_ezchart import Chart; Chart.line(pd.Series(range(10)), show=False)"
+    ),
+}
+
+TIMER = (
+    "import sys, time; sys.path.insert(0, {root!r}); t0 = time.perf_counter(); {stmt}; "
+    "print(time.perf_counter() - t0); "
+    "print(','.join(m for m in ('seaborn', 'mplfinance', 'wordcloud', 'squarify', 'requests') if m in sys.modules))"
+)
+
+
+def measure(stmt, repeat):
+    timings, loaded = [], ''
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', TIMER.format(root=ROOT, stmt=stmt)],
+                             check=True, capture_output=True, text=True).stdout.split('\n')
+        timings.append(float(out[0]))
+        loaded = out[1]
+    return timings, loaded
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<34}{'median (s)':>12}{'min (s)':>10}  heavy modules loaded")
+    for name, stmt in SCENARIOS.items():
+        timings, loaded = measure(stmt, args.repeat)
+        print(f"{name:<34}{statistics.median(timings):>12.3f}{min(timings):>10.3f}  {loaded or '-'}")
@@ -0,0 +1,56 @@
+"""
+Indicator computation for many tickers: pandas `rolling`/`ewm` (how the examples computed SMA, EMA,
+RSI, Bollinger Bands and MACD) against the NumPy kernels of `core.indicators`.
+
+Usage:
+    python benchmarks/indicators.py --tickers 500 --bars 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart.core.indicators import indicator_frame
+
+from candle_engine import make_ohlc
+
+SPECS = ['sma20', 'ema50', 'rsi14', 'bbands20', 'macd']
+
+
+def pandas_indicators(df):
+    close = df['Close']
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-delta).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    middle, std = close.rolling(20).mean(), close.rolling(20).std(ddof=0)
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    return pd.DataFrame({'sma20': close.rolling(20).mean(), 'ema50': close.ewm(span=50, adjust=False).mean(),
+                         'rsi14': 100 - 100 / (1 + gain / loss), 'bb_upper': middle + 2 * std, 'bb_lower': middle - 2 * std,
+                         'macd': macd, 'signal': signal, 'hist': macd - signal})
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--bars', type=int, default=1000)
+    args = parser.parse_args()
+
+    base = make_ohlc(args.bars)
+    frames = [base * (1 + i / 1000) for i in range(args.tickers)]
+    print(f"{args.tickers} tickers x {args.bars:,} bars, {', '.join(SPECS)}")
+    elapsed, _ = timed(lambda: [pandas_indicators(df) for df in frames])
+    print(f'  pandas rolling/ewm:     {elapsed * 1e3:8.1f} ms  ({elapsed / args.tickers * 1e3:.2f} ms per ticker)')
+    elapsed, _ = timed(lambda: [indicator_frame(df, SPECS) for df in frames])
+    print(f'  core.indicators:        {elapsed * 1e3:8.1f} ms  ({elapsed / args.tickers * 1e3:.2f} ms per ticker)')
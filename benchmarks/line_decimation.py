@@ -0,0 +1,73 @@
+"""
+Render time of very long series with and without M4 decimation (first, last, min and max per pixel
+column): `line` on a minute-bar price history and a 3-column DataFrame, `equity_curve` on one long
+curve and on a parameter sweep. Times include encoding the PNG; vertex counts are those handed to Agg.
+The decimated chart is also rendered with `output='rgba'` (150 dpi, tight, so 'auto' sizes its columns
+for that resolution) and compared with the full one: the share of pixels whose color differs in any
+channel, over the whole image.
+
+Usage:
+    python benchmarks/line_decimation.py --bars 2000000 --sweep 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.render import render_figure
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def vertices(fig):
+    count = 0
+    for ax in fig.axes:
+        count += sum(len(line.get_xydata()) for line in ax.get_lines())
+        count += sum(sum(len(path.vertices) for path in collection.get_paths()) for collection in ax.collections)
+    return count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, default=2_000_000)
+    parser.add_argument('--sweep', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2014-01-02', periods=args.bars, freq='min')
+    price = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 3e-4, args.bars))), index=index, name='Close')
+    prices = pd.DataFrame({'FPT': price, 'VNM': price * 0.8 + 10, 'HPG': price[::-1].to_numpy()}, index=index)
+    sweep_bars = args.bars // 5
+    sweep = pd.DataFrame(np.exp(np.cumsum(rng.normal(0, 3e-4, (sweep_bars, args.sweep)), axis=0)), index=index[:sweep_bars])
+    cases = [
+        (f'line, {args.bars:,} bars', lambda d, **kw: Chart.line(price, decimate=d, **kw)),
+        (f'line, 3 x {args.bars:,} bars', lambda d, **kw: Chart.line(prices, decimate=d, **kw)),
+        (f'equity_curve, {args.bars:,} bars', lambda d, **kw: Chart.equity_curve(price / price.iloc[0], decimate=d, **kw)),
+        (f'equity_curve, {args.sweep} x {sweep_bars:,} bars', lambda d, **kw: Chart.equity_curve(sweep, decimate=d, **kw)),
+    ]
+    for name, draw in cases:
+        print(name)
+        full = None
+        for label, decimate in (('full', None), ('m4', 'auto')):
+            elapsed, fig = timed(lambda: draw(decimate)[0])
+            vertex_count = vertices(fig)
+            encoded, _ = timed(lambda: render_figure(fig, output='png'))
+            elapsed += encoded
+            pixels = draw(decimate, output='rgba', cache=False)
+            if full is None:
+                full, changed = pixels, ''
+            elif pixels.shape != full.shape:
+                changed = '  image size differs'
+            else:
+                changed = f'  {(pixels != full).any(axis=2).mean():.2%} pixels differ'
+            print(f'  {label:<5} {elapsed * 1e3:8.0f} ms  {vertex_count:>12,} vertices{changed}')
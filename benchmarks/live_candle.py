@@ -0,0 +1,75 @@
+"""
+Cost of one `Chart.live_candle` update (`update_last` / `append`) against redrawing the chart from
+scratch with `Chart.candle`, for growing amounts of history.
+
+Usage:
+    python benchmarks/live_candle.py --history 1000 10000 100000 --updates 500
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from vnstock_ezchart import Chart
+
+from candle_engine import make_ohlc
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def feed(live, close, updates, bar_every, rng):
+    """Streams synthetic ticks into the live chart; returns the update and append timings."""
+    update_times, append_times = [], []
+    open_ = high = low = close
+    volume = 0.0
+    for i in range(updates):
+        if i % bar_every == 0:
+            open_ = high = low = close
+            volume = 0.0
+            t0 = time.perf_counter()
+            live.append({'Open': open_, 'High': open_, 'Low': open_, 'Close': open_, 'Volume': 1.0}, overlays=[close])
+            append_times.append(time.perf_counter() - t0)
+        close += rng.normal(0, 0.02)
+        high, low, volume = max(high, close), min(low, close), volume + rng.integers(100, 1000)
+        t0 = time.perf_counter()
+        live.update_last({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, overlays=[close])
+        update_times.append(time.perf_counter() - t0)
+    return update_times, append_times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--history', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--capacity', type=int, default=300)
+    parser.add_argument('--updates', type=int, default=500)
+    parser.add_argument('--bar-every', type=int, default=20, help='ticks per bar')
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore', message='(?s).*YOU ARE PLOTTING SO MUCH DATA')
+    Chart.set_pyplot(False)
+
+    print(f"{'history':>8}{'update_last':>14}{'append':>10}{'redraws':>9}{'candle()':>11}   (median ms)")
+    for n in args.history:
+        df = make_ohlc(n)
+        sma = df['Close'].rolling(20).mean()
+        live = Chart.live_candle(df, capacity=args.capacity, title='FPT', overlays=[sma])
+        redraws = live.redraws
+        updates, appends = feed(live, df['Close'].iloc[-1], args.updates, args.bar_every, np.random.default_rng(0))
+        full = timed(lambda: Chart.candle(df, title='FPT', overlays=[sma], engine='native', output='rgba',
+                                          output_tight=False, cache=False), 3)
+        print(f'{n:>8}{statistics.median(updates) * 1e3:>14.2f}{statistics.median(appends) * 1e3:>10.2f}'
+              f'{live.redraws - redraws:>9}{full * 1e3:>11.0f}')
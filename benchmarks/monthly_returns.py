@@ -0,0 +1,50 @@
+"""
+Monthly returns tables for a basket: `resample('ME').apply(lambda x: (1 + x).prod() - 1)` per ticker
+(how `returns_heatmap` aggregated before) against the batch `Chart.monthly_returns` on the whole basket.
+
+Usage:
+    python benchmarks/monthly_returns.py --tickers 30 --days 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+
+def resample_table(returns):
+    monthly = returns.resample('ME').apply(lambda x: (1 + x).prod() - 1)
+    table = pd.DataFrame({'Year': monthly.index.year, 'Month': monthly.index.month, 'Return': monthly.values})
+    return table.pivot(index='Year', columns='Month', values='Return')
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickers', type=int, default=30)
+    parser.add_argument('--days', type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    basket = pd.DataFrame(rng.normal(0.0004, 0.02, (args.days, args.tickers)),
+                          index=pd.bdate_range('2005-01-03', periods=args.days),
+                          columns=[f'T{i:02d}' for i in range(args.tickers)])
+    Chart.set_derived_cache(enabled=False)
+    print(f'{args.tickers} tickers x {args.days:,} daily returns')
+    elapsed, _ = timed(lambda: [resample_table(basket[c]) for c in basket.columns])
+    print(f'  resample + lambda per ticker: {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: [Chart.monthly_returns(basket[c]) for c in basket.columns])
+    print(f'  log1p/reduceat per ticker:    {elapsed * 1e3:8.1f} ms')
+    elapsed, _ = timed(lambda: Chart.monthly_returns(basket))
+    print(f'  log1p/reduceat, one batch:    {elapsed * 1e3:8.1f} ms')
@@ -0,0 +1,75 @@
+"""
+Repeated identical chart requests with and without the render cache (`Chart.set_render_cache`):
+a cold `output='png'` render, a memory hit, a disk hit (fresh memory tier, as after a restart)
+and the cost of fingerprinting the request alone for larger inputs.
+
+Usage:
+    python benchmarks/render_cache.py --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.render import render_cache_key
+
+
+def make_ohlc(n):
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2015-01-01', periods=n, freq='min')
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': rng.integers(100_000, 1_000_000, n).astype(float)}, index=index)
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    ohlc = make_ohlc(250)
+    request = lambda: Chart.candle(ohlc, title='FPT', output='png')
+    request()  # warm-up
+
+    Chart.set_render_cache(False)
+    cold = median_ms(request, max(3, args.repeat // 4))
+
+    Chart.set_render_cache(disk=True, cache_dir=tempfile.mkdtemp())
+    request()
+    memory_hit = median_ms(request, args.repeat)
+
+    def disk_hit():
+        Chart.clear_render_cache()
+        request()
+    disk = median_ms(disk_hit, args.repeat)
+
+    print("candle, 250 bars, output='png' (median ms)")
+    print(f"  no cache          {cold:10.3f}")
+    print(f"  memory hit        {memory_hit:10.3f}")
+    print(f"  disk hit          {disk:10.3f}")
+    print(f"  stats             {Chart.render_cache_stats()}")
+
+    print('\nfingerprinting a candle request (median ms)')
+    for n in (1_000, 100_000, 1_000_000):
+        data = make_ohlc(n)
+        key = lambda: render_cache_key(Chart, 'candle', (data,), {'title': 'FPT'}, 'png', None, True)
+        print(f'  {n:>9,} bars    {median_ms(key, args.repeat):10.3f}')
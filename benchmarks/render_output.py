@@ -0,0 +1,74 @@
+"""
+Cost of turning a finished chart into an image: `savefig(bbox_inches='tight')` to a file,
+to memory, and the single-draw `output=` path (`core.render.render_figure`).
+
+Usage:
+    python benchmarks/render_output.py --repeat 10
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.render import render_figure
+
+
+def make_charts():
+    n = 250
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2024-01-01', periods=n, freq='B')
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    ohlc = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': rng.integers(100_000, 1_000_000, n).astype(float)}, index=index)
+    return {
+        'line': lambda: Chart.line(pd.Series(close, index=index, name='FPT'), title='FPT', show=False),
+        'candle': lambda: Chart.candle(ohlc, title='FPT', show=False),
+        'heatmap': lambda: Chart.heatmap(pd.DataFrame(rng.normal(size=(60, 8))).corr(), show=False),
+    }
+
+
+def timed(build, encode, repeat):
+    samples = []
+    for _ in range(repeat):
+        fig = build()[0]
+        t0 = time.perf_counter()
+        encode(fig)
+        samples.append(time.perf_counter() - t0)
+        plt.close(fig)
+    return statistics.median(samples)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, 'chart.png')
+    scenarios = {
+        'savefig tight -> file': lambda fig: fig.savefig(path, dpi=150, bbox_inches='tight'),
+        'savefig tight -> BytesIO': lambda fig: fig.savefig(io.BytesIO(), format='png', dpi=150, bbox_inches='tight'),
+        "output='png'": lambda fig: render_figure(fig, 'png', dpi=150, close=False),
+        "output='webp'": lambda fig: render_figure(fig, 'webp', dpi=150, close=False),
+        "output='rgba'": lambda fig: render_figure(fig, 'rgba', dpi=150, close=False),
+    }
+    charts = make_charts()
+    for build in charts.values():
+        plt.close(build()[0])  # warm-up
+
+    print(f"{'scenario':<28}" + ''.join(f'{name:>12}' for name in charts) + '  (median ms)')
+    for label, encode in scenarios.items():
+        row = [timed(build, encode, args.repeat) * 1000 for build in charts.values()]
+        print(f'{label:<28}' + ''.join(f'{v:>12.1f}' for v in row))
@@ -0,0 +1,62 @@
+"""
+Rolling Sharpe, volatility, beta and max drawdown over 63/126/252-day windows for a universe of
+tickers: pandas `rolling` per ticker (max drawdown through `rolling().apply`, timed on a sample of
+tickers and extrapolated) against the cumulative-sum kernels of `core.risk` on the whole universe.
+
+Usage:
+    python benchmarks/rolling_risk.py --tickers 400 --days 2500
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart.core.risk import rolling_risk
+
+WINDOWS = (63, 126, 252)
+
+
+def pandas_risk(returns, benchmark, max_drawdown=True):
+    equity = (1 + returns).cumprod()
+    out = {}
+    for window in WINDOWS:
+        rolling = returns.rolling(window)
+        out[('volatility', window)] = rolling.std() * np.sqrt(252)
+        out[('sharpe', window)] = rolling.mean() / rolling.std() * np.sqrt(252)
+        out[('beta', window)] = rolling.cov(benchmark) / benchmark.rolling(window).var()
+        if max_drawdown:
+            out[('max_drawdown', window)] = equity.rolling(window + 1).apply(lambda x: (x / np.maximum.accumulate(x) - 1).min(), raw=True)
+    return out
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickers', type=int, default=400)
+    parser.add_argument('--days', type=int, default=2500)
+    parser.add_argument('--sample', type=int, default=5, help='Tickers timed with the pandas max drawdown')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range('2015-01-01', periods=args.days)
+    benchmark = pd.Series(rng.normal(0.0003, 0.01, args.days), index=index)
+    universe = pd.DataFrame(benchmark.to_numpy()[:, None] + rng.normal(0, 0.015, (args.days, args.tickers)), index=index)
+
+    print(f'{args.tickers} tickers x {args.days:,} days, windows {WINDOWS}')
+    moments, _ = timed(lambda: [pandas_risk(universe[c], benchmark, max_drawdown=False) for c in universe.columns])
+    sample = min(args.sample, args.tickers)
+    full, _ = timed(lambda: [pandas_risk(universe[c], benchmark) for c in universe.columns[:sample]])
+    print(f'  pandas, Sharpe/volatility/beta:   {moments:8.2f} s')
+    print(f'  pandas, with max drawdown:       ~{full / sample * args.tickers:8.2f} s')
+    elapsed, _ = timed(lambda: rolling_risk(universe.to_numpy(), WINDOWS, benchmark.to_numpy()))
+    print(f'  core.risk, all metrics:           {elapsed:8.2f} s')
@@ -0,0 +1,84 @@
+"""
+FIFO round-trip pairing: a per-trade loop over a deque of open lots (how round trips are usually
+computed next to a backtest) against the vectorized `core.trades.round_trips`, plus a full
+`backtest(round_trips=True, engine='native')` render.
+
+Usage:
+    python benchmarks/round_trips.py --trades 10000 50000
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.trades import round_trips
+
+from candle_engine import make_ohlc
+
+
+def make_trades(index, n):
+    """`n` buys and sells of random lot sizes on random bars; positions flip between long and short."""
+    rng = np.random.default_rng(1)
+    bars = np.sort(rng.integers(0, len(index), n))
+    return pd.DataFrame({'time': index[bars], 'type': rng.choice(['MUA', 'BAN'], n),
+                         'price': 100 + rng.normal(0, 5, n), 'quantity': rng.choice([100, 200, 500, 1000], n)})
+
+
+def loop_round_trips(trades):
+    """Reference FIFO pairing, one trade at a time."""
+    lots, direction, rows = deque(), 0, []
+    for row in trades.itertuples(index=False):
+        side = 1 if row.type == 'MUA' else -1
+        quantity = float(row.quantity)
+        while quantity > 0 and lots and direction == -side:
+            entry_time, entry_price, open_quantity = lots[0]
+            matched = min(quantity, open_quantity)
+            rows.append((entry_time, row.time, direction, matched, entry_price, row.price,
+                         direction * (row.price - entry_price) * matched))
+            quantity -= matched
+            if open_quantity > matched:
+                lots[0] = (entry_time, entry_price, open_quantity - matched)
+            else:
+                lots.popleft()
+        if not lots:
+            direction = 0
+        if quantity > 0:
+            lots.append((row.time, row.price, quantity))
+            direction = side
+    return pd.DataFrame(rows, columns=['entry_time', 'exit_time', 'direction', 'quantity', 'entry_price',
+                                       'exit_price', 'pnl'])
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, default=100_000)
+    parser.add_argument('--trades', type=int, nargs='+', default=[10_000, 50_000])
+    args = parser.parse_args()
+
+    df = make_ohlc(args.bars)
+    for n in args.trades:
+        trades = make_trades(df.index, n)
+        loop, reference = timed(lambda: loop_round_trips(trades))
+        vectorized, table = timed(lambda: round_trips(trades))
+        same = len(table) == len(reference) and np.allclose(table['pnl'].sum(), reference['pnl'].sum())
+        print(f'{n:>8,} trades -> {len(table):,} round trips: loop {loop * 1e3:8.1f} ms, '
+              f'vectorized {vectorized * 1e3:6.1f} ms ({"same" if same else "DIFFERENT"} result)')
+
+    elapsed, _ = timed(lambda: Chart.backtest(df, trades=trades, engine='native', max_bars='auto', round_trips=True,
+                                              output='png', cache=False))
+    print(f"backtest(round_trips=True, engine='native', max_bars='auto'): {elapsed:.2f} s end to end")
@@ -0,0 +1,102 @@
+"""
+Memory soak test: renders the same chart many times and tracks Python heap usage with
+tracemalloc. A long-running service should see flat memory.
+
+Modes:
+    pyplot   `Chart.<method>(...)` + `fig.savefig(...)` without closing: the pre-existing
+             pattern, which leaves every figure in pyplot's registry.
+    nopyplot `Chart.<method>(..., pyplot=False)` + `fig.savefig(...)`; the figure is freed
+             once it goes out of scope.
+    output   `Chart.<method>(..., output='png')`.
+
+Usage:
+    python benchmarks/soak_memory.py --renders 10000 --mode nopyplot output
+    python benchmarks/soak_memory.py --renders 500 --method candle --mode pyplot nopyplot
+"""
+import argparse
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+
+def make_args(method):
+    rng = np.random.default_rng(0)
+    n = 60
+    index = pd.date_range('2024-01-01', periods=n, freq='B')
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    if method == 'candle':
+        ohlc = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                             'Volume': rng.integers(100_000, 1_000_000, n).astype(float)}, index=index)
+        return (ohlc,), {'title': 'FPT', 'figsize': (6, 4)}
+    return (pd.Series(close, index=index, name='FPT'),), {'title': 'FPT', 'figsize': (6, 4)}
+
+
+def soak(method, mode, renders, samples):
+    args, kwargs = make_args(method)
+    chart = getattr(Chart, method)
+    every = max(1, renders // samples)
+    plt.close('all')
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    points = []
+    started = time.perf_counter()
+    too_many = 0
+
+    def count_warning(*args, **kwargs):
+        nonlocal too_many
+        too_many += 1
+
+    # Count pyplot's figure-limit warnings without keeping every warning object alive
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        warnings.filterwarnings('always', message='More than 20 figures')
+        warnings.showwarning = count_warning
+        for i in range(1, renders + 1):
+            if mode == 'output':
+                chart(*args, output='png', output_dpi=72, **kwargs)
+            else:
+                fig = chart(*args, show=False, pyplot=(mode == 'pyplot'), **kwargs)[0]
+                fig.savefig(io.BytesIO(), format='png', dpi=72)
+                del fig
+            if i % every == 0:
+                gc.collect()
+                points.append((i, (tracemalloc.get_traced_memory()[0] - baseline) / 2**20))
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+    plt.close('all')
+    return points, elapsed, too_many
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--renders', type=int, default=10000)
+    parser.add_argument('--method', choices=['line', 'candle'], default='line')
+    parser.add_argument('--mode', nargs='+', choices=['pyplot', 'nopyplot', 'output'], default=['nopyplot', 'output'])
+    parser.add_argument('--samples', type=int, default=10)
+    args = parser.parse_args()
+
+    for mode in args.mode:
+        points, elapsed, too_many = soak(args.method, mode, args.renders, args.samples)
+        half = points[len(points) // 2][1]
+        growth = (points[-1][1] - half) / max(1, points[-1][0] - points[len(points) // 2][0]) * 1024
+        print(f"\n{mode}: {args.renders} x {args.method} in {elapsed:.0f} s, "
+              f"'more than 20 figures' warnings: {too_many}")
+        print('  renders   traced MiB')
+        for i, mib in points:
+            print(f'  {i:>7}   {mib:>10.2f}')
+        print(f'  growth over the second half: {growth:.2f} KiB/render')
@@ -0,0 +1,82 @@
+"""
+Multi-threaded rendering throughput, with a correctness check.
+
+Charts with different themes and languages are rendered with `output='png'` inside
+`Chart.theme_context`, first sequentially and then from a thread pool. Every threaded
+image must be byte-identical to its sequential counterpart; a mismatch means two
+threads leaked styling into each other.
+
+On a GIL build threads mostly overlap I/O and PNG encoding; free-threaded Python
+(3.13t+) can also run the Python-level chart building in parallel.
+
+Usage:
+    python benchmarks/threaded_render.py --threads 1 2 4 --charts 48
+"""
+import argparse
+import os
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+THEMES = [{'theme_name': 'vnstock', 'lang': 'vi'}, {'theme_name': 'minimal', 'lang': 'en'},
+          {'theme_name': 'flatui', 'lang': 'en'}, {'theme_name': 'academic', 'lang': 'vi', 'logo_path': None}]
+
+
+def make_jobs(count):
+    rng = np.random.default_rng(0)
+    n = 120
+    index = pd.date_range('2024-01-01', periods=n, freq='B')
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    ohlc = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': rng.integers(100_000, 1_000_000, n).astype(float)}, index=index)
+    frame = pd.DataFrame({'FPT': close, 'VNM': close * 0.8, 'HPG': close * 1.2}, index=index)
+    charts = [
+        ('line', (frame,), {'title': 'Close'}),
+        ('bar', (frame.tail(8),), {'title': 'Bars', 'tick_rotation': 45}),
+        ('candle', (ohlc,), {'title': 'FPT'}),
+        ('boxplot', (frame.pct_change().dropna(),), {}),
+        ('pie', (pd.Series([5, 3, 2], index=['A', 'B', 'C']), ['A', 'B', 'C']), {}),
+        ('equity_curve', (frame['FPT'] / 100,), {}),
+    ]
+    return [(THEMES[i % len(THEMES)],) + charts[i % len(charts)] for i in range(count)]
+
+
+def render(job):
+    theme, method, args, kwargs = job
+    with Chart.theme_context(**theme):
+        return getattr(Chart, method)(*args, output='png', **kwargs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--charts', type=int, default=48)
+    args = parser.parse_args()
+
+    gil = 'free-threaded' if sysconfig.get_config_var('Py_GIL_DISABLED') else 'GIL'
+    print(f'Python {sys.version.split()[0]} ({gil}), {os.cpu_count()} CPU(s), {args.charts} charts')
+
+    jobs = make_jobs(args.charts)
+    render(jobs[0])  # warm-up
+    t0 = time.perf_counter()
+    reference = [render(job) for job in jobs]
+    sequential = time.perf_counter() - t0
+    print(f"{'sequential':<12}{sequential:>8.2f} s {args.charts / sequential:>8.1f} charts/s")
+
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            t0 = time.perf_counter()
+            images = list(pool.map(render, jobs))
+            elapsed = time.perf_counter() - t0
+        mismatches = sum(a != b for a, b in zip(images, reference))
+        print(f"{f'{threads} threads':<12}{elapsed:>8.2f} s {args.charts / elapsed:>8.1f} charts/s   mismatches: {mismatches}")
@@ -0,0 +1,72 @@
+"""
+`Chart.resample_ticks` against the usual pandas `resample().ohlc()` on synthetic HOSE tick data,
+whole and streamed in chunks through `TickAggregator`.
+
+Usage:
+    python benchmarks/tick_resample.py --days 20 --ticks-per-day 80000 --interval 5m
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+
+
+def make_ticks(days, per_day):
+    rng = np.random.default_rng(0)
+    # One trading day of seconds: morning and afternoon continuous sessions plus ATO/ATC prints
+    morning = np.arange(9 * 3600 + 15 * 60, 11 * 3600 + 30 * 60)
+    afternoon = np.arange(13 * 3600, 14 * 3600 + 30 * 60)
+    seconds = np.concatenate((morning, afternoon))
+    stamps = []
+    for day in pd.bdate_range('2024-01-02', periods=days):
+        tod = np.sort(rng.choice(seconds, per_day))
+        tod = np.concatenate(([9 * 3600 + 15 * 60], tod, [14 * 3600 + 45 * 60]))
+        stamps.append(day.value + tod * 10**9)
+    times = pd.DatetimeIndex(np.concatenate(stamps))
+    n = len(times)
+    return pd.DataFrame({'time': times, 'price': 100 + np.cumsum(rng.normal(0, 0.05, n)),
+                         'volume': rng.integers(1, 100, n) * 100})
+
+
+def pandas_resample(ticks, interval):
+    grouped = ticks.set_index('time').resample(interval)
+    bars = grouped['price'].ohlc()
+    bars['volume'] = grouped['volume'].sum()
+    return bars.dropna()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=20)
+    parser.add_argument('--ticks-per-day', type=int, default=80_000)
+    parser.add_argument('--interval', default='5m')
+    parser.add_argument('--chunk', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    ticks = make_ticks(args.days, args.ticks_per_day)
+    chunks = [ticks.iloc[i:i + args.chunk] for i in range(0, len(ticks), args.chunk)]
+    rule = args.interval.replace('m', 'min') if args.interval.endswith('m') else args.interval
+
+    print(f'{len(ticks):,} ticks, interval {args.interval}, median of {args.repeat}')
+    print(f"  pandas resample().ohlc():   {timed(lambda: pandas_resample(ticks, rule), args.repeat) * 1e3:8.1f} ms"
+          '  (calendar bins: spans the lunch break, no auction handling)')
+    print(f"  resample_ticks (whole):     {timed(lambda: Chart.resample_ticks(ticks, args.interval), args.repeat) * 1e3:8.1f} ms")
+    print(f"  resample_ticks ({len(chunks)} chunks): {timed(lambda: Chart.resample_ticks(iter(chunks), args.interval), args.repeat) * 1e3:8.1f} ms")
@@ -0,0 +1,83 @@
+"""
+Trade-marker placement of `Chart.backtest`: the former per-row loop (`iterrows` + `.loc`) against
+the vectorized `core.trades.trade_markers`, plus a full `backtest(engine='native')` render.
+
+Usage:
+    python benchmarks/trade_markers.py --bars 200000 --trades 100000
+    python benchmarks/trade_markers.py --trades 100000 --skip-legacy
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.trades import trade_markers
+
+from candle_engine import make_ohlc
+
+
+def make_trades(index, n, off_bar=0.1):
+    """`n` trades on random bars; a share `off_bar` of them is stamped between two bars."""
+    rng = np.random.default_rng(1)
+    times = index[rng.integers(0, len(index), n)]
+    shift = np.where(rng.random(n) < off_bar, rng.integers(1, 59, n), 0)
+    return pd.DataFrame({'time': times + pd.to_timedelta(shift, unit='s'),
+                         'type': rng.choice(['MUA', 'BAN'], n), 'price': 100 + rng.normal(0, 5, n)})
+
+
+def legacy_markers(trades, index):
+    """The loop `backtest` used before."""
+    buy_markers = pd.Series(index=index, dtype=float)
+    sell_markers = pd.Series(index=index, dtype=float)
+    tr_df = trades.copy()
+    tr_df['time'] = pd.to_datetime(tr_df['time'])
+    for _, row in tr_df.iterrows():
+        t_date = row['time']
+        t_type = str(row['type']).upper()
+        t_price = float(row['price'])
+        if pd.notna(t_date) and t_date in index:
+            if t_type in ['MUA', 'BUY', 'LONG', '1', '1.0']:
+                buy_markers.loc[t_date] = t_price * 0.98
+            elif t_type in ['BAN', 'SELL', 'SHORT', '-1', '-1.0']:
+                sell_markers.loc[t_date] = t_price * 1.02
+    return buy_markers, sell_markers
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bars', type=int, default=200_000)
+    parser.add_argument('--trades', type=int, default=100_000)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    df = make_ohlc(args.bars)
+    trades = make_trades(df.index, args.trades)
+    print(f'{args.trades:,} trades on {args.bars:,} bars')
+
+    if not args.skip_legacy:
+        elapsed, _ = timed(lambda: legacy_markers(trades, df.index))
+        print(f'  legacy loop:                {elapsed * 1e3:10.1f} ms')
+    for snap in ('exact', 'nearest', 'backward'):
+        elapsed, (_, _, dropped) = timed(lambda: trade_markers(trades, df.index, snap=snap))
+        print(f"  trade_markers({snap + ')':<10}     {elapsed * 1e3:10.1f} ms   ({dropped:,} dropped)")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        elapsed, _ = timed(lambda: Chart.backtest(df, trades=trades, engine='native', max_bars='auto',
+                                                  snap_trades='nearest', output='png', cache=False))
+    print(f"  backtest(engine='native', max_bars='auto'): {elapsed:.2f} s end to end")
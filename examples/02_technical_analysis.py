@@ -48,25 +48,18 @@ close_p = open_p + np.random.randn(100)
 volume_p = np.random.randint(500000, 5000000, 100)
 
 data_cs = pd.DataFrame({'Open': open_p, 'High': high_p, 'Low': low_p, 'Close': close_p, 'Volume': volume_p}, index=dates_cs)
-sma_20 = data_cs['Close'].rolling(20).mean()
-sma_50 = data_cs['Close'].rolling(50).mean()
-
-delta = data_cs['Close'].diff()
-gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-rs = gain / loss
-rsi = 100 - (100 / (1 + rs))
 
+# SMA and RSI are computed by the chart itself and laid out into panels
 title_6 = 'Technical Analysis: Candlestick, SMA20/50 & RSI' if args.lang == 'en' else 'Phân tích Kỹ thuật: Nến Nhật, SMA20/50 & RSI'
 fig, axes = Chart.candle(
     data_cs, 
     title=title_6, 
     volume=True,
-    overlays=[
-        {'data': sma_20, 'color': c2, 'width': 1.5},
-        {'data': sma_50, 'color': c3, 'width': 1.5}
+    indicators=[
+        {'name': 'sma20', 'color': c2},
+        {'name': 'sma50', 'color': c3},
+        {'name': 'rsi14', 'color': c4}
     ],
-    subplots=[{'data': rsi, 'color': c4, 'ylabel': 'RSI (14)'}],
     figsize=(14, 8),
     show=False
 )
@@ -48,9 +48,6 @@ data = pd.DataFrame({
     'Volume': volumes
 }, index=dates)
 
-ma20 = data['Close'].rolling(window=20).mean()
-ma50 = data['Close'].rolling(window=50).mean()
-
 trades = [
     {'time': dates[10].strftime('%Y-%m-%d'), 'type': 'MUA', 'price': close_prices[10]},
     {'time': dates[30].strftime('%Y-%m-%d'), 'type': 'BAN', 'price': close_prices[30]},
@@ -75,9 +72,9 @@ portfolio = pd.DataFrame({
 # 2. Draw Backtest Chart
 chart = Chart()
 
-overlays = [
-    {'data': ma20, 'color': c1, 'width': 1.5, 'alpha': 0.8},
-    {'data': ma50, 'color': c2, 'width': 1.5, 'alpha': 0.8}
+indicators = [
+    {'name': 'sma20', 'color': c1, 'width': 1.5, 'alpha': 0.8},
+    {'name': 'sma50', 'color': c2, 'width': 1.5, 'alpha': 0.8}
 ]
 
 print(f"Generating backtest chart ({args.lang})...")
@@ -87,7 +84,7 @@ fig, axes = chart.backtest(
     data=data,
     trades=trades_df,
     portfolio=portfolio,
-    overlays=overlays,
+    indicators=indicators,
     title=title,
     figsize=(14, 12),
     volume=True,
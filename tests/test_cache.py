@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.cache import cached, configure_derived_cache, fingerprint
+
+
+@pytest.fixture
+def derived_cache():
+    yield configure_derived_cache()
+    configure_derived_cache()
+
+
+def test_equal_data_shares_an_entry_and_edits_miss(derived_cache):
+    calls = []
+
+    def compute(values):
+        calls.append(1)
+        return values * 2
+
+    close = np.arange(1000, dtype=float)
+    index = pd.date_range('2024-01-01', periods=1000, tz='Asia/Ho_Chi_Minh')
+    cached('double', fingerprint(close, index), (), lambda: compute(close))
+    cached('double', fingerprint(close.copy(), index.copy()), (), lambda: compute(close))
+    assert len(calls) == 1
+
+    close[500] += 1
+    result = cached('double', fingerprint(close, index), (), lambda: compute(close))
+    assert len(calls) == 2 and result[500] == 2 * close[500]
+    assert not result.flags.writeable
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.context import close_figure
+from vnstock_ezchart.core.decimate import auto_columns, m4_indices
+
+
+def _price(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-02', periods=n, freq='min')
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 3e-4, n))), index=index, name='Close')
+
+
+@pytest.mark.parametrize('chart', ['line', 'equity_curve'])
+def test_default_render_is_the_full_render(chart):
+    # M4 keeps every column's extremes but antialiased edges can differ, so only `decimate=` opts in
+    price = _price()
+    data = price if chart == 'line' else price / price.iloc[0]
+    draw = getattr(Chart, chart)
+    default = draw(data, output='rgba', cache=False)
+    full = draw(data, decimate=None, output='rgba', cache=False)
+    assert default.shape == full.shape
+    assert (default == full).all()
+
+
+@pytest.mark.parametrize('columns', [1, 7, 500])
+def test_m4_keeps_the_first_last_and_extremes_of_each_column(columns):
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(0, 100, 10_000))
+    values = np.cumsum(rng.normal(0, 1, (10_000, 2)), axis=0)
+    values[rng.choice(10_000, 50, replace=False), 1] = np.nan
+    keep = m4_indices(x, values, columns)
+    pixel = np.clip(np.floor((x - x[0]) / (x[-1] - x[0]) * columns), -1, columns)
+    for line in range(2):
+        kept = set(keep[:, line])
+        assert (np.diff(keep[:, line]) >= 0).all()
+        for column in np.unique(pixel):
+            rows = np.flatnonzero(pixel == column)
+            column_values = values[rows, line]
+            assert {rows[0], rows[-1]} <= kept
+            assert np.nanmin(column_values) in values[list(kept & set(rows)), line]
+            assert np.nanmax(column_values) in values[list(kept & set(rows)), line]
+
+
+def test_auto_columns_follow_the_render_resolution():
+    import matplotlib
+
+    fig = Chart.line(_price(100), show=False, pyplot=False)[0]
+    try:
+        ax = fig.axes[0]
+        pixels = ax.get_window_extent().width
+        assert auto_columns(ax) == int(np.ceil(pixels))
+        # Outside an `output=` call the chart is drawn at the figure dpi of the rcParams
+        with matplotlib.rc_context({'figure.dpi': 2 * fig.dpi}):
+            assert auto_columns(ax) == int(np.ceil(2 * pixels))
+    finally:
+        close_figure(fig)
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.indicators import bbands, ema, macd, parse_indicator, rsi, sma
+
+
+def _closes(n=500, gaps=False, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))))
+    if gaps:
+        closes[rng.choice(np.arange(30, n), 25, replace=False)] = np.nan
+        closes[:5] = np.nan
+    return closes
+
+
+def _seeded_ewm(closes: pd.Series, period: int, alpha: float) -> pd.Series:
+    """pandas' recursive `ewm`, started from the simple average of the first `period` valid values."""
+    closes = closes.ffill()
+    first = closes.first_valid_index()
+    tail = closes.loc[first:].iloc[period - 1:].copy()
+    tail.iloc[0] = closes.loc[first:].iloc[:period].mean()
+    return tail.ewm(alpha=alpha, adjust=False).mean().reindex(closes.index)
+
+
+@pytest.mark.parametrize('gaps', [False, True])
+@pytest.mark.parametrize('period', [1, 5, 20, 200])
+def test_sma_matches_pandas_rolling(period, gaps):
+    closes = _closes(gaps=gaps)
+    np.testing.assert_allclose(sma(closes.to_numpy(), period), closes.rolling(period).mean(), rtol=1e-10)
+
+
+@pytest.mark.parametrize('gaps', [False, True])
+@pytest.mark.parametrize('period', [2, 12, 50])
+def test_ema_matches_pandas_ewm(period, gaps):
+    closes = _closes(gaps=gaps)
+    np.testing.assert_allclose(ema(closes.to_numpy(), period), _seeded_ewm(closes, period, 2 / (period + 1)), rtol=1e-10)
+
+
+@pytest.mark.parametrize('period', [2, 14, 30])
+def test_rsi_matches_wilder_smoothing(period):
+    closes = _closes()
+    delta = closes.diff()
+    gains = _seeded_ewm(delta.clip(lower=0), period, 1 / period)
+    losses = _seeded_ewm(-delta.clip(upper=0), period, 1 / period)
+    np.testing.assert_allclose(rsi(closes.to_numpy(), period), 100 * gains / (gains + losses), rtol=1e-10)
+
+
+def test_macd_matches_pandas_ewm():
+    closes = _closes()
+    line, signal, hist = macd(closes.to_numpy(), 12, 26, 9)
+    expected = _seeded_ewm(closes, 12, 2 / 13) - _seeded_ewm(closes, 26, 2 / 27)
+    np.testing.assert_allclose(line, expected, rtol=1e-10)
+    np.testing.assert_allclose(signal, _seeded_ewm(expected, 9, 2 / 10), rtol=1e-10)
+    np.testing.assert_allclose(hist, line - signal, rtol=1e-10)
+
+
+def test_bbands_match_pandas_rolling():
+    closes = _closes()
+    upper, middle, lower = bbands(closes.to_numpy(), 20, 2.5)
+    std = closes.rolling(20).std(ddof=0)
+    np.testing.assert_allclose(middle, closes.rolling(20).mean(), rtol=1e-10)
+    np.testing.assert_allclose(upper, middle + 2.5 * std, rtol=1e-8)
+    np.testing.assert_allclose(lower, middle - 2.5 * std, rtol=1e-8)
+
+
+def test_long_series_stay_precise():
+    # The block-wise recursion must not drift on long inputs
+    closes = _closes(n=200_000, seed=1)
+    np.testing.assert_allclose(ema(closes.to_numpy(), 10)[-1000:], _seeded_ewm(closes, 10, 2 / 11).iloc[-1000:], rtol=1e-9)
+
+
+@pytest.mark.parametrize('spec, expected', [('sma20', ('sma', (20,))), ('macd', ('macd', (12, 26, 9))),
+                                            ('bbands20_2.5', ('bbands', (20, 2.5))), ('EMA 50', ('ema', (50,)))])
+def test_parse_indicator(spec, expected):
+    assert parse_indicator(spec) == expected
+
+
+@pytest.mark.parametrize('spec', ['sma20.5', 'sma0', 'macd12_26.0_9', 'rsi14_2', 'vwap20'])
+def test_parse_indicator_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_indicator(spec)
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart import Chart
+from vnstock_ezchart.core.context import close_figure
+
+
+def _bars(n=120):
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1000.0},
+                        index=pd.date_range('2024-06-03 09:15', periods=n, freq='min'))
+
+
+def test_array_overlays_are_aligned_to_the_last_bars():
+    data = _bars()
+    overlay = np.arange(len(data), dtype=float)
+    live = Chart.live_candle(data, capacity=50, headroom=10, overlays=[overlay, list(overlay[-40:])])
+    try:
+        # One column per overlay after the OHLCV columns of the ring buffer
+        values = live.bars.values()[:, 5:]
+        np.testing.assert_array_equal(values, np.column_stack([overlay[-40:], overlay[-40:]]))
+    finally:
+        close_figure(live.figure)
+
+
+def test_short_overlays_are_rejected():
+    with pytest.raises(ValueError, match='Overlay 1 has 30 values'):
+        Chart.live_candle(_bars(), capacity=50, headroom=10, overlays=[np.zeros(120), np.zeros(30)])
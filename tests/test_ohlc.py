@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.ohlc import AUTO_MIN_BARS, MIN_BAR_PIXELS, aggregate_ohlcv, bucket_starts
+
+
+def _bars(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    open_ = close + rng.normal(0, 0.5, n)
+    return pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + 1, 'Low': np.minimum(open_, close) - 1,
+                         'Close': close, 'Volume': rng.integers(100, 1000, n).astype(float)},
+                        index=pd.date_range('2020-01-01', periods=n, freq='D'))
+
+
+@pytest.mark.parametrize('max_bars', [1, 7, 100, 999])
+def test_aggregate_ohlcv_matches_pandas_groupby(max_bars):
+    data = _bars()
+    starts = bucket_starts(len(data), max_bars)
+    assert len(starts) <= max_bars
+    buckets = data.groupby(np.searchsorted(starts, np.arange(len(data)), side='right') - 1)
+    expected = buckets.agg({'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'})
+    expected.index = data.index[starts]
+    pd.testing.assert_frame_equal(aggregate_ohlcv(data, starts), expected, check_freq=False)
+
+
+def test_auto_keeps_short_frames_and_fits_long_ones_to_the_panel():
+    calls = []
+
+    def panel_pixels():
+        calls.append(1)
+        return 900.0
+
+    assert bucket_starts(AUTO_MIN_BARS, 'auto', panel_pixels) is None
+    assert not calls
+    starts = bucket_starts(10 * AUTO_MIN_BARS, 'auto', panel_pixels)
+    assert len(starts) <= 900 / MIN_BAR_PIXELS and calls == [1]
+
+
+@pytest.mark.parametrize('max_bars', [0, -3, 2.5, 'fit'])
+def test_bad_max_bars_are_rejected(max_bars):
+    with pytest.raises(ValueError):
+        bucket_starts(10, max_bars)
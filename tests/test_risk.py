@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.risk import rolling_risk
+
+WINDOWS = (2, 5, 21, 63)
+
+
+def _returns(n=400, columns=3, gaps=False, seed=0):
+    rng = np.random.default_rng(seed)
+    returns = pd.DataFrame(rng.normal(0.0005, 0.02, (n, columns)))
+    benchmark = pd.Series(0.6 * returns[0] + rng.normal(0, 0.01, n))
+    if gaps:
+        returns.iloc[rng.choice(n, 10, replace=False), 1] = np.nan
+        benchmark.iloc[rng.choice(n, 5, replace=False)] = np.nan
+    return returns, benchmark
+
+
+def _max_drawdown(window_returns: np.ndarray) -> float:
+    """Largest drop from a peak of the equity of one window, the start of the window included."""
+    equity = np.concatenate([[1.0], np.cumprod(1 + window_returns)])
+    return (equity / np.maximum.accumulate(equity) - 1).min()
+
+
+@pytest.mark.parametrize('gaps', [False, True])
+def test_rolling_risk_matches_pandas_rolling(gaps):
+    returns, benchmark = _returns(gaps=gaps)
+    result = rolling_risk(returns.to_numpy(), WINDOWS, benchmark=benchmark.to_numpy(), periods_per_year=252)
+    scale = np.sqrt(252)
+    for window in WINDOWS:
+        rolling = returns.rolling(window)
+        std = rolling.std()
+        np.testing.assert_allclose(result[('volatility', window)], std * scale, rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(result[('sharpe', window)], rolling.mean() / std * scale, rtol=1e-6)
+        beta = pd.DataFrame({c: returns[c].rolling(window).cov(benchmark) / benchmark.rolling(window).var()
+                             for c in returns.columns})
+        np.testing.assert_allclose(result[('beta', window)], beta, rtol=1e-6)
+        drawdown = rolling.apply(_max_drawdown, raw=True)
+        np.testing.assert_allclose(result[('max_drawdown', window)], drawdown, rtol=1e-9, atol=1e-12)
+
+
+def test_risk_free_rate_lowers_the_sharpe_ratio():
+    returns, _ = _returns(columns=1)
+    result = rolling_risk(returns[0].to_numpy(), (21,), periods_per_year=252, risk_free=0.05)
+    rolling = returns[0].rolling(21)
+    expected = (rolling.mean() - 0.05 / 252) / rolling.std() * np.sqrt(252)
+    np.testing.assert_allclose(result[('sharpe', 21)], expected, rtol=1e-6)
+
+
+def test_windows_longer_than_the_data_are_all_nan():
+    returns, _ = _returns(n=10, columns=1)
+    result = rolling_risk(returns.to_numpy(), (21,))
+    assert np.isnan(result[('max_drawdown', 21)]).all()
+    assert np.isnan(result[('volatility', 21)]).all()
+
+
+def test_short_windows_are_rejected():
+    with pytest.raises(ValueError):
+        rolling_risk(np.zeros(10), (1,))
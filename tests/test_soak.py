@@ -0,0 +1,48 @@
+"""
+Memory soak test: a long-running service that renders the same chart over and over must see flat
+memory. Runs 10,000 renders by default (`VNSTOCK_EZCHART_SOAK_RENDERS` overrides the count).
+"""
+import gc
+import io
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart import Chart
+
+RENDERS = int(os.environ.get('VNSTOCK_EZCHART_SOAK_RENDERS', 10_000))
+WARM_UP = 50
+# Traced memory that may still be alive after the measured renders (caches filled on first use,
+# interned strings...): a leak of one figure per render would exceed it within a few hundred renders.
+MAX_GROWTH = 2 << 20
+
+
+def _render_output(series):
+    Chart.line(series, title='FPT', figsize=(3, 2), output='rgba', output_dpi=50, cache=False)
+
+
+def _render_figure(series):
+    fig = Chart.line(series, title='FPT', figsize=(3, 2), show=False, pyplot=False)[0]
+    fig.savefig(io.BytesIO(), format='png', dpi=50)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('render', [_render_output, _render_figure], ids=['output', 'pyplot_false'])
+def test_memory_stays_flat(render):
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 60))
+    series = pd.Series(close, index=pd.date_range('2024-01-01', periods=60, freq='B'), name='FPT')
+    for _ in range(WARM_UP):
+        render(series)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(RENDERS):
+            render(series)
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert growth < MAX_GROWTH, f'{growth / 2**20:.1f} MiB still allocated after {RENDERS} renders'
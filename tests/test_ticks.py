@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.ticks import TickAggregator, resample_ticks
+
+
+def _ticks(days=3, n=20_000, seed=0):
+    """Random trades inside HOSE's continuous sessions (09:15-11:30 and 13:00-14:30)."""
+    rng = np.random.default_rng(seed)
+    session = np.r_[np.arange(9 * 3600 + 15 * 60, 11 * 3600 + 30 * 60), np.arange(13 * 3600, 14 * 3600 + 30 * 60)]
+    day = pd.bdate_range('2024-06-03', periods=days)[rng.integers(0, days, n)]
+    seconds = rng.choice(session, n) + rng.random(n)
+    times = np.sort(day.to_numpy() + pd.to_timedelta(seconds, unit='s').to_numpy())
+    return pd.DataFrame({'time': times, 'price': np.round(100 + np.cumsum(rng.normal(0, 0.05, n)), 2),
+                         'volume': rng.integers(1, 50, n).astype(float) * 100})
+
+
+def _pandas_bars(ticks, rule):
+    indexed = ticks.set_index('time')
+    bars = indexed['price'].resample(rule).ohlc()
+    bars['volume'] = indexed['volume'].resample(rule).sum()
+    return bars.dropna()
+
+
+@pytest.mark.parametrize('interval, rule', [('1m', '1min'), ('5m', '5min'), ('15m', '15min'), ('30s', '30s')])
+def test_bars_match_pandas_resample(interval, rule):
+    ticks = _ticks()
+    bars = resample_ticks(ticks, interval, exchange='HOSE', auctions='drop')
+    expected = _pandas_bars(ticks, rule)
+    assert bars.index.equals(pd.DatetimeIndex(expected.index, name='time'))
+    np.testing.assert_allclose(bars.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize('chunk', [1, 7, 1000])
+def test_chunked_updates_match_one_update(chunk):
+    ticks = _ticks(days=1, n=3000, seed=1)
+    whole = resample_ticks(ticks, '5m')
+    chunks = (ticks.iloc[i:i + chunk] for i in range(0, len(ticks), chunk))
+    pd.testing.assert_frame_equal(resample_ticks(chunks, '5m'), whole)
+
+
+def test_update_returns_only_completed_bars():
+    ticks = _ticks(days=1, n=3000, seed=2)
+    aggregator = TickAggregator('5m')
+    completed = [aggregator.update(ticks.iloc[i:i + 500]) for i in range(0, len(ticks), 500)]
+    last = aggregator.flush()
+    pd.testing.assert_frame_equal(pd.concat(completed + [last]), aggregator.bars())
+    assert aggregator.ticks == len(ticks) and aggregator.dropped == 0
+
+
+def test_ticks_outside_the_sessions_are_dropped():
+    ticks = pd.DataFrame({'time': pd.to_datetime(['2024-06-03 08:59:00', '2024-06-03 09:20:00', '2024-06-03 12:00:00',
+                                                  '2024-06-03 15:30:00']),
+                          'price': [1.0, 2.0, 3.0, 4.0], 'volume': [1.0, 1.0, 1.0, 1.0]})
+    aggregator = TickAggregator('1m')
+    aggregator.update(ticks)
+    bars = aggregator.bars()
+    assert list(bars['Close']) == [2.0]
+    assert aggregator.dropped == 3
@@ -0,0 +1,122 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnstock_ezchart.core.trades import SNAP_MODES, bar_positions, round_trips, trade_markers
+
+
+def _bars():
+    # Business days with a few holidays, so the bar spacing is irregular
+    index = pd.bdate_range('2024-01-01', periods=60)
+    return index.delete([7, 8, 30])
+
+
+def _trades(index, n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    on_bar = index[rng.integers(0, len(index), n // 2)]
+    between = index[0] + pd.to_timedelta(rng.integers(-5 * 86_400, 95 * 86_400, n - n // 2), unit='s')
+    times = on_bar.append(between)
+    return pd.DataFrame({'time': times, 'type': rng.choice(['BUY', 'SELL', 'HOLD'], n),
+                         'price': rng.uniform(90, 110, n).round(2)})
+
+
+def _reference_position(stamp, index, snap):
+    """Bar of one timestamp, found by scanning the bars."""
+    stamps = list(index)
+    if snap == 'exact':
+        return stamps.index(stamp) if stamp in stamps else -1
+    spacing = np.median(np.diff(index.asi8))
+    if stamp.value < index.asi8[0] - spacing or stamp.value > index.asi8[-1] + spacing:
+        return -1
+    before = [i for i, bar in enumerate(stamps) if bar <= stamp]
+    after = [i for i, bar in enumerate(stamps) if bar >= stamp]
+    if snap == 'backward':
+        return before[-1] if before else -1
+    if snap == 'forward':
+        return after[0] if after else -1
+    return min(before[-1:] + after[:1], key=lambda i: abs(stamps[i] - stamp))
+
+
+@pytest.mark.parametrize('snap', SNAP_MODES)
+def test_bar_positions_match_a_scan(snap):
+    index = _bars()
+    times = pd.DatetimeIndex(_trades(index)['time'])
+    expected = [_reference_position(stamp, index, snap) for stamp in times]
+    np.testing.assert_array_equal(bar_positions(times, index, snap), expected)
+
+
+@pytest.mark.parametrize('snap', SNAP_MODES)
+def test_trade_markers_match_a_loop(snap):
+    index, offset = _bars(), 0.02
+    trades = _trades(index, seed=1)
+    buys, sells = np.full(len(index), np.nan), np.full(len(index), np.nan)
+    dropped = 0
+    for stamp, kind, price in trades.itertuples(index=False):
+        if kind == 'HOLD':
+            continue
+        position = _reference_position(stamp, index, snap)
+        if position < 0:
+            dropped += 1
+        elif kind == 'BUY':
+            buys[position] = np.fmin(buys[position], price * (1 - offset))
+        else:
+            sells[position] = np.fmax(sells[position], price * (1 + offset))
+
+    result = trade_markers(trades, index, snap=snap, offset=offset)
+    np.testing.assert_allclose(result[0], buys)
+    np.testing.assert_allclose(result[1], sells)
+    assert result[2] == dropped
+
+
+def test_unknown_snap_mode_raises_without_trades():
+    with pytest.raises(ValueError, match='snap mode'):
+        trade_markers(None, _bars(), snap='closest')
+
+
+def _fifo_round_trips(trades):
+    """Round trips matched one lot at a time from a deque of open lots."""
+    lots, pairs = deque(), []
+    for stamp, kind, price, quantity in trades.sort_values('time', kind='stable').itertuples(index=False):
+        side = 1 if kind == 'BUY' else -1
+        while quantity > 0 and lots and lots[0][0] == -side:
+            lot = lots[0]
+            size = min(lot[1], quantity)
+            pairs.append((lot[2], stamp, lot[0], size, lot[3], price))
+            lot[1] -= size
+            quantity -= size
+            if lot[1] == 0:
+                lots.popleft()
+        if quantity > 0:
+            lots.append([side, quantity, stamp, price])
+    return pd.DataFrame(pairs, columns=['entry_time', 'exit_time', 'direction', 'quantity', 'entry_price', 'exit_price'])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_round_trips_match_a_deque_fifo(seed):
+    rng = np.random.default_rng(seed)
+    n = 300
+    trades = pd.DataFrame({'time': pd.Timestamp('2024-01-01') + pd.to_timedelta(np.sort(rng.choice(10**6, n, replace=False)), unit='min'),
+                           'type': rng.choice(['BUY', 'SELL'], n), 'price': rng.uniform(90, 110, n).round(2),
+                           'quantity': rng.integers(1, 20, n).astype(float)})
+    expected = _fifo_round_trips(trades)
+    result = round_trips(trades)
+
+    assert len(result) == len(expected)
+    for column in ('entry_time', 'exit_time'):
+        assert (result[column].to_numpy() == expected[column].to_numpy()).all()
+    np.testing.assert_array_equal(result['direction'], expected['direction'])
+    np.testing.assert_allclose(result[['quantity', 'entry_price', 'exit_price']], expected[['quantity', 'entry_price', 'exit_price']])
+    np.testing.assert_allclose(result['pnl'], expected['direction'] * (expected['exit_price'] - expected['entry_price']) * expected['quantity'])
+    assert (result['holding'] == result['exit_time'] - result['entry_time']).all()
+
+
+def test_backtest_round_trips_refuse_output():
+    from vnstock_ezchart import Chart
+
+    index = _bars()
+    data = pd.DataFrame({'Open': 100.0, 'High': 101.0, 'Low': 99.0, 'Close': 100.0, 'Volume': 1000.0}, index=index)
+    trades = pd.DataFrame({'time': index[[2, 10]], 'type': ['BUY', 'SELL'], 'price': [100.0, 101.0]})
+    with pytest.raises(ValueError, match='output='):
+        Chart.backtest(data, trades=trades, round_trips=True, output='png')
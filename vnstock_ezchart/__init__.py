@@ -1,2 +1,11 @@
 from .utils import *
-from .static.chart import Chart, MPlot
\ No newline at end of file
+from .static.chart import Chart, MPlot
+
+
+def __getattr__(name):
+    # Heavy dependencies (seaborn, mplfinance, ...) used to be re-exported eagerly
+    # through `from .utils import *`; resolve them lazily for backward compatibility.
+    from . import config
+    if name in config._LAZY_IMPORTS:
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
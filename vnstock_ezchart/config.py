@@ -2,12 +2,45 @@ import matplotlib.pyplot as plt
 from matplotlib import font_manager
 import matplotlib.ticker as mticker
 from cycler import cycler
-import seaborn as sns
-import squarify # plot treemap
-from wordcloud import WordCloud # plot wordcloud
 import pandas as pd
+import importlib
 import random
 import os
 import shutil
-import requests
-import mplfinance as mpf
\ No newline at end of file
+
+# Heavy or optional dependencies are only imported on first use so that
+# `import vnstock_ezchart` stays cheap. Each entry maps the public alias used
+# throughout the package to (module, attribute, pip extra).
+_LAZY_IMPORTS = {
+    'sns': ('seaborn', None, None),
+    'mpf': ('mplfinance', None, None),
+    'requests': ('requests', None, None),
+    'squarify': ('squarify', None, 'all'),  # plot treemap
+    'WordCloud': ('wordcloud', 'WordCloud', 'all'),  # plot wordcloud
+}
+
+
+def import_optional(module_name: str, attr: str = None, extra: str = None):
+    """
+    Imports a dependency on demand and raises a helpful error if it is missing.
+
+    Args:
+        module_name (str): The module to import (e.g. 'seaborn').
+        attr (str): Optional attribute to return from the module instead of the module itself.
+        extra (str): The pip extra that provides the module, used in the error message.
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        target = f"vnstock_ezchart[{extra}]" if extra else module_name
+        raise ImportError(f"'{module_name}' is required for this chart. Install it with `pip install {target}`.") from e
+    return getattr(module, attr) if attr else module
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module_name, attr, extra = _LAZY_IMPORTS[name]
+        value = import_optional(module_name, attr, extra)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,323 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import LRUCache
+
+# Remote assets (URL logos, Google Fonts archives) are persisted here so that
+# restarted processes and containers read local files instead of downloading again.
+_CACHE_SETTINGS = {
+    'cache_dir': None,  # None -> $VNSTOCK_EZCHART_CACHE_DIR, then $XDG_CACHE_HOME/vnstock_ezchart
+    'offline': None,    # None -> $VNSTOCK_EZCHART_OFFLINE
+    'max_age': 86400,   # Seconds before a cached remote asset is revalidated with the server
+}
+_REGISTERED_FONTS = set()
+_FONT_LOCK = threading.Lock()
+
+# Logos are downscaled for this output resolution (or the figure dpi if higher),
+# which keeps the watermark crisp for `savefig(dpi=300)` without compositing the
+# full-size image on every chart.
+LOGO_TARGET_DPI = 300
+
+# Decoded logos keyed by (path or URL, mtime, target pixel size). Each entry is a
+# small uint8 RGBA array, so a handful of sizes per logo costs a few hundred KB.
+_LOGO_CACHE = LRUCache(maxsize=32)
+
+
+def _is_url(path) -> bool:
+    return isinstance(path, str) and path.startswith('http')
+
+
+def _logo_source_key(logo_path: str) -> Tuple[str, Optional[int]]:
+    if _is_url(logo_path):
+        return (logo_path, None)
+    return (os.path.abspath(logo_path), os.stat(logo_path).st_mtime_ns)
+
+
+def configure_asset_cache(cache_dir: Optional[str] = None, offline: Optional[bool] = None, max_age: Optional[float] = None) -> None:
+    """
+    Configures the persistent on-disk cache for remote assets.
+
+    Args:
+        cache_dir (str): Directory for cached assets. Defaults to `$VNSTOCK_EZCHART_CACHE_DIR`,
+                         then `$XDG_CACHE_HOME/vnstock_ezchart` (usually `~/.cache/vnstock_ezchart`).
+        offline (bool): If True, never touch the network and only serve assets that are already cached.
+        max_age (float): Seconds before a cached asset is revalidated with a conditional request.
+    """
+    if cache_dir is not None:
+        _CACHE_SETTINGS['cache_dir'] = os.path.abspath(os.path.expanduser(cache_dir))
+    if offline is not None:
+        _CACHE_SETTINGS['offline'] = bool(offline)
+    if max_age is not None:
+        _CACHE_SETTINGS['max_age'] = max_age
+
+
+def cache_dir() -> str:
+    """Returns the directory used for persistent asset caching."""
+    if _CACHE_SETTINGS['cache_dir']:
+        return _CACHE_SETTINGS['cache_dir']
+    if os.environ.get('VNSTOCK_EZCHART_CACHE_DIR'):
+        return os.path.abspath(os.path.expanduser(os.environ['VNSTOCK_EZCHART_CACHE_DIR']))
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'vnstock_ezchart')
+
+
+def is_offline() -> bool:
+    if _CACHE_SETTINGS['offline'] is not None:
+        return _CACHE_SETTINGS['offline']
+    return os.environ.get('VNSTOCK_EZCHART_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _remote_paths(url: str) -> Tuple[str, str]:
+    root = os.path.join(cache_dir(), 'remote')
+    return os.path.join(root, 'index', hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json'), os.path.join(root, 'blobs')
+
+
+def _read_cached_blob(meta: dict, blob_dir: str) -> Optional[bytes]:
+    blob_path = os.path.join(blob_dir, meta.get('sha256', ''))
+    try:
+        with open(blob_path, 'rb') as f:
+            payload = f.read()
+    except OSError:
+        return None
+    # Content addressing doubles as an integrity check for truncated or corrupted files
+    return payload if hashlib.sha256(payload).hexdigest() == meta['sha256'] else None
+
+
+def fetch_remote(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> Tuple[bytes, str]:
+    """
+    Returns the content of a remote asset, served from the on-disk cache when possible.
+
+    Cached entries younger than `max_age` are returned without any network access. Older
+    entries are revalidated with `If-None-Match`/`If-Modified-Since`, and a stale copy is
+    served (and trusted for another `max_age`) if the server cannot be reached. In offline
+    mode the network is never used.
+
+    Args:
+        url (str): The asset URL.
+        headers (dict): Extra request headers.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        Tuple[bytes, str]: The asset content and its SHA-256 hex digest.
+    """
+    meta_path, blob_dir = _remote_paths(url)
+    meta, payload = None, None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        payload = _read_cached_blob(meta, blob_dir)
+    except (OSError, ValueError, KeyError):
+        meta = None
+
+    if payload is not None and (is_offline() or time.time() - meta.get('fetched_at', 0) < _CACHE_SETTINGS['max_age']):
+        return payload, meta['sha256']
+    if is_offline():
+        raise IOError(f"Offline mode is enabled and {url} is not in the asset cache ({cache_dir()}).")
+
+    import requests
+
+    request_headers = {'User-Agent': 'Mozilla/5.0', **(headers or {})}
+    if payload is not None:
+        if meta.get('etag'):
+            request_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            request_headers['If-Modified-Since'] = meta['last_modified']
+    def serve_cached():
+        # Restart the max_age clock, so an unreachable server is not waited on by every call
+        meta['fetched_at'] = time.time()
+        _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+        return payload, meta['sha256']
+
+    try:
+        response = requests.get(url, headers=request_headers, timeout=timeout, allow_redirects=True)
+    except requests.RequestException:
+        if payload is not None:
+            return serve_cached()
+        raise
+
+    if response.status_code == 304 and payload is not None:
+        return serve_cached()
+    if response.status_code != 200:
+        if payload is not None:
+            return serve_cached()
+        raise IOError(f"Could not download {url}. Status code: {response.status_code}")
+
+    payload = response.content
+    digest = hashlib.sha256(payload).hexdigest()
+    blob_path = os.path.join(blob_dir, digest)
+    if not os.path.exists(blob_path):
+        _atomic_write(blob_path, payload)
+    meta = {'url': url, 'sha256': digest, 'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'), 'fetched_at': time.time()}
+    _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+    return payload, digest
+
+
+def register_font(font_path: str) -> bool:
+    """
+    Registers a font file with Matplotlib once per process.
+
+    Returns:
+        bool: True if the font was newly registered, False if it already was.
+    """
+    from matplotlib import font_manager
+
+    font_path = os.path.abspath(font_path)
+    with _FONT_LOCK:
+        if font_path in _REGISTERED_FONTS:
+            return False
+        font_manager.fontManager.addfont(font_path)
+        _REGISTERED_FONTS.add(font_path)
+        return True
+
+
+def fetch_font_family(font_family: str) -> List[str]:
+    """
+    Returns the `.ttf` files of a Google Fonts family, downloading and unpacking it into the asset cache on first use.
+
+    Args:
+        font_family (str): The exact font family name as it appears on Google Fonts.
+    """
+    import shutil
+
+    # The family name becomes a directory of the cache: keep it to one plain path component
+    if (not font_family or font_family in ('.', '..') or os.path.isabs(font_family)
+            or any(sep and sep in font_family for sep in (os.sep, os.altsep, '/'))):
+        raise ValueError(f"Invalid font family name: {font_family!r}")
+    font_dir = os.path.join(cache_dir(), 'fonts', font_family)
+    marker_path = os.path.join(font_dir, '.sha256')
+
+    def _ttf_files():
+        return sorted(os.path.join(root, f) for root, _, files in os.walk(font_dir) for f in files if f.endswith('.ttf'))
+
+    if os.path.exists(marker_path) and is_offline():
+        return _ttf_files()
+
+    font_url = f'https://fonts.google.com/download?family={font_family.replace(" ", "+")}'
+    try:
+        payload, digest = fetch_remote(font_url)
+    except Exception as e:
+        if os.path.exists(marker_path):
+            return _ttf_files()
+        raise Exception(f"Failed to download font: {font_family}") from e
+
+    previous = None
+    if os.path.exists(marker_path):
+        with open(marker_path, 'r', encoding='utf-8') as f:
+            previous = f.read().strip()
+    if previous != digest:
+        # Unpack next to the final location, with its marker, so the family only ever appears complete.
+        # The old copy is renamed aside before the new one is renamed in, and deleted last: a crash in
+        # between leaves it in the staging directory, and it is put back if the swap fails.
+        os.makedirs(os.path.dirname(font_dir), exist_ok=True)
+        staging_dir = tempfile.mkdtemp(dir=os.path.dirname(font_dir), prefix='.tmp-')
+        zip_path = os.path.join(staging_dir, 'font.zip')
+        with open(zip_path, 'wb') as f:
+            f.write(payload)
+        extract_dir = os.path.join(staging_dir, 'files')
+        shutil.unpack_archive(zip_path, extract_dir, format='zip')
+        os.remove(zip_path)
+        _atomic_write(os.path.join(extract_dir, '.sha256'), digest.encode('utf-8'))
+        retired_dir = os.path.join(staging_dir, 'previous')
+        if os.path.exists(font_dir):
+            os.replace(font_dir, retired_dir)
+        try:
+            os.replace(extract_dir, font_dir)
+        except OSError:
+            if os.path.exists(retired_dir):
+                os.replace(retired_dir, font_dir)
+            raise
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    return _ttf_files()
+
+
+def _decode_logo(logo_path: str) -> np.ndarray:
+    """Reads a local or remote logo and returns it as a uint8 RGBA array."""
+    import matplotlib.image as mpimg
+
+    if _is_url(logo_path):
+        payload, _ = fetch_remote(logo_path)
+        img = mpimg.imread(BytesIO(payload), format='png')
+    else:
+        img = mpimg.imread(logo_path)
+
+    if img.dtype != np.uint8:
+        img = (np.clip(img, 0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+    if img.ndim == 2:
+        img = np.stack([img] * 3, axis=-1)
+    if img.shape[2] == 3:
+        alpha = np.full(img.shape[:2] + (1,), 255, dtype=np.uint8)
+        img = np.concatenate([img, alpha], axis=-1)
+    return np.ascontiguousarray(img)
+
+
+def _fit_logo(img: np.ndarray, size_px: Tuple[int, int]) -> np.ndarray:
+    """Downscales `img` to fit inside `size_px` (width, height), keeping its aspect ratio. Never upscales."""
+    from PIL import Image
+
+    height, width = img.shape[:2]
+    scale = min(size_px[0] / width, size_px[1] / height)
+    if scale >= 1.0:
+        return img
+    new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return np.asarray(Image.fromarray(img, mode='RGBA').resize(new_size, Image.LANCZOS))
+
+
+def logo_pixel_size(fig, position: Tuple[float, float, float, float]) -> Tuple[int, int]:
+    """Returns the pixel box (width, height) a logo occupies for the given figure and axes position."""
+    dpi = max(float(fig.dpi), LOGO_TARGET_DPI)
+    fig_w, fig_h = fig.get_size_inches()
+    return (max(1, int(round(fig_w * position[2] * dpi))), max(1, int(round(fig_h * position[3] * dpi))))
+
+
+def get_logo(logo_path: str, size_px: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """
+    Returns the decoded RGBA logo, served from the process-wide logo cache.
+
+    Args:
+        logo_path (str): Path or URL to the logo image.
+        size_px (Tuple[int, int]): Optional (width, height) box the logo is downscaled to fit.
+    """
+    source_key = _logo_source_key(logo_path)
+    key = source_key + (tuple(size_px) if size_px else None,)
+    img = _LOGO_CACHE.get(key)
+    if img is not None:
+        return img
+
+    source = _LOGO_CACHE.get(source_key + (None,))
+    if source is None:
+        source = _decode_logo(logo_path)
+        _LOGO_CACHE.put(source_key + (None,), source)
+    if not size_px:
+        return source
+
+    img = _fit_logo(source, size_px)
+    _LOGO_CACHE.put(key, img)
+    return img
+
+
+def clear_logo_cache() -> None:
+    """Drops every decoded logo from the in-memory cache."""
+    _LOGO_CACHE.clear()
@@ -0,0 +1,255 @@
+import atexit
+import io
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .context import close_figure
+from .render import OUTPUT_FORMATS, _figure_of, render_figure
+
+# DataFrames/Series at least this large travel to the workers through shared
+# memory instead of being pickled with the task.
+SHARED_MEMORY_MIN_BYTES = 1 << 16
+
+# Keyword arguments for `savefig` when a spec does not provide its own. They
+# match the gallery scripts in `examples/`.
+DEFAULT_SAVEFIG = {'dpi': 150, 'bbox_inches': 'tight'}
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class _SharedFrame:
+    """Picklable handle to a DataFrame/Series whose arrays live in a shared memory segment."""
+    def __init__(self, obj, shm_name: str, arrays: List[Dict[str, Any]]):
+        self.shm_name = shm_name
+        self.arrays = arrays
+        self.kind = 'series' if isinstance(obj, pd.Series) else 'frame'
+        self.name = obj.name if isinstance(obj, pd.Series) else None
+        self.columns = None if isinstance(obj, pd.Series) else list(obj.columns)
+        self.index_name = obj.index.name
+        self.index_tz = getattr(obj.index, 'tz', None)
+
+    def load(self):
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=self.shm_name)
+        try:
+            # Copy out of the segment so its lifetime is independent from the rebuilt object
+            arrays = [np.ndarray(a['shape'], dtype=np.dtype(a['dtype']), buffer=shm.buf, offset=a['offset']).copy()
+                      for a in self.arrays]
+        finally:
+            shm.close()
+        index = pd.Index(arrays[0], name=self.index_name)
+        if self.index_tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.index_tz)
+        if self.kind == 'series':
+            return pd.Series(arrays[1], index=index, name=self.name)
+        return pd.DataFrame(dict(zip(range(len(self.columns)), arrays[1:])), index=index).set_axis(self.columns, axis=1)
+
+
+def _shareable_arrays(obj) -> Optional[List[np.ndarray]]:
+    """Returns the index and column arrays of `obj` if they can be placed in shared memory."""
+    index = obj.index
+    if isinstance(index, pd.DatetimeIndex):
+        index_values = index.tz_convert('UTC').tz_localize(None).values if index.tz is not None else index.values
+    elif isinstance(index, pd.MultiIndex):
+        return None
+    else:
+        index_values = index.to_numpy()
+    columns = [obj.to_numpy()] if isinstance(obj, pd.Series) else [obj.iloc[:, i].to_numpy() for i in range(obj.shape[1])]
+    arrays = [index_values] + columns
+    if any(a.dtype.hasobject for a in arrays):
+        return None
+    if isinstance(obj, pd.DataFrame) and not obj.columns.is_unique:
+        return None
+    return [np.ascontiguousarray(a) for a in arrays]
+
+
+def _share(obj, segments: list):
+    """Recursively replaces large DataFrames/Series in `obj` with shared memory handles."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        if np.sum(obj.memory_usage(deep=False)) < SHARED_MEMORY_MIN_BYTES:
+            return obj
+        arrays = _shareable_arrays(obj)
+        if arrays is None:
+            return obj
+        from multiprocessing import shared_memory
+
+        layout, offset = [], 0
+        for a in arrays:
+            offset = (offset + 63) // 64 * 64
+            layout.append({'dtype': a.dtype.str, 'shape': a.shape, 'offset': offset})
+            offset += a.nbytes
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        segments.append(shm)
+        for a, spec in zip(arrays, layout):
+            np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=spec['offset'])[...] = a
+        return _SharedFrame(obj, shm.name, layout)
+    if isinstance(obj, dict):
+        return {k: _share(v, segments) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_share(v, segments) for v in obj)
+    return obj
+
+
+def _unshare(obj):
+    if isinstance(obj, _SharedFrame):
+        return obj.load()
+    if isinstance(obj, dict):
+        return {k: _unshare(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_unshare(v) for v in obj)
+    return obj
+
+
+def _render_spec(index: int, spec: Dict[str, Any]) -> Dict[str, Any]:
+    from ..static.chart import Chart
+
+    started = time.perf_counter()
+    result = {'index': index, 'method': spec['method'], 'output': spec.get('output'), 'image': None, 'error': None}
+    previous_theme = _current_theme() if spec.get('theme') else None
+    try:
+        if previous_theme:
+            Chart.set_theme(**{**previous_theme, **spec['theme']})
+        args = _unshare(spec.get('args', ()))
+        if 'data' in spec:
+            args = (_unshare(spec['data']),) + tuple(args)
+        kwargs = _unshare(spec.get('kwargs', {}))
+        fig = _figure_of(getattr(Chart, spec['method'])(*args, **kwargs))
+        savefig = {**DEFAULT_SAVEFIG, **spec.get('savefig', {})}
+        try:
+            if spec.get('output'):
+                os.makedirs(os.path.dirname(os.path.abspath(spec['output'])), exist_ok=True)
+                fig.savefig(spec['output'], **savefig)
+            else:
+                from multiprocessing import shared_memory
+
+                image_format = spec.get('format', 'png')
+                if image_format in OUTPUT_FORMATS and image_format != 'rgba' and set(savefig) <= {'dpi', 'bbox_inches'}:
+                    # Single-draw path: crop the tight box out of one Agg render instead of drawing twice
+                    payload = memoryview(render_figure(fig, output=image_format, dpi=savefig['dpi'],
+                                                       tight=savefig['bbox_inches'] == 'tight', close=False))
+                else:
+                    buf = io.BytesIO()
+                    fig.savefig(buf, format=image_format, **savefig)
+                    payload = buf.getbuffer()
+                # Hand the encoded image back through shared memory; the parent unlinks it
+                shm = shared_memory.SharedMemory(create=True, size=max(payload.nbytes, 1))
+                shm.buf[:payload.nbytes] = payload
+                result['image'] = (shm.name, payload.nbytes)
+                shm.close()
+                # Ownership passes to the parent, which unlinks the segment after reading it
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        finally:
+            close_figure(fig)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        if previous_theme:
+            Chart.set_theme(**previous_theme)
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def _collect_image(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get('image'):
+        from multiprocessing import shared_memory
+
+        name, size = result['image']
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            result['image'] = bytes(shm.buf[:size])
+        finally:
+            shm.close()
+            shm.unlink()
+    return result
+
+
+def _current_theme() -> Dict[str, Any]:
+    from ..static.chart import Chart
+
+    return {'theme_name': Chart._global_theme, 'logo_path': Chart._global_logo_path,
+            'font_name': Chart._global_font, 'lang': Chart._global_lang}
+
+
+def get_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Returns a persistent pool of warmed worker processes, creating it on first use.
+
+    Workers import the library, apply the current global theme, register fonts and
+    perform a first Agg draw once, then stay alive to serve later batches.
+    """
+    workers = workers or os.cpu_count() or 1
+    theme = _current_theme()
+    key = (workers, tuple(sorted((k, str(v)) for k, v in theme.items())))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            from .warm import _init_worker
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(theme,))
+            _POOLS[key] = pool
+        return pool
+
+
+def shutdown_pools() -> None:
+    """Stops every persistent worker pool."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pools)
+
+
+def render_batch(specs: Iterable[Dict[str, Any]], workers: Optional[int] = None, ordered: bool = False,
+                 pool: Optional[ProcessPoolExecutor] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Renders chart specs on a pool of warmed worker processes and streams back the results.
+
+    Args:
+        specs (Iterable[dict]): Chart specs. Each spec is a dict with:
+            - 'method' (str): Chart method name, e.g. 'candle' or 'line'.
+            - 'data' (optional): First positional argument of the method.
+            - 'args' (tuple, optional): Further positional arguments.
+            - 'kwargs' (dict, optional): Keyword arguments of the method.
+            - 'output' (str, optional): File path to save to. If omitted, the encoded image is returned.
+            - 'format' (str, optional): Image format when no output path is given. Defaults to 'png'.
+            - 'savefig' (dict, optional): Extra `savefig` arguments. Defaults to dpi=150, bbox_inches='tight'.
+            - 'theme' (dict, optional): `set_theme` arguments applied in the worker before rendering.
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        ordered (bool): Yield results in spec order instead of completion order.
+        pool (ProcessPoolExecutor): Use this executor instead of the shared persistent pool.
+
+    Yields:
+        dict: One result per spec with keys 'index', 'method', 'output', 'image' (bytes or None),
+              'error' (str or None) and 'elapsed' (seconds spent in the worker).
+    """
+    pool = pool or get_pool(workers)
+    segments, futures, pending = [], [], set()
+    try:
+        futures = [pool.submit(_render_spec, i, _share(dict(spec), segments)) for i, spec in enumerate(specs)]
+        pending = set(futures)
+        iterator = futures if ordered else as_completed(futures)
+        for future in iterator:
+            pending.discard(future)
+            yield _collect_image(future.result())
+    finally:
+        # If the consumer stopped early, wait for in-flight tasks so no shared memory segment leaks
+        for future in pending:
+            if not future.cancel():
+                try:
+                    _collect_image(future.result())
+                except Exception:
+                    pass
+        for shm in segments:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,393 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A small thread-safe LRU cache with optional size accounting.
+
+    Entries are evicted least-recently-used first once either `maxsize` entries
+    or `max_bytes` of accounted size is exceeded.
+
+    Args:
+        maxsize (int): Maximum number of entries. None for no limit.
+        max_bytes (int): Maximum total size of the entries, as reported by `sizeof`. None for no limit.
+        sizeof (Callable): Function returning the size of a value in bytes. Required with `max_bytes`.
+    """
+    def __init__(self, maxsize: Optional[int] = 128, max_bytes: Optional[int] = None, sizeof: Optional[Callable[[Any], int]] = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._sizes.pop(key)
+                del self._data[key]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while self._data and ((self.maxsize is not None and len(self._data) > self.maxsize)
+                                  or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                old_key, _ = self._data.popitem(last=False)
+                self.nbytes -= self._sizes.pop(old_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and the current occupancy of the cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0,
+                    'entries': len(self._data), 'nbytes': self.nbytes}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class Unfingerprintable(TypeError):
+    """Raised by `fingerprint` for objects whose content cannot be hashed (e.g. an Axes or a callable)."""
+
+
+def _feed_values(h, values_of) -> None:
+    import pandas as pd
+
+    h.update(f'{values_of.dtype};'.encode('utf-8'))
+    values = values_of.to_numpy()
+    if values.dtype.hasobject and len(values) <= 64:
+        # Column labels and other short object arrays are cheaper to walk than to hash through pandas
+        h.update(b'objects:%d;' % len(values))
+        for item in values:
+            _feed(h, item)
+        return
+    if values.dtype.hasobject:
+        # Strings, categories, timezone-aware timestamps and tuples hash through pandas, vectorized
+        try:
+            values = pd.util.hash_pandas_object(values_of, index=False).to_numpy()
+        except TypeError as e:
+            raise Unfingerprintable(str(e)) from e
+    _feed(h, values)
+
+
+def _feed(h, obj) -> None:
+    import numpy as np
+    import pandas as pd
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update(f'{type(obj).__name__}:{obj!r};'.encode('utf-8'))
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b'bytes:%d;' % len(obj))
+        h.update(obj)
+    elif isinstance(obj, np.ndarray):
+        h.update(f'ndarray:{obj.dtype.str}:{obj.shape};'.encode('utf-8'))
+        if obj.dtype.hasobject:
+            try:
+                h.update(pd.util.hash_array(obj.ravel()).data)
+            except TypeError as e:
+                raise Unfingerprintable(str(e)) from e
+        else:
+            h.update(np.ascontiguousarray(obj).reshape(-1).view(np.uint8).data)
+    elif isinstance(obj, pd.Index):
+        h.update(f'{type(obj).__name__}:{list(obj.names)!r};'.encode('utf-8'))
+        _feed_values(h, obj)
+    elif isinstance(obj, pd.Series):
+        h.update(f'Series:{obj.name!r};'.encode('utf-8'))
+        _feed(h, obj.index)
+        _feed_values(h, obj)
+    elif isinstance(obj, pd.DataFrame):
+        h.update(f'DataFrame:{obj.shape};'.encode('utf-8'))
+        _feed(h, obj.columns)
+        _feed(h, obj.index)
+        for _, column in obj.items():
+            _feed_values(h, column)
+    elif isinstance(obj, dict):
+        h.update(b'dict:%d;' % len(obj))
+        for key in sorted(obj, key=repr):
+            _feed(h, key)
+            _feed(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}:{len(obj)};'.encode('utf-8'))
+        for item in obj:
+            _feed(h, item)
+    elif isinstance(obj, (set, frozenset)):
+        h.update(b'set:%d;' % len(obj))
+        for item in sorted(obj, key=repr):
+            _feed(h, item)
+    elif isinstance(obj, (np.generic, pd.Timestamp, pd.Timedelta)) or type(obj).__module__ in ('datetime', 'decimal'):
+        h.update(f'{type(obj).__name__}:{obj!r};'.encode('utf-8'))
+    else:
+        raise Unfingerprintable(f"Cannot fingerprint an object of type {type(obj).__name__}")
+
+
+def fingerprint(*objs) -> str:
+    """
+    Returns a BLAKE2b digest of the content of `objs`.
+
+    DataFrames, Series and arrays are hashed from their raw buffers (object columns through
+    `pandas.util.hash_pandas_object`), so equal data gives equal digests whatever object holds it.
+
+    Raises:
+        Unfingerprintable: If an object is neither data nor a plain Python value.
+    """
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=20)
+    for obj in objs:
+        _feed(h, obj)
+    return h.hexdigest()
+
+
+def _payload_size(value) -> int:
+    return value.nbytes if hasattr(value, 'nbytes') else len(value)
+
+
+class RenderCache:
+    """
+    Content-addressed store for rendered charts: an in-memory LRU bounded in bytes, optionally
+    backed by a directory of image files evicted least-recently-used first.
+
+    Encoded images (PNG/WebP) go to both tiers; RGBA arrays are kept in memory only and are
+    returned read-only.
+
+    Args:
+        max_bytes (int): Memory budget for cached images.
+        disk (bool): Also persist encoded images on disk, so restarted processes reuse them.
+        cache_dir (str): Directory for the disk tier. Defaults to `renders/` in the asset cache directory.
+        max_disk_bytes (int): Disk budget for cached images.
+    """
+    def __init__(self, max_bytes: int = 64 << 20, disk: bool = False, cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 512 << 20):
+        self.memory = LRUCache(maxsize=None, max_bytes=max_bytes, sizeof=_payload_size)
+        self.disk = disk
+        self._cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._disk_bytes = None
+        self._disk_lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    @property
+    def cache_dir(self) -> str:
+        from .assets import cache_dir
+
+        return self._cache_dir or os.path.join(cache_dir(), 'renders')
+
+    def _path(self, key: str, output: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f'{key}.{output}')
+
+    def get(self, key: str, output: str) -> Any:
+        value = self.memory.get((key, output))
+        if value is not None or not self.disk or output == 'rgba':
+            return value
+        path = self._path(key, output)
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+            # Reads refresh the file's position in the disk LRU
+            os.utime(path)
+        except OSError:
+            with self._disk_lock:
+                self.disk_misses += 1
+            return None
+        with self._disk_lock:
+            self.disk_hits += 1
+        self.memory.put((key, output), value)
+        return value
+
+    def put(self, key: str, output: str, value: Any) -> Any:
+        """Stores a rendered chart and returns the value to hand out (a read-only copy for RGBA arrays)."""
+        if output == 'rgba':
+            import numpy as np
+
+            value = np.array(value)
+            value.setflags(write=False)
+        self.memory.put((key, output), value)
+        if self.disk and output != 'rgba':
+            from .assets import _atomic_write
+
+            try:
+                _atomic_write(self._path(key, output), value)
+                self._account_disk(len(value))
+            except OSError:
+                pass
+        return value
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.startswith('.tmp-'):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield stat.st_mtime, stat.st_size, path
+
+    def _account_disk(self, added: int) -> None:
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+            else:
+                self._disk_bytes += added
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+            # Drop the least recently used files until the directory is back to 90% of its budget
+            files = sorted(self._disk_files())
+            total = sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= 0.9 * self.max_disk_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._disk_bytes = total
+
+    def clear(self, disk: bool = False) -> None:
+        """Empties the memory tier, and the disk tier too if `disk` is True."""
+        self.memory.clear()
+        with self._disk_lock:
+            self.disk_hits = self.disk_misses = 0
+            if disk:
+                import shutil
+
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+                self._disk_bytes = 0
+
+    def stats(self) -> dict:
+        """Returns the memory tier's counters plus disk hits and misses."""
+        stats = self.memory.stats()
+        with self._disk_lock:
+            stats.update({'disk_hits': self.disk_hits, 'disk_misses': self.disk_misses, 'disk_nbytes': self._disk_bytes})
+        return stats
+
+
+# Process-wide render cache used by the chart methods; disabled until `configure_render_cache` is called.
+_RENDER_CACHE: Dict[str, Optional[RenderCache]] = {'cache': None}
+
+
+def configure_render_cache(enabled: bool = True, max_bytes: int = 64 << 20, disk: bool = False,
+                           cache_dir: Optional[str] = None, max_disk_bytes: int = 512 << 20) -> Optional[RenderCache]:
+    """
+    Enables (or disables) the render cache in front of the chart methods' `output=` path.
+
+    Args:
+        enabled (bool): False removes the cache.
+        max_bytes (int): Memory budget for cached images. Defaults to 64 MB.
+        disk (bool): Also persist encoded images on disk.
+        cache_dir (str): Directory for the disk tier. Defaults to `renders/` in the asset cache directory.
+        max_disk_bytes (int): Disk budget for cached images. Defaults to 512 MB.
+
+    Returns:
+        RenderCache: The new cache, or None when disabled.
+    """
+    _RENDER_CACHE['cache'] = RenderCache(max_bytes=max_bytes, disk=disk, cache_dir=cache_dir,
+                                         max_disk_bytes=max_disk_bytes) if enabled else None
+    return _RENDER_CACHE['cache']
+
+
+def render_cache() -> Optional[RenderCache]:
+    """Returns the active render cache, or None if it is disabled."""
+    return _RENDER_CACHE['cache']
+
+
+def _derived_size(value) -> int:
+    if isinstance(value, (tuple, list)):
+        return sum(_derived_size(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_derived_size(item) for item in value.values())
+    return getattr(value, 'nbytes', 64)
+
+
+def _freeze(value):
+    """Marks the arrays of a derived value read-only, so callers cannot alter the cached copy."""
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    elif hasattr(value, 'setflags'):
+        value.setflags(write=False)
+    return value
+
+
+# Process-wide cache of derived series (indicators, monthly returns), on by default.
+_DERIVED_CACHE: Dict[str, Optional[LRUCache]] = {'cache': LRUCache(maxsize=256, max_bytes=64 << 20, sizeof=_derived_size)}
+
+_MISSING = object()
+
+
+def configure_derived_cache(enabled: bool = True, maxsize: int = 256, max_bytes: int = 64 << 20) -> Optional[LRUCache]:
+    """
+    Replaces the derived-data cache shared by the chart methods.
+
+    Args:
+        enabled (bool): False removes the cache; every derived series is then recomputed.
+        maxsize (int): Maximum number of cached results. Defaults to 256.
+        max_bytes (int): Memory budget of the cached arrays. Defaults to 64 MB.
+
+    Returns:
+        LRUCache: The new cache, or None when disabled.
+    """
+    _DERIVED_CACHE['cache'] = LRUCache(maxsize=maxsize, max_bytes=max_bytes, sizeof=_derived_size) if enabled else None
+    return _DERIVED_CACHE['cache']
+
+
+def derived_cache() -> Optional[LRUCache]:
+    """Returns the active derived-data cache, or None if it is disabled."""
+    return _DERIVED_CACHE['cache']
+
+
+def cached(kind: str, source: Optional[str], params: Hashable, compute: Callable[[], Any]) -> Any:
+    """
+    Returns `compute()` through the derived-data cache, keyed by the kind of result, the `fingerprint` of
+    its source arrays and its parameters. Arrays in the result are read-only.
+
+    Args:
+        kind (str): Name of the computation, e.g. 'indicator' or 'monthly_returns'.
+        source (str): `fingerprint` of the inputs. None bypasses the cache.
+        params: Hashable parameters of the computation.
+        compute (Callable): Computes the result on a miss.
+    """
+    cache = derived_cache()
+    if cache is None or source is None:
+        return compute()
+    key = (kind, source, params)
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = _freeze(compute())
+        cache.put(key, value)
+    return value
@@ -0,0 +1,205 @@
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+# Process-wide theme set by `Chart.set_theme`.
+_GLOBAL_THEME: Dict[str, Any] = {'theme_name': 'vnstock', 'logo_path': None, 'font_name': None, 'lang': 'vi'}
+
+# Per-thread / per-task overrides installed by `theme_context`. New threads start without any.
+_THEME_OVERRIDES = contextvars.ContextVar('vnstock_ezchart_theme', default=None)
+
+
+class ThemeSetting:
+    """
+    Class attribute backed by the global theme, which `theme_context` can override for the
+    current thread or asyncio task only (e.g. `Chart._global_theme`).
+    """
+    def __init__(self, key: str, default: Any = None):
+        self.key = key
+        if default is not None:
+            _GLOBAL_THEME[key] = default
+
+    def __get__(self, obj, owner=None):
+        overrides = _THEME_OVERRIDES.get()
+        if overrides and self.key in overrides:
+            return overrides[self.key]
+        return _GLOBAL_THEME[self.key]
+
+
+def set_global_theme(**theme) -> None:
+    """Updates the process-wide theme (theme_name, logo_path, font_name, lang)."""
+    unknown = set(theme) - set(_GLOBAL_THEME)
+    if unknown:
+        raise TypeError(f"Unknown theme settings: {', '.join(sorted(unknown))}")
+    _GLOBAL_THEME.update(theme)
+
+
+def scoped_font() -> Optional[str]:
+    """Returns the font set by an active `theme_context`, if it overrides the global one."""
+    overrides = _THEME_OVERRIDES.get()
+    return overrides.get('font_name') if overrides else None
+
+
+@contextmanager
+def theme_context(**theme):
+    """
+    Overrides theme settings for the charts drawn inside the block, in the current thread or task only.
+
+    Args:
+        **theme: Any of theme_name, logo_path, font_name and lang (see `Chart.set_theme`).
+    """
+    unknown = set(theme) - set(_GLOBAL_THEME)
+    if unknown:
+        raise TypeError(f"Unknown theme settings: {', '.join(sorted(unknown))}")
+    token = _THEME_OVERRIDES.set({**(_THEME_OVERRIDES.get() or {}), **theme})
+    try:
+        yield
+    finally:
+        _THEME_OVERRIDES.reset(token)
+
+
+class _RcLock:
+    """
+    Readers-writer lock around Matplotlib's process-wide rcParams.
+
+    Building and drawing a chart reads rcParams (shared), while mplfinance, seaborn grids and
+    `set_theme` write them (exclusive). Both are reentrant within a thread, and an exclusive
+    holder may also take the shared side.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def shared(self):
+        depth = getattr(self._local, 'depth', 0)
+        if depth or self._writer == threading.get_ident():
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+        with self._cond:
+            # Writers go first so a steady stream of charts cannot starve them
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        me = threading.get_ident()
+        if self._writer == me:
+            yield
+            return
+        if getattr(self._local, 'depth', 0):
+            raise RuntimeError("rcParams cannot be changed while this thread is drawing a chart.")
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
+
+
+RC_LOCK = _RcLock()
+
+# pyplot keeps open figures in a global registry and numbers new ones from it.
+PYPLOT_LOCK = threading.RLock()
+
+# Whether chart figures are created through pyplot (registered until closed) or as plain
+# Figures with their own Agg canvas. `pyplot_context` overrides it per thread/task.
+_FIGURE_SETTINGS = {'pyplot': True}
+_PYPLOT_OVERRIDE = contextvars.ContextVar('vnstock_ezchart_pyplot', default=None)
+
+_SUBPLOTS_KEYS = ('sharex', 'sharey', 'squeeze', 'width_ratios', 'height_ratios', 'subplot_kw', 'gridspec_kw')
+
+
+def set_pyplot(enabled: bool) -> None:
+    _FIGURE_SETTINGS['pyplot'] = bool(enabled)
+
+
+def pyplot_enabled() -> bool:
+    override = _PYPLOT_OVERRIDE.get()
+    return _FIGURE_SETTINGS['pyplot'] if override is None else override
+
+
+@contextmanager
+def pyplot_context(enabled: Optional[bool]):
+    """Creates figures through pyplot (True) or without it (False) inside the block. None keeps the current mode."""
+    if enabled is None:
+        yield
+        return
+    token = _PYPLOT_OVERRIDE.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _PYPLOT_OVERRIDE.reset(token)
+
+
+def new_figure(**fig_kw):
+    """Creates a Figure with an Agg canvas that pyplot does not know about."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**fig_kw)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def new_subplots(nrows: int = 1, ncols: int = 1, **kwargs):
+    """Pyplot-free counterpart of `plt.subplots`, with the same arguments."""
+    subplot_kw = {k: kwargs.pop(k) for k in _SUBPLOTS_KEYS if k in kwargs}
+    fig = new_figure(**kwargs)
+    return fig, fig.subplots(nrows, ncols, **subplot_kw)
+
+
+@contextmanager
+def rc_scope():
+    """Runs code that modifies rcParams (e.g. mplfinance, seaborn grids) and restores them afterwards."""
+    import matplotlib.pyplot as plt
+
+    with RC_LOCK.exclusive(), PYPLOT_LOCK, plt.rc_context():
+        yield
+
+
+def close_figure(fig) -> None:
+    """Closes a figure and removes it from pyplot's registry."""
+    import matplotlib.pyplot as plt
+
+    with PYPLOT_LOCK:
+        plt.close(fig)
+
+
+def apply_font(artist, font_name: str) -> None:
+    """Sets `font_name` on every text of a figure or axes, instead of changing the global `font.family`."""
+    from matplotlib.figure import Figure
+    from matplotlib.text import Text
+
+    for ax in (artist.axes if isinstance(artist, Figure) else [artist]):
+        # Materialize the tick labels; ticks created later copy their font from these
+        ax.xaxis.get_major_ticks()
+        ax.yaxis.get_major_ticks()
+    for text in artist.findobj(Text):
+        text.set_fontfamily(font_name)
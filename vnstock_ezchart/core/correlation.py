@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+
+def correlation_matrix(values: np.ndarray, min_periods: int = 2, block: int = 512) -> np.ndarray:
+    """
+    Pearson correlations between the columns of `values` (observations x variables) in float32.
+
+    Each column is standardized once, then the matrix is filled block by block of `block` columns with
+    float32 matrix products, so memory stays bounded for thousands of tickers. Missing values are
+    handled pairwise as in `DataFrame.corr`: each pair uses the rows where both are present, from the
+    products of the values and of the validity masks. Pairs with fewer than `min_periods` common
+    observations, and constant columns, are NaN.
+    """
+    x = np.asarray(values, dtype=float)
+    n_obs, n_vars = x.shape
+    valid = ~np.isnan(x)
+    counts = valid.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(counts > 0, np.nansum(x, axis=0) / np.maximum(counts, 1), 0.0)
+        std = np.sqrt(np.where(counts > 0, np.nansum((x - mean) ** 2, axis=0) / np.maximum(counts, 1), 0.0))
+    usable = (counts >= min_periods) & (std > 0)
+    z = np.where(valid, (x - mean) / np.where(std > 0, std, 1.0), 0.0).astype(np.float32)
+    out = np.empty((n_vars, n_vars), dtype=np.float32)
+    complete = bool(valid.all())
+    if not complete:
+        mask = valid.astype(np.float32)
+        squares = z * z
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for i in range(0, n_vars, block):
+            zi = z[:, i:i + block]
+            for j in range(i, n_vars, block):
+                zj = z[:, j:j + block]
+                if complete:
+                    # Standardized columns: the correlation is the mean product
+                    r = zi.T @ zj / np.float32(max(n_obs, 1))
+                    if n_obs < min_periods:
+                        r[:] = np.nan
+                else:
+                    mi, mj = mask[:, i:i + block], mask[:, j:j + block]
+                    n = mi.T @ mj
+                    sx, sy = zi.T @ mj, mi.T @ zj
+                    cov = zi.T @ zj - sx * sy / n
+                    vx = squares[:, i:i + block].T @ mj - sx * sx / n
+                    vy = mi.T @ squares[:, j:j + block] - sy * sy / n
+                    r = cov / np.sqrt(vx * vy)
+                    r[n < min_periods] = np.nan
+                out[i:i + block, j:j + block] = r
+                out[j:j + block, i:i + block] = r.T
+    np.clip(out, -1.0, 1.0, out=out)
+    out[~usable, :] = np.nan
+    out[:, ~usable] = np.nan
+    np.fill_diagonal(out, np.where(usable, 1.0, np.nan))
+    return out
+
+
+def _average_linkage_order(distance: np.ndarray) -> np.ndarray:
+    """
+    Leaf order of an average-linkage dendrogram, by the nearest-neighbour chain algorithm:
+    O(n^2) time with one vectorized row update per merge.
+    """
+    n = len(distance)
+    d = np.array(distance, dtype=float)
+    np.fill_diagonal(d, np.inf)
+    sizes = np.ones(n)
+    nodes = list(range(n))
+    children = {}
+    chain, remaining = [], n
+    while remaining > 1:
+        if not chain:
+            chain.append(int(np.argmin(np.isinf(d).all(axis=1))))
+        a = chain[-1]
+        b = int(np.argmin(d[a]))
+        if len(chain) > 1 and d[a, chain[-2]] <= d[a, b]:
+            b = chain[-2]
+        if len(chain) > 1 and b == chain[-2]:
+            chain.pop()
+            chain.pop()
+            # Lance-Williams update for average linkage; cluster `a` takes the merged one's place
+            merged = (sizes[a] * d[a] + sizes[b] * d[b]) / (sizes[a] + sizes[b])
+            d[a, :], d[:, a] = merged, merged
+            d[a, a] = np.inf
+            d[b, :], d[:, b] = np.inf, np.inf
+            sizes[a] += sizes[b]
+            children[len(children) + n] = (nodes[a], nodes[b])
+            nodes[a] = len(children) + n - 1
+            remaining -= 1
+        else:
+            chain.append(b)
+    order, stack = [], [max(children)]
+    while stack:
+        node = stack.pop()
+        if node < n:
+            order.append(node)
+        else:
+            left, right = children[node]
+            stack.extend((right, left))
+    return np.asarray(order)
+
+
+def cluster_order(corr: np.ndarray) -> np.ndarray:
+    """
+    Orders the variables of a correlation matrix by average-linkage hierarchical clustering on the
+    distance sqrt((1 - corr) / 2), so correlated groups form blocks along the diagonal.
+
+    Uses SciPy when it is installed, and an equivalent NumPy implementation otherwise. Pairs without
+    a correlation are treated as uncorrelated.
+    """
+    n = len(corr)
+    if n < 3:
+        return np.arange(n)
+    distance = np.sqrt(np.clip((1.0 - np.nan_to_num(np.asarray(corr, dtype=float), nan=0.0)) / 2.0, 0.0, 1.0))
+    distance = (distance + distance.T) / 2
+    np.fill_diagonal(distance, 0.0)
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+    except ImportError:
+        return _average_linkage_order(distance)
+    return leaves_list(linkage(squareform(distance, checks=False), method='average'))
+
+
+def correlation_frame(data: pd.DataFrame, min_periods: int = 2, cluster: bool = True,
+                      block: int = 512) -> pd.DataFrame:
+    """
+    `correlation_matrix` of the columns of `data` as a float32 DataFrame, reordered by `cluster_order`
+    when `cluster` is True.
+    """
+    corr = correlation_matrix(data.to_numpy(dtype=float), min_periods=min_periods, block=block)
+    order = cluster_order(corr) if cluster else np.arange(len(corr))
+    labels = data.columns[order]
+    return pd.DataFrame(corr[np.ix_(order, order)], index=labels, columns=labels)
@@ -0,0 +1,157 @@
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .render import render_dpi
+
+
+def auto_columns(ax) -> int:
+    """Number of pixel columns `ax` spans when the chart is drawn at `render_dpi()`."""
+    return max(1, int(np.ceil(ax.get_window_extent().width * render_dpi() / ax.figure.dpi)))
+
+
+def decimate_columns(ax, decimate: Union[int, str, None]) -> Optional[int]:
+    """Pixel columns for a `decimate` option: 'auto' for `auto_columns`, a positive int as is, None or False for none."""
+    if decimate is None or decimate is False:
+        return None
+    if decimate == 'auto':
+        return auto_columns(ax)
+    if not isinstance(decimate, (int, np.integer)) or isinstance(decimate, bool) or decimate < 1:
+        raise ValueError(f"decimate must be a positive integer, 'auto' or None, not {decimate!r}.")
+    return int(decimate)
+
+
+def m4_indices(x: np.ndarray, values: np.ndarray, columns: int,
+               x_range: Optional[Tuple[float, float]] = None) -> Optional[np.ndarray]:
+    """
+    Rows of `values` that M4 decimation keeps for a line `columns` pixels wide: the first, last,
+    minimum and maximum of each pixel column, in order, so the decimated line keeps the vertical
+    extent of the full one in every column. Antialiasing and Agg's path simplification can still
+    shade a few edge pixels differently. NaN gaps are kept as well (the first NaN of each column).
+
+    Pixel columns split `x_range` (the data range by default) evenly; rows outside it share the
+    columns at its edges. Everything is computed for all columns of a 2-D `values` at once with
+    `reduceat` over the pixel boundaries.
+
+    Args:
+        x (np.ndarray): Sorted x-coordinates, (n,).
+        values (np.ndarray): Y values, (n,) or (n, n_lines).
+        columns (int): Number of pixel columns.
+        x_range (tuple): (left, right) x limits of the axes.
+
+    Returns:
+        np.ndarray: Row indices, (k, n_lines) for 2-D values or (k,), ascending per line; repeated
+        rows are allowed. None when `x` is not sorted or there is nothing to gain.
+    """
+    x = np.asarray(x, dtype=float)
+    values = np.asarray(values, dtype=float)
+    flat = values.ndim == 1
+    if flat:
+        values = values[:, None]
+    n = len(x)
+    if n <= 4 * columns or (np.diff(x) < 0).any() or not np.isfinite(x).all():
+        return None
+    low, high = x_range if x_range is not None else (x[0], x[-1])
+    if not high > low:
+        return None
+    pixel = np.clip(np.floor((x - low) / (high - low) * columns), -1, columns)
+    starts = np.flatnonzero(np.r_[True, pixel[1:] != pixel[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    owner = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+    rows = np.arange(n)[:, None]
+    picks = [np.broadcast_to(starts[:, None], (len(starts), values.shape[1]))]
+    with np.errstate(invalid='ignore'):
+        for extreme in (np.fmin, np.fmax):
+            target = extreme.reduceat(values, starts, axis=0)
+            hit = np.minimum.reduceat(np.where(values == target[owner], rows, n), starts, axis=0)
+            # All-NaN pixel columns have no extreme
+            picks.append(np.where(hit == n, picks[0], hit))
+    missing = np.isnan(values)
+    if missing.any():
+        gap = np.minimum.reduceat(np.where(missing, rows, n), starts, axis=0)
+        picks.append(np.where(gap == n, picks[0], gap))
+    picks.append(np.broadcast_to(ends[:, None], picks[0].shape))
+    # (pixel column, pick, line) -> ascending rows within each pixel column
+    indices = np.sort(np.stack(picks, axis=1), axis=1).reshape(-1, values.shape[1])
+    return indices[:, 0] if flat else indices
+
+
+def decimate_lines(ax, lines: Optional[Sequence] = None, columns: Union[int, str, None] = 'auto') -> int:
+    """
+    Replaces the data of long `Line2D`s of `ax` (all of them by default) with their `m4_indices`
+    points, in the axes' own units, so date and period tick formatting is unchanged.
+
+    Args:
+        ax: The axes, already scaled to its data.
+        lines (Sequence[Line2D]): The lines to decimate.
+        columns (int or 'auto'): Pixel columns, see `decimate_columns`. None does nothing.
+
+    Returns:
+        int: Number of vertices removed.
+    """
+    columns = decimate_columns(ax, columns)
+    if columns is None:
+        return 0
+    removed = 0
+    x_range = tuple(sorted(ax.get_xlim()))
+    for line in (ax.get_lines() if lines is None else lines):
+        xy = line.get_xydata()
+        keep = m4_indices(xy[:, 0], xy[:, 1], columns, x_range)
+        if keep is not None:
+            line.set_data(xy[keep, 0], xy[keep, 1])
+            removed += len(xy) - len(keep)
+    return removed
+
+
+def _plot_periods(index: pd.DatetimeIndex) -> Optional[pd.PeriodIndex]:
+    """
+    The periods pandas plots a regular DatetimeIndex at (its time-series x-axis and tick formatting),
+    or None when pandas plots it as plain dates: irregular stamps, or stamps not at the start of their
+    period (e.g. daily bars that are not at midnight).
+    """
+    freq = index.freq or index.inferred_freq
+    if freq is None or (freq == 'B' and (index.dayofweek >= 5).any()):
+        return None
+    try:
+        periods = index.tz_localize(None).to_period(freq)
+        first = periods[0]
+        daily = first.end_time - first.start_time >= pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+        start = first.start_time
+    except (TypeError, ValueError):
+        return None
+    if daily:
+        return periods if index[:1].is_normalized else None
+    return periods if start == index[0].tz_localize(None) else None
+
+
+def decimate_frame(data: Union[pd.Series, pd.DataFrame], columns: int) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Rows of a Series or DataFrame that `DataFrame.plot` draws like the full data: the `m4_indices` rows
+    of every column, over the range of the index. A regular DatetimeIndex comes back as the PeriodIndex
+    pandas would have converted it to, so the axis and its tick labels stay the same. Data that cannot
+    be decimated (unsorted or non-numeric index, short) is returned as is.
+    """
+    index = data.index
+    periods = None
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype(float)
+    elif isinstance(index, pd.PeriodIndex):
+        x = index.asi8.astype(float)
+    elif pd.api.types.is_numeric_dtype(index):
+        x = np.asarray(index, dtype=float)
+    else:
+        return data
+    try:
+        values = data.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return data
+    keep = m4_indices(x, values, columns)
+    if keep is None:
+        return data
+    if isinstance(index, pd.DatetimeIndex):
+        periods = _plot_periods(index)
+    subset = data.iloc[np.unique(keep)]
+    if periods is not None:
+        subset = subset.set_axis(periods[np.unique(keep)], axis=0)
+    return subset
@@ -0,0 +1,147 @@
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# `scatter` switches to a density image above this many points.
+DENSITY_POINTS = 50_000
+
+
+class DensityGrid:
+    """
+    Streaming 2-D histogram of (x, y) points, for density scatter plots of millions of rows.
+
+    Feed it chunks of points with `update`; only the counts and the points of sparse bins are kept,
+    so the full point set never needs to be in memory. Axes without fixed limits start from the range
+    of the first chunk. Points of later chunks that fall outside the grid are kept as outliers until
+    there are more than `spill` of them; then the bin width doubles (pairs of bins are merged) until
+    they fit, so no point is lost and the grid keeps its number of bins.
+
+    Points in bins that end up with at most `outliers` points are kept as they are, so they can be
+    drawn as markers instead of nearly invisible pixels: every such point arrived while its bin was
+    still that sparse, and counts only grow.
+
+    Args:
+        bins (int or tuple): Number of bins along x and y; rounded up to even numbers.
+        xlim (tuple): Fixed x range. Points outside it are dropped.
+        ylim (tuple): Fixed y range. Points outside it are dropped.
+        outliers (int): Keep the points of bins with at most this many points. 0 keeps none, and the
+            grid then grows for every point outside it.
+        spill (int): Number of points outside the grid kept as outliers before the grid grows.
+    """
+    def __init__(self, bins: Union[int, Tuple[int, int]] = 512, xlim: Optional[Tuple[float, float]] = None,
+                 ylim: Optional[Tuple[float, float]] = None, outliers: int = 1, spill: int = 10_000):
+        nx, ny = (bins, bins) if np.isscalar(bins) else bins
+        self.shape = (int(ny) + int(ny) % 2, int(nx) + int(nx) % 2)
+        self.counts = np.zeros(self.shape, dtype=np.int64)
+        self.outliers = int(outliers)
+        self.spill = int(spill)
+        self._limits = [xlim, ylim]
+        self._origin = np.zeros(2)
+        self._width = np.ones(2)
+        self._started = False
+        self._low = np.full(2, np.inf)
+        self._high = np.full(2, -np.inf)
+        self._sparse = np.empty((0, 2))
+        self._outside = np.empty((0, 2))
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """(left, right, bottom, top) of the grid, as taken by `imshow`."""
+        (ny, nx), (x0, y0), (wx, wy) = self.shape, self._origin, self._width
+        return x0, x0 + nx * wx, y0, y0 + ny * wy
+
+    @property
+    def data_limits(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """(min, max) of the binned x and y values, or the fixed limits."""
+        return tuple(tuple(self._limits[axis]) if self._limits[axis] is not None else (self._low[axis], self._high[axis])
+                     for axis in range(2))
+
+    def _start(self, points: np.ndarray) -> None:
+        for axis in range(2):
+            n = self.shape[1 - axis]
+            low, high = self._limits[axis] if self._limits[axis] is not None else (points[:, axis].min(), points[:, axis].max())
+            if high <= low:
+                pad = max(abs(low) * 1e-3, 0.5)
+                low, high = low - pad, high + pad
+            self._origin[axis] = low
+            # The maximum falls in the middle of the last bin
+            self._width[axis] = (high - low) / (n - 0.5)
+        self._started = True
+
+    def _grow(self, axis: int, left: bool) -> None:
+        """Doubles the bin width along `axis`, extending the grid to the left (or bottom) or right (or top)."""
+        counts = np.moveaxis(self.counts, 1 - axis, 0)
+        n = counts.shape[0]
+        merged = counts.reshape(n // 2, 2, -1).sum(axis=1)
+        grown = np.zeros_like(counts)
+        if left:
+            grown[n // 2:] = merged
+            self._origin[axis] -= n * self._width[axis]
+        else:
+            grown[:n // 2] = merged
+        self._width[axis] *= 2
+        self.counts = np.moveaxis(grown, 0, 1 - axis)
+
+    def _cells(self, points: np.ndarray) -> np.ndarray:
+        cells = np.floor((points - self._origin) / self._width).astype(np.int64)
+        return cells[:, 1] * self.shape[1] + cells[:, 0]
+
+    def update(self, x, y) -> 'DensityGrid':
+        """Adds a chunk of points; NaN and infinite values are skipped."""
+        points = np.column_stack([np.asarray(x, dtype=float).ravel(), np.asarray(y, dtype=float).ravel()])
+        points = points[np.isfinite(points).all(axis=1)]
+        for axis in range(2):
+            if self._limits[axis] is not None:
+                low, high = self._limits[axis]
+                points = points[(points[:, axis] >= low) & (points[:, axis] <= high)]
+        if not len(points):
+            return self
+        if not self._started:
+            self._start(points)
+        self._low = np.minimum(self._low, points.min(axis=0))
+        self._high = np.maximum(self._high, points.max(axis=0))
+        (ny, nx), grown = self.shape, False
+        upper = self._origin + np.array([nx, ny]) * self._width
+        inside = ((points >= self._origin) & (points < upper)).all(axis=1)
+        if not inside.all():
+            self._outside = np.concatenate([self._outside, points[~inside]])
+            points = points[inside]
+            if self.outliers <= 0 or len(self._outside) > self.spill:
+                low, high = self._outside.min(axis=0), self._outside.max(axis=0)
+                for axis, n in ((0, nx), (1, ny)):
+                    while low[axis] < self._origin[axis]:
+                        self._grow(axis, left=True)
+                    while high[axis] >= self._origin[axis] + n * self._width[axis]:
+                        self._grow(axis, left=False)
+                points, self._outside, grown = np.concatenate([points, self._outside]), np.empty((0, 2)), True
+        cells = self._cells(points)
+        flat = self.counts.reshape(-1)
+        flat += np.bincount(cells, minlength=flat.size)
+        if self.outliers > 0:
+            if grown and len(self._sparse):
+                self._sparse = self._sparse[flat[self._cells(self._sparse)] <= self.outliers]
+            self._sparse = np.concatenate([self._sparse, points[flat[cells] <= self.outliers]])
+        return self
+
+    def result(self) -> Tuple[np.ma.MaskedArray, np.ndarray]:
+        """
+        The counts per bin (rows are y bins from the bottom, masked where there are no points, and where
+        the points are returned as outliers), and the outlier points as an (n, 2) array: those of sparse
+        bins and those outside the grid.
+        """
+        counts = self.counts
+        if self.outliers <= 0:
+            return np.ma.masked_equal(counts, 0), self._outside
+        sparse = self._sparse[counts.reshape(-1)[self._cells(self._sparse)] <= self.outliers]
+        return np.ma.masked_less_equal(counts, self.outliers), np.concatenate([sparse, self._outside])
+
+
+def density_grid(chunks: Iterable, x: str, y: str, bins: Union[int, Tuple[int, int]] = 512,
+                 xlim: Optional[Tuple[float, float]] = None, ylim: Optional[Tuple[float, float]] = None,
+                 outliers: int = 1, spill: int = 10_000) -> DensityGrid:
+    """`DensityGrid` of the `x` and `y` columns of a DataFrame or of an iterable of DataFrame chunks."""
+    grid = DensityGrid(bins=bins, xlim=xlim, ylim=ylim, outliers=outliers, spill=spill)
+    for chunk in ([chunks] if isinstance(chunks, pd.DataFrame) else chunks):
+        grid.update(chunk[x].to_numpy(), chunk[y].to_numpy())
+    return grid
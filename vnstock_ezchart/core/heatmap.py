@@ -0,0 +1,98 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Smallest font size (points) drawn for tick labels and cell annotations.
+MIN_FONTSIZE = 6.0
+
+# Matrices with more cells than this are drawn by `heatmap` as one raster (see `draw_matrix`).
+_RASTER_SETTINGS = {'cells': 1000}
+
+
+def set_raster_threshold(cells: int) -> None:
+    _RASTER_SETTINGS['cells'] = int(cells)
+
+
+def raster_threshold() -> int:
+    return _RASTER_SETTINGS['cells']
+
+
+def cell_size(ax, shape) -> tuple:
+    """Width and height in points of one cell of a `shape` matrix filling `ax`."""
+    width, height = ax.get_position().size * ax.figure.get_size_inches() * 72.0
+    return width / max(shape[1], 1), height / max(shape[0], 1)
+
+
+def _label_step(cell: float, fontsize: float) -> int:
+    """Show every n-th tick label so labels are at least `fontsize` points apart."""
+    return max(1, int(np.ceil(fontsize * 1.2 / max(cell, 1e-9))))
+
+
+def color_scale(values: np.ndarray, cmap=None, vmin=None, vmax=None, center=None, robust: bool = False) -> tuple:
+    """
+    Colormap and norm of `seaborn.heatmap` for these arguments: limits from the data (2nd/98th percentiles
+    when `robust`), and with a `center` the colormap is resampled so that `center` gets its middle color.
+    """
+    import matplotlib.colors as mcolors
+    import seaborn as sns
+
+    finite = np.asarray(values, dtype=float)
+    finite = finite[np.isfinite(finite)]
+    if vmin is None:
+        vmin = (np.percentile(finite, 2) if robust else finite.min()) if finite.size else 0.0
+    if vmax is None:
+        vmax = (np.percentile(finite, 98) if robust else finite.max()) if finite.size else 1.0
+    if cmap is None:
+        cmap = sns.cm.rocket if center is None else sns.cm.icefire
+    elif isinstance(cmap, str):
+        cmap = sns.color_palette(cmap, as_cmap=True)
+    elif isinstance(cmap, (list, tuple)):
+        cmap = mcolors.ListedColormap(cmap)
+    if center is not None:
+        spread = max(vmax - center, center - vmin)
+        low, high = mcolors.Normalize(center - spread, center + spread)([vmin, vmax])
+        cmap = mcolors.ListedColormap(cmap(np.linspace(low, high, 256)))
+    return cmap, mcolors.Normalize(vmin, vmax)
+
+
+def draw_matrix(ax, values: np.ndarray, cmap, norm, xlabels: Optional[Sequence] = None, ylabels: Optional[Sequence] = None,
+                annot=False, fmt: str = '.2f', fontsize: float = 8.0):
+    """
+    Draws a matrix as one `imshow` raster of precomputed colors instead of one artist per cell.
+
+    Tick labels are thinned to every n-th one when the cells are narrower than a readable font, and
+    annotations are only written when `annot` is True (or an array of the values to write) and they fit
+    inside the cells at `MIN_FONTSIZE` or more. NaN cells are left blank. Add colorbars and style the axes first: the sizes are measured
+    on the current layout.
+    """
+    values = np.asarray(values, dtype=float)
+    rows, cols = values.shape
+    colors = cmap(norm(np.ma.masked_invalid(values)))
+    colors[np.isnan(values)] = (0.0, 0.0, 0.0, 0.0)
+    ax.imshow(colors, interpolation='nearest', aspect='auto')
+
+    cell_w, cell_h = cell_size(ax, values.shape)
+    for axis, labels, cell, count in ((ax.xaxis, xlabels, cell_w, cols), (ax.yaxis, ylabels, cell_h, rows)):
+        if labels is None:
+            axis.set_ticks([])
+            continue
+        size = min(fontsize + 1, max(MIN_FONTSIZE, cell * 0.8))
+        step = _label_step(cell, size)
+        ticks = np.arange(0, count, step)
+        axis.set_ticks(ticks)
+        axis.set_ticklabels([str(labels[i]) for i in ticks], fontsize=size)
+    ax.tick_params(axis='x', labelrotation=90 if cols > 12 else 0)
+
+    if isinstance(annot, (bool, np.bool_)):
+        texts = values if annot else None
+    else:
+        texts = np.asarray(annot)
+    if texts is not None and texts.shape == values.shape:
+        size = min(fontsize, cell_h * 0.5)
+        # Rough text width of the formatted numbers
+        sample = format(-0.5, fmt) if np.isfinite(values).any() else ''
+        if size >= MIN_FONTSIZE and len(sample) * size * 0.6 <= cell_w:
+            luminance = colors[..., :3] @ np.array([0.299, 0.587, 0.114])
+            for i, j in zip(*np.nonzero(np.isfinite(values))):
+                ax.text(j, i, format(texts[i, j], fmt), ha='center', va='center', fontsize=size,
+                        color='white' if luminance[i, j] < 0.5 else '#0f172a')
@@ -0,0 +1,277 @@
+import re
+import warnings
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached, fingerprint
+
+# Indicators `candle(indicators=...)` understands: name -> (placement, default parameters).
+# 'overlay' indicators share the price panel, 'panel' indicators get a panel of their own.
+# Parameters with an int default are periods (whole numbers of bars); float ones may be fractional.
+INDICATORS = {
+    'sma': ('overlay', (20,)),
+    'ema': ('overlay', (20,)),
+    'bbands': ('overlay', (20, 2.0)),
+    'rsi': ('panel', (14,)),
+    'macd': ('panel', (12, 26, 9)),
+}
+
+_SPEC = re.compile(r'^([a-z]+)((?:\d+(?:\.\d+)?)(?:[_,/-]\d+(?:\.\d+)?)*)?$')
+
+# Largest growth of the block weights in `_smooth` (keeps them far from overflowing).
+_MAX_BLOCK_GROWTH = 1e150
+
+
+def parse_indicator(spec: str) -> Tuple[str, Tuple[Union[int, float], ...]]:
+    """
+    Splits an indicator spec like 'sma20', 'bbands20_2.5' or 'macd12_26_9' into its name and parameters.
+
+    Missing trailing parameters take the defaults of `INDICATORS` ('macd' is 'macd12_26_9'). Periods
+    must be whole numbers of at least 1; only the Bollinger Band width may be fractional.
+    """
+    match = _SPEC.match(str(spec).strip().lower().replace(' ', ''))
+    name = match.group(1) if match else None
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator '{spec}'. Use one of: {', '.join(INDICATORS)} followed by its "
+                         "parameters, e.g. 'sma20', 'ema50', 'rsi14', 'bbands20', 'macd12_26_9'.")
+    defaults = INDICATORS[name][1]
+    given = re.split(r'[_,/-]', match.group(2)) if match.group(2) else []
+    if len(given) > len(defaults):
+        raise ValueError(f"Indicator '{spec}' takes at most {len(defaults)} parameter(s).")
+    params = []
+    for text, default in zip(given, defaults):
+        if isinstance(default, float):
+            params.append(float(text))
+        elif text.isdigit():
+            params.append(int(text))
+        else:
+            raise ValueError(f"Indicator '{spec}' needs whole-number periods, not '{text}'.")
+    params = tuple(params) + defaults[len(given):]
+    if any(p <= 0 for p in params):
+        raise ValueError(f"Indicator '{spec}' needs positive parameters.")
+    return name, params
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """Forward-fills NaNs (leading NaNs stay)."""
+    valid = ~np.isnan(values)
+    if valid[np.argmax(valid):].all():
+        return values
+    last = np.maximum.accumulate(np.where(valid, np.arange(len(values)), -1))
+    return np.where(last >= 0, values[np.maximum(last, 0)], np.nan)
+
+
+def _smooth(values: np.ndarray, alpha: float, state: float) -> np.ndarray:
+    """
+    Runs the recursion y[t] = alpha * x[t] + (1 - alpha) * y[t-1] from y[-1] = `state`.
+
+    Within a block, y[k] = d^(k+1) * y[-1] + alpha * d^k * cumsum(x[j] * d^-j) with d = 1 - alpha, so each
+    block is one `cumsum`; blocks are as long as the weights d^-j can grow without overflowing.
+    """
+    decay = 1.0 - alpha
+    out = np.empty(len(values))
+    if decay <= 0.0:
+        out[:] = values
+        return out
+    block = max(1, min(len(values), int(np.log(_MAX_BLOCK_GROWTH) / -np.log(decay)))) if decay < 1.0 else len(values)
+    powers = decay ** np.arange(block + 1)
+    inverse = 1.0 / powers[:block]
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        n = len(chunk)
+        out[start:start + n] = powers[1:n + 1] * state + alpha * powers[:n] * np.cumsum(chunk * inverse[:n])
+        state = out[start + n - 1]
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average over `period` values from running sums; NaN until a window holds `period` valid values."""
+    values = np.asarray(values, dtype=float)
+    period = int(period)
+    out = np.full(len(values), np.nan)
+    if len(values) < period:
+        return out
+    missing = np.isnan(values)
+    has_missing = missing.any()
+    # Shift by the first value so the running sums stay small and their differences precise
+    offset = values[np.argmax(~missing)] if not missing.all() else 0.0
+    sums = np.cumsum(np.where(missing, 0.0, values - offset) if has_missing else values - offset)
+    window = sums[period - 1:].copy()
+    window[1:] -= sums[:-period]
+    out[period - 1:] = window / period + offset
+    if has_missing:
+        counts = np.cumsum(missing)
+        gaps = counts[period - 1:].copy()
+        gaps[1:] -= counts[:-period]
+        out[period - 1:][gaps > 0] = np.nan
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (period + 1), seeded with the simple average of the first
+    `period` valid values (NaN before). Gaps in the input are forward-filled.
+    """
+    return _seeded_smooth(values, period, 2.0 / (period + 1))
+
+
+def rma(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's moving average: an `ema` with alpha = 1 / period."""
+    return _seeded_smooth(values, period, 1.0 / period)
+
+
+def _seeded_smooth(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    values = _ffill(np.asarray(values, dtype=float))
+    period = int(period)
+    out = np.full(len(values), np.nan)
+    first = int(np.argmax(~np.isnan(values))) if len(values) else 0
+    if len(values) - first < period or np.isnan(values[first]):
+        return out
+    seed_end = first + period
+    out[seed_end - 1] = values[first:seed_end].mean()
+    out[seed_end:] = _smooth(values[seed_end:], alpha, out[seed_end - 1])
+    return out
+
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative Strength Index (0-100) with Wilder's smoothing of gains and losses."""
+    values = np.asarray(values, dtype=float)
+    delta = np.diff(values, prepend=np.nan)
+    gains, losses = np.maximum(delta, 0.0), np.maximum(-delta, 0.0)
+    avg_gain, avg_loss = rma(gains, period), rma(losses, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = 100.0 * avg_gain / (avg_gain + avg_loss)
+    # Flat windows (no gain and no loss) sit in the middle
+    return np.where((avg_gain + avg_loss) == 0, 50.0, out)
+
+
+def bbands(values: np.ndarray, period: int = 20, width: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands: (upper, middle, lower), `width` population standard deviations around the `sma`."""
+    values = np.asarray(values, dtype=float)
+    offset = np.nanmean(values) if (~np.isnan(values)).any() else 0.0
+    centered = values - offset
+    middle = sma(centered, period)
+    spread = np.sqrt(np.maximum(sma(centered * centered, period) - middle * middle, 0.0))
+    middle = middle + offset
+    return middle + width * spread, middle, middle - width * spread
+
+
+def macd(values: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD: (macd line, signal line, histogram) from `ema`s of the closes."""
+    line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def indicator_arrays(spec: str, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Computes one indicator spec on an array of closes.
+
+    Returns:
+        Dict[str, np.ndarray]: Output label (e.g. 'SMA 20', 'MACD 12/26/9', 'Signal') -> values.
+    """
+    name, params = parse_indicator(spec)
+    periods = [int(p) for p in params]
+    label = f"{name.upper()} {'/'.join(str(p) for p in periods)}"
+    if name == 'sma':
+        return {label: sma(close, periods[0])}
+    if name == 'ema':
+        return {label: ema(close, periods[0])}
+    if name == 'rsi':
+        return {label: rsi(close, periods[0])}
+    if name == 'bbands':
+        upper, middle, lower = bbands(close, periods[0], params[1])
+        label = f'BB {periods[0]}'
+        return {f'{label} upper': upper, label: middle, f'{label} lower': lower}
+    line, signal_line, hist = macd(close, *periods)
+    return {label: line, 'Signal': signal_line, 'Histogram': hist}
+
+
+def cached_indicator_arrays(spec: str, close: np.ndarray, source: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    `indicator_arrays` through the derived-data cache, so charts of the same closes share the work.
+    The returned arrays are read-only.
+
+    Args:
+        source (str): `fingerprint(close)`, when the caller already has it.
+    """
+    return cached('indicator', source or fingerprint(close), parse_indicator(spec),
+                  lambda: indicator_arrays(spec, close))
+
+
+def indicator_series(spec: str, data: pd.DataFrame, source: Optional[str] = None) -> Dict[str, pd.Series]:
+    """Computes one indicator spec on the 'Close' column of `data`, as Series aligned with `data`."""
+    outputs = cached_indicator_arrays(spec, data['Close'].to_numpy(dtype=float), source)
+    return {key: pd.Series(values, index=data.index) for key, values in outputs.items()}
+
+
+def indicator_frame(data: pd.DataFrame, indicators: Sequence[str]) -> pd.DataFrame:
+    """Computes several indicator specs on `data` into one DataFrame with a column per output line."""
+    close = data['Close'].to_numpy(dtype=float)
+    source = fingerprint(close)
+    columns = {}
+    for spec in indicators:
+        columns.update(cached_indicator_arrays(spec, close, source))
+    return pd.DataFrame(columns, index=data.index)
+
+
+def indicator_plots(data: pd.DataFrame, indicators: Sequence[Any], palette: List[str], up_color: str,
+                    down_color: str) -> Tuple[List[dict], List[List[dict]], List[Tuple[str, str]]]:
+    """
+    Lays the `indicators` of `candle`/`backtest` out as overlay and subplot dicts.
+
+    Args:
+        data (pd.DataFrame): Bars with a 'Close' column.
+        indicators (list): Specs such as 'sma20', or dicts {'name': 'sma20', 'color': ..., 'width': ...}
+            that override the styling.
+        palette (list): Theme colors; lines cycle through those that are not the up/down colors.
+        up_color, down_color: Colors of the MACD histogram bars.
+
+    Returns:
+        Tuple[list, list, list]: Overlay dicts for the price panel, one group of subplot dicts per
+        panel indicator, and the (label, color) legend entries of the overlays.
+    """
+    colors = [c for i, c in enumerate(palette) if i not in (0, 3)] or list(palette) or ['#2196F3']
+    overlays, panels, legend = [], [], []
+    close = data['Close'].to_numpy(dtype=float)
+    source = fingerprint(close)
+
+    def series(values):
+        return pd.Series(values, index=data.index)
+
+    for i, item in enumerate(indicators):
+        style = dict(item) if isinstance(item, dict) else {'name': item}
+        spec = style.pop('name')
+        outputs = cached_indicator_arrays(spec, close, source)
+        if all(np.isnan(values).all() for values in outputs.values()):
+            warnings.warn(f"Not enough bars to compute '{spec}'; it is not drawn.", UserWarning, stacklevel=4)
+            continue
+        color = style.pop('color', colors[i % len(colors)])
+        name = parse_indicator(spec)[0]
+        if name == 'bbands':
+            (upper_label, upper), (label, middle), (_, lower) = outputs.items()
+            overlays.append({'data': series(middle), 'color': color, 'width': style.get('width', 1.2), 'alpha': 0.9})
+            for band in (upper, lower):
+                overlays.append({'data': series(band), 'color': color, 'width': 0.8, 'alpha': style.get('alpha', 0.45)})
+            legend.append((label, color))
+        elif name in ('sma', 'ema'):
+            (label, values), = outputs.items()
+            overlays.append({'data': series(values), 'color': color, 'width': style.get('width', 1.5), 'alpha': style.get('alpha', 0.9)})
+            legend.append((label, color))
+        elif name == 'rsi':
+            (label, values), = outputs.items()
+            guide = '#94a3b8'
+            panels.append([{'data': series(values), 'color': color, 'width': style.get('width', 1.2), 'ylabel': label},
+                           {'data': pd.Series(70.0, index=data.index), 'color': guide, 'width': 0.6},
+                           {'data': pd.Series(30.0, index=data.index), 'color': guide, 'width': 0.6}])
+        else:
+            (label, line), (_, signal_line), (_, hist) = outputs.items()
+            signal_color = style.pop('signal_color', colors[(i + 1) % len(colors)])
+            # Histogram as two single-color bar series, so it can be bucketed like any other line
+            panels.append([{'data': series(np.maximum(hist, 0.0)), 'type': 'bar', 'color': up_color, 'ylabel': 'MACD'},
+                           {'data': series(np.minimum(hist, 0.0)), 'type': 'bar', 'color': down_color},
+                           {'data': series(line), 'color': color, 'width': style.get('width', 1.2)},
+                           {'data': series(signal_line), 'color': signal_color, 'width': style.get('width', 1.2)}])
+    return overlays, panels, legend
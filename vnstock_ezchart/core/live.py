@@ -0,0 +1,358 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from matplotlib.ticker import Formatter
+
+from .context import RC_LOCK
+from .native import _updown_colors, candle_vertices, candle_widths, volume_vertices
+from .render import OUTPUT_FORMATS, encode_pixels
+
+_OHLCV = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Extra room left above/below the data whenever the axes are rescaled, so that a new
+# high or low does not force another full redraw on the very next tick.
+PRICE_MARGIN = 0.05
+VOLUME_MARGIN = 1.25
+
+# Top of the panels when the chart has a title: live frames show the whole canvas, so the
+# title must fit inside it rather than above it as in `candle`.
+_TITLED_TOP = 0.92
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of rows backed by one preallocated NumPy array."""
+    def __init__(self, capacity: int, width: Optional[int] = None, dtype=float, fill=np.nan):
+        self.capacity = capacity
+        self.data = np.full((capacity,) if width is None else (capacity, width), fill, dtype=dtype)
+        self.start = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, row) -> None:
+        """Adds a row, overwriting the oldest one when the buffer is full."""
+        if self.size == self.capacity:
+            self.data[self.start] = row
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.data[(self.start + self.size) % self.capacity] = row
+            self.size += 1
+
+    @property
+    def last(self):
+        return self.data[(self.start + self.size - 1) % self.capacity]
+
+    @last.setter
+    def last(self, row) -> None:
+        self.data[(self.start + self.size - 1) % self.capacity] = row
+
+    def values(self) -> np.ndarray:
+        """Returns the rows from oldest to newest (a copy)."""
+        return self.data[(self.start + np.arange(self.size)) % self.capacity]
+
+
+class _LiveDateFormatter(Formatter):
+    """Labels bar positions with the time of the buffered bar, extrapolating into the empty slots on the right."""
+    def __init__(self, live: 'LiveCandle', fmt: str):
+        self.live = live
+        self.fmt = fmt
+
+    def __call__(self, x, pos=None):
+        seq = int(round(x))
+        first = self.live.count - len(self.live.times)
+        if seq < first:
+            return ''
+        times = self.live.times.values()
+        if seq < self.live.count:
+            stamp = times[seq - first]
+        else:
+            stamp = times[-1] + (seq - self.live.count + 1) * self.live.spacing()
+        return pd.Timestamp(stamp).strftime(self.fmt)
+
+
+class LiveCandle:
+    """
+    Candlestick chart that updates in place, for screens refreshed several times per second.
+
+    The last `capacity` bars live in a ring buffer, and the chart shows a window of `capacity`
+    slots whose right-most `headroom` slots start empty. Everything but the last bar is
+    drawn once into a cached background; `update_last` and `append` only redraw the last
+    candle, its volume bar and the last segment of each overlay on top of it (canvas
+    blitting), so an update costs the same however much history was fed. The axes are
+    rescaled, with a full redraw, only when a bar breaks the current price or volume
+    limits or reaches the right edge of the window, which then scrolls by `headroom` bars.
+
+    Built by `Chart.live_candle`; not meant to be instantiated directly.
+
+    Attributes:
+        figure (Figure): The chart figure.
+        axes (list): Price panel, then the volume panel if any.
+        title (Text): The figure title, or None.
+        count (int): Number of bars fed so far.
+        redraws (int): Number of full redraws so far (initial draw included).
+    """
+    def __init__(self, fig, axes: List[Any], data: pd.DataFrame, overlays: Sequence[np.ndarray],
+                 capacity: int, headroom: int, volume: bool, up_color, down_color, datetime_format: str,
+                 title: Optional[Any] = None):
+        self.figure = fig
+        self.title = title
+        self.axes = axes
+        self.capacity = capacity
+        self.headroom = headroom
+        self.up_color, self.down_color = up_color, down_color
+        self.price_ax = axes[0]
+        self.volume_ax = axes[1] if volume else None
+        self.bars = RingBuffer(capacity, len(_OHLCV) + len(overlays))
+        self.times = RingBuffer(capacity, dtype='datetime64[ns]', fill=np.datetime64('NaT'))
+        self.count = 0
+        self.redraws = 0
+        self.x0 = 0
+        self._background = None
+
+        rows = np.column_stack([data[c].to_numpy(dtype=float) if c in data.columns else np.zeros(len(data))
+                                for c in _OHLCV] + [np.asarray(v, dtype=float) for v in overlays])
+        for stamp, row in zip(data.index.tz_localize(None) if data.index.tz is not None else data.index, rows):
+            self.times.append(np.datetime64(stamp, 'ns'))
+            self.bars.append(row)
+            self.count += 1
+
+        if title is not None:
+            self._fit_title()
+        self._take_over(len(overlays))
+        axes[-1].xaxis.set_major_formatter(_LiveDateFormatter(self, datetime_format))
+        fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.redraw()
+
+    def _fit_title(self) -> None:
+        from .native import _BOTTOM, _TOP
+
+        scale = (_TITLED_TOP - _BOTTOM) / (1.0 - _TOP - _BOTTOM)
+        for ax in self.axes:
+            x0, y0, width, height = ax.get_position().bounds
+            ax.set_position([x0, _BOTTOM + (y0 - _BOTTOM) * scale, width, height * scale])
+        self.title.set(y=0.985, va='top')
+
+    def _take_over(self, n_overlays: int) -> None:
+        """Adopts the candle, volume and overlay artists drawn by `candle` and adds the animated last-bar artists."""
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.lines import Line2D
+
+        ax = self.price_ax
+        self._wicks, self._bodies = ax.collections[0], ax.collections[1]
+        self._lines = list(ax.lines[:n_overlays])
+        self._volumes = self.volume_ax.collections[0] if self.volume_ax is not None else None
+        self._width, self._linewidth, self._volume_width = candle_widths(self.capacity)
+
+        self._live_wick = LineCollection([], linewidths=self._linewidth, animated=True)
+        self._live_body = PolyCollection([], linewidths=self._linewidth, animated=True)
+        ax.add_collection(self._live_wick)
+        ax.add_collection(self._live_body)
+        self._live_lines = []
+        for line in self._lines:
+            segment = Line2D([], [], color=line.get_color(), linewidth=line.get_linewidth(), alpha=line.get_alpha(),
+                             animated=True)
+            ax.add_line(segment)
+            self._live_lines.append(segment)
+        self._live_volume = None
+        if self._volumes is not None:
+            self._live_volume = PolyCollection([], edgecolors='#FFFFFF', linewidths=0.5, animated=True)
+            self.volume_ax.add_collection(self._live_volume)
+
+    def spacing(self) -> np.timedelta64:
+        """Typical time between two bars (median of the buffered gaps), used to label the empty slots."""
+        times = self.times.values()
+        if len(times) < 2:
+            return np.timedelta64(1, 'D')
+        return np.median(np.diff(times).astype(np.int64)).astype(np.int64).astype('timedelta64[ns]')
+
+    def _set_candles(self, wicks, bodies, x, rows) -> None:
+        valid = np.isfinite(rows[:, :4]).all(axis=1)
+        x, rows = x[valid], rows[valid]
+        wick_verts, body_verts = candle_vertices(x, rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3], self._width)
+        up = rows[:, 0] < rows[:, 3]
+        edge = _updown_colors(up, self.up_color, self.down_color)
+        wicks.set_segments(wick_verts)
+        wicks.set_color(np.concatenate([edge, edge]))
+        bodies.set_verts(body_verts)
+        bodies.set_facecolor(_updown_colors(up, self.up_color, self.down_color, 0.9))
+        bodies.set_edgecolor(edge)
+
+    def _set_volumes(self, collection, x, rows) -> None:
+        valid = np.isfinite(rows[:, 4])
+        collection.set_verts(volume_vertices(x[valid], rows[valid, 4], self._volume_width))
+        collection.set_facecolor(_updown_colors(rows[valid, 0] < rows[valid, 3], self.up_color, self.down_color))
+
+    def _set_live(self) -> None:
+        """Moves the animated artists onto the last bar and the last overlay segments."""
+        rows = self.bars.values()[-2:]
+        x = np.arange(self.count - len(rows), self.count, dtype=float)
+        self._set_candles(self._live_wick, self._live_body, x[-1:], rows[-1:])
+        if self._live_volume is not None:
+            self._set_volumes(self._live_volume, x[-1:], rows[-1:])
+        for i, segment in enumerate(self._live_lines):
+            segment.set_data(x, rows[:, len(_OHLCV) + i])
+
+    def _limits(self, rows: np.ndarray):
+        prices = np.concatenate([rows[:, 1], rows[:, 2], rows[:, len(_OHLCV):].ravel()])
+        low, high = np.nanmin(prices), np.nanmax(prices)
+        margin = PRICE_MARGIN * (high - low) or 0.01 * abs(high) or 1.0
+        volumes = rows[:, 4]
+        return (low - margin, high + margin), (0.3 * np.nanmin(volumes), VOLUME_MARGIN * np.nanmax(volumes))
+
+    def _breaks_limits(self, row: np.ndarray) -> bool:
+        low, high = self.price_ax.get_ylim()
+        prices = np.concatenate([row[1:3], row[len(_OHLCV):]])
+        prices = prices[np.isfinite(prices)]
+        if len(prices) and (prices.min() < low or prices.max() > high):
+            return True
+        return self.volume_ax is not None and np.isfinite(row[4]) and row[4] > self.volume_ax.get_ylim()[1]
+
+    def redraw(self) -> None:
+        """Rebuilds every artist from the ring buffer, rescales the axes and redraws the whole figure."""
+        seq = np.arange(self.count - len(self.bars), self.count)
+        visible = seq >= self.x0
+        rows, x = self.bars.values()[visible], seq[visible].astype(float)
+        self._set_candles(self._wicks, self._bodies, x[:-1], rows[:-1])
+        for i, line in enumerate(self._lines):
+            line.set_data(x[:-1], rows[:-1, len(_OHLCV) + i])
+        (price_low, price_high), (volume_low, volume_high) = self._limits(rows)
+        self.price_ax.set_ylim(price_low, price_high)
+        if self._volumes is not None:
+            self._set_volumes(self._volumes, x[:-1], rows[:-1])
+            self.volume_ax.set_ylim(volume_low, volume_high)
+        pad = 0.45 * (self.capacity - 1) / self.capacity
+        self.price_ax.set_xlim(self.x0 - pad, self.x0 + self.capacity - 1 + pad)
+        self._set_live()
+        self._background = None
+        self.redraws += 1
+        with RC_LOCK.shared():
+            self.figure.canvas.draw()
+
+    def _on_draw(self, event) -> None:
+        # Every full draw (including window resizes) refreshes the cached background
+        canvas = self.figure.canvas
+        if not hasattr(canvas, 'copy_from_bbox'):
+            return
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_live()
+
+    def _draw_live(self) -> None:
+        for artist in self._live_artists():
+            self.figure.draw_artist(artist)
+
+    def _live_artists(self) -> list:
+        artists = [self._live_wick, self._live_body] + self._live_lines
+        return artists + ([self._live_volume] if self._live_volume is not None else [])
+
+    def _blit(self) -> None:
+        canvas = self.figure.canvas
+        if self._background is None:
+            with RC_LOCK.shared():
+                canvas.draw()
+            return
+        with RC_LOCK.shared():
+            canvas.restore_region(self._background)
+            self._set_live()
+            self._draw_live()
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+    def _row(self, bar, overlays: Optional[Sequence[float]], base: Optional[np.ndarray] = None) -> np.ndarray:
+        if isinstance(bar, pd.Series):
+            bar = bar.to_dict()
+        if isinstance(bar, dict):
+            bar = {str(k).capitalize(): v for k, v in bar.items()}
+            values = [bar.get(c, np.nan) for c in _OHLCV]
+        else:
+            values = list(bar) + [np.nan] * (len(_OHLCV) - len(bar))
+        row = np.full(self.bars.data.shape[1], np.nan)
+        row[:len(_OHLCV)] = values[:len(_OHLCV)]
+        if overlays is not None:
+            row[len(_OHLCV):] = overlays
+        elif base is not None:
+            row[len(_OHLCV):] = base[len(_OHLCV):]
+        return row
+
+    @staticmethod
+    def _time(bar) -> Optional[np.datetime64]:
+        """Reads the bar time from a 'time' key or the Series name, if there is one."""
+        if isinstance(bar, dict):
+            stamp = bar.get('time', bar.get('Time'))
+        elif isinstance(bar, pd.Series):
+            stamp = bar.get('time', bar.name)
+        else:
+            return None
+        if not isinstance(stamp, (str, datetime, np.datetime64)):
+            return None
+        stamp = pd.Timestamp(stamp)
+        return np.datetime64(stamp.tz_localize(None) if stamp.tz is not None else stamp, 'ns')
+
+    def update_last(self, bar, overlays: Optional[Sequence[float]] = None) -> None:
+        """
+        Replaces the last (still forming) bar and redraws only that bar.
+
+        Args:
+            bar (dict, pd.Series or sequence): 'Open', 'High', 'Low', 'Close' and 'Volume' values
+                (any case), or a (open, high, low, close[, volume]) sequence.
+            overlays (sequence): The last value of each overlay, in the order they were given.
+                Defaults to the current values.
+        """
+        row = self._row(bar, overlays, base=self.bars.last)
+        self.bars.last = row
+        stamp = self._time(bar)
+        if stamp is not None:
+            self.times.last = stamp
+        if self._breaks_limits(row):
+            self.redraw()
+        else:
+            self._blit()
+
+    def append(self, bar, overlays: Optional[Sequence[float]] = None) -> None:
+        """
+        Starts a new bar: the previous last bar is painted into the cached background and
+        only the new one is drawn.
+
+        Args:
+            bar (dict, pd.Series or sequence): The new bar, as for `update_last`. Its time is read from a
+                'time' key (or the Series name) and defaults to the last time plus the usual bar spacing.
+            overlays (sequence): The value of each overlay at the new bar. Defaults to NaN.
+        """
+        row = self._row(bar, overlays)
+        stamp = self._time(bar)
+        if stamp is None:
+            stamp = self.times.last + self.spacing()
+        if self._background is not None:
+            # Freeze the current last bar into the background before moving on
+            with RC_LOCK.shared():
+                self.figure.canvas.restore_region(self._background)
+                self._draw_live()
+                self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self.bars.append(row)
+        self.times.append(stamp)
+        self.count += 1
+        if self.count - 1 > self.x0 + self.capacity - 1:
+            # Scroll so that `headroom` empty slots are left on the right
+            self.x0 = self.count - (self.capacity - self.headroom)
+            self.redraw()
+        elif self._breaks_limits(row):
+            self.redraw()
+        else:
+            self._blit()
+
+    def frame(self, output: str = 'png', quality: int = 90) -> Any:
+        """
+        Returns what is on the canvas now as encoded bytes or an RGBA array, without redrawing.
+
+        Args:
+            output (str): 'png', 'webp' or 'rgba'.
+            quality (int): WebP quality (1-100).
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output '{output}'. Choose one of: {', '.join(OUTPUT_FORMATS)}.")
+        if self._background is None:
+            self.redraw()
+        pixels = np.asarray(self.figure.canvas.buffer_rgba())
+        return encode_pixels(pixels.copy() if output == 'rgba' else pixels, output, self.figure.dpi, quality)
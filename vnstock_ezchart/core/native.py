@@ -0,0 +1,277 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.ticker import Formatter
+
+# mplfinance's width table (bars on screen -> candle/volume widths in x units and candle
+# linewidths in points), so that both engines draw candles with the same proportions.
+_WIDTH_POINTS = (30, 60, 90, 120, 150, 180, 210, 240)
+_CANDLE_WIDTH = (0.65, 0.575, 0.50, 0.445, 0.435, 0.425, 0.420, 0.415)
+_CANDLE_LINEWIDTH = (1.00, 0.875, 0.75, 0.625, 0.500, 0.438, 0.435, 0.435)
+_VOLUME_WIDTH = (0.98, 0.96, 0.95, 0.925, 0.9, 0.9, 0.875, 0.825)
+
+# Axes placement of mplfinance's `tight_layout=True` (figure fractions), shared by all panels.
+_LEFT, _RIGHT, _TOP, _BOTTOM = 0.108, 0.024, 0.0288, 0.108
+
+# `mpf.plot` keyword arguments the native engine understands besides the ones `candle` sets
+# (the layout is always mplfinance's tight layout).
+NATIVE_KWARGS = ('ylim', 'xlim', 'datetime_format', 'xlabel', 'tight_layout')
+
+
+class IndexDateFormatter(Formatter):
+    """Labels integer x positions with the dates of the bars drawn there."""
+    def __init__(self, index, fmt: str):
+        self.index = index
+        self.fmt = fmt
+
+    def __call__(self, x, pos=None):
+        ix = int(round(x))
+        if 0 <= ix < len(self.index):
+            return self.index[ix].strftime(self.fmt)
+        return ''
+
+
+def datetime_format(index) -> str:
+    """Picks the tick label format from the bar spacing, like mplfinance does."""
+    if len(index) < 2:
+        return '%b %d'
+    avg_days = (index[-1] - index[0]).total_seconds() / 86400 / len(index)
+    if avg_days < 0.33:
+        return '%H:%M' if index[-1].date() == index[0].date() else '%b %d, %H:%M'
+    return '%Y-%b-%d' if index[-1].year != index[0].year else '%b %d'
+
+
+def candle_widths(n: int) -> Tuple[float, float, float]:
+    """Returns (candle width, candle linewidth, volume width) for `n` bars."""
+    return (float(np.interp(n, _WIDTH_POINTS, _CANDLE_WIDTH)), float(np.interp(n, _WIDTH_POINTS, _CANDLE_LINEWIDTH)),
+            float(np.interp(n, _WIDTH_POINTS, _VOLUME_WIDTH)))
+
+
+def _updown_colors(up: np.ndarray, up_color, down_color, alpha: float = 1.0) -> np.ndarray:
+    from matplotlib.colors import to_rgba
+
+    return np.where(up[:, None], np.array(to_rgba(up_color, alpha)), np.array(to_rgba(down_color, alpha)))
+
+
+def candle_vertices(x: np.ndarray, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                    width: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the wick segments (lower wicks first, then upper wicks) and body quadrilaterals
+    of `n` candles in bulk.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Wicks of shape (2n, 2, 2) and bodies of shape (n, 4, 2).
+    """
+    n = len(x)
+    half = width / 2.0
+
+    bodies = np.empty((n, 4, 2))
+    bodies[:, 0:2, 0] = (x - half)[:, None]
+    bodies[:, 2:4, 0] = (x + half)[:, None]
+    bodies[:, 0, 1] = bodies[:, 3, 1] = opens
+    bodies[:, 1, 1] = bodies[:, 2, 1] = closes
+
+    wicks = np.empty((2 * n, 2, 2))
+    wicks[:, :, 0] = np.concatenate([x, x])[:, None]
+    wicks[:n, 0, 1], wicks[:n, 1, 1] = lows, np.minimum(opens, closes)
+    wicks[n:, 0, 1], wicks[n:, 1, 1] = highs, np.maximum(opens, closes)
+    return wicks, bodies
+
+
+def volume_vertices(x: np.ndarray, volumes: np.ndarray, width: float) -> np.ndarray:
+    """Computes the (n, 4, 2) rectangles of `n` volume bars."""
+    half = width / 2.0
+    bars = np.zeros((len(x), 4, 2))
+    bars[:, 0:2, 0] = (x - half)[:, None]
+    bars[:, 2:4, 0] = (x + half)[:, None]
+    bars[:, 1, 1] = bars[:, 2, 1] = volumes
+    return bars
+
+
+def candle_collections(x: np.ndarray, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                       up_color, down_color, width: float, linewidth: float, alpha: float = 0.9):
+    """
+    Builds every candle of a chart as two collections: one LineCollection for the wicks and
+    one PolyCollection for the bodies, with vertices computed in bulk.
+
+    Bars with a missing price are skipped. Bars with `open < close` use `up_color`.
+
+    Returns:
+        Tuple[LineCollection, PolyCollection]: The wicks and the bodies.
+    """
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    valid = np.isfinite(opens) & np.isfinite(highs) & np.isfinite(lows) & np.isfinite(closes)
+    x, opens, highs, lows, closes = x[valid], opens[valid], highs[valid], lows[valid], closes[valid]
+    wicks, bodies = candle_vertices(x, opens, highs, lows, closes, width)
+
+    up = opens < closes
+    edge = _updown_colors(up, up_color, down_color)
+    return (LineCollection(wicks, colors=np.concatenate([edge, edge]), linewidths=linewidth),
+            PolyCollection(bodies, facecolors=_updown_colors(up, up_color, down_color, alpha), edgecolors=edge,
+                           linewidths=linewidth))
+
+
+def volume_collection(x: np.ndarray, volumes: np.ndarray, up: np.ndarray, up_color, down_color, width: float,
+                      edgecolor='#FFFFFF', linewidth: float = 0.5):
+    """Builds the volume bars as a single PolyCollection, colored like their candles."""
+    from matplotlib.collections import PolyCollection
+
+    valid = np.isfinite(volumes)
+    x, volumes, up = x[valid], volumes[valid], up[valid]
+    return PolyCollection(volume_vertices(x, volumes, width), facecolors=_updown_colors(up, up_color, down_color),
+                          edgecolors=edgecolor, linewidths=linewidth)
+
+
+def _style_rc(style: Dict[str, Any]) -> Dict[str, Any]:
+    """Translates `mpf.make_mpf_style` arguments into the rcParams mplfinance would apply."""
+    rc = dict(style.get('rc') or {})
+    for key, param in (('facecolor', 'axes.facecolor'), ('edgecolor', 'axes.edgecolor'), ('figcolor', 'figure.facecolor'),
+                       ('figcolor', 'savefig.facecolor'), ('gridcolor', 'grid.color'), ('gridstyle', 'grid.linestyle')):
+        if style.get(key) is not None:
+            rc[param] = style[key]
+    rc['axes.grid.axis'] = 'both'
+    if style.get('gridcolor') is not None or style.get('gridstyle') is not None:
+        rc['axes.grid'] = True
+    return rc
+
+
+def _draw_addplot(ax, x: np.ndarray, spec: Dict[str, Any]) -> None:
+    import pandas as pd
+
+    data = spec['data']
+    columns = [data[c] for c in data.columns] if isinstance(data, pd.DataFrame) else [data]
+    kind = spec.get('type', 'line')
+    for values in columns:
+        values = np.asarray(values, dtype=float)
+        if kind == 'scatter':
+            ax.scatter(x, values, s=spec.get('markersize', 18), marker=spec.get('marker', 'o'), color=spec.get('color'),
+                       alpha=spec.get('alpha'))
+        elif kind == 'bar':
+            ax.bar(x, values, width=spec.get('width', 0.8), color=spec.get('color'), alpha=spec.get('alpha'))
+        elif kind == 'step':
+            ax.step(x, values, where='mid', color=spec.get('color'), linewidth=spec.get('width'), alpha=spec.get('alpha'))
+        elif kind == 'line':
+            ax.plot(x, values, color=spec.get('color'), linewidth=spec.get('width'), alpha=spec.get('alpha'))
+        else:
+            raise ValueError(f"engine='native' does not support addplot type '{kind}'.")
+
+
+def plot_candles(data, addplots: Sequence[Dict[str, Any]] = (), volume: bool = True, up_color='#4CAF50',
+                 down_color='#EF5350', style: Optional[Dict[str, Any]] = None, figsize=(12, 8),
+                 panel_ratios: Optional[List[float]] = None, ylabel: str = '', ylabel_lower: str = '',
+                 xrotation: float = 0, new_figure: Optional[Callable] = None, **kwargs):
+    """
+    Draws a candlestick chart with NumPy-built collections, as a fast alternative to `mpf.plot`.
+
+    Bars sit on integer x positions like with mplfinance, so code that post-processes
+    `mpf.plot` figures (fill_between over `np.arange(len(data))`, ...) works unchanged.
+
+    Args:
+        data (pd.DataFrame): Bars with a DatetimeIndex and 'Open', 'High', 'Low', 'Close' (and 'Volume') columns.
+        addplots (list): Overlays and extra panels as dicts with the keys of `mpf.make_addplot`
+                         ('data', 'type', 'panel', 'color', 'alpha', 'width', 'markersize', 'marker',
+                         'secondary_y', 'ylabel').
+        volume (bool): Draw the volume panel (panel 1).
+        up_color, down_color: Candle and volume colors.
+        style (dict): `mpf.make_mpf_style` arguments (facecolor, gridcolor, rc, ...), applied on top of
+                      Matplotlib's default style as mplfinance does.
+        figsize (tuple): Figure size.
+        panel_ratios (list): Relative panel heights.
+        ylabel, ylabel_lower (str): Labels of the price and volume panels.
+        xrotation (float): Rotation of the date labels.
+        new_figure (Callable): Figure factory, e.g. `Chart._figure`. Defaults to `plt.figure`.
+        **kwargs: `ylim`, `xlim`, `datetime_format`, `xlabel`.
+
+    Returns:
+        Tuple[Figure, List[Axes]]: The figure and one Axes per panel (plus a twin for panels
+        with `secondary_y` addplots, right after its primary).
+    """
+    import matplotlib
+
+    unsupported = set(kwargs) - set(NATIVE_KWARGS)
+    if unsupported:
+        raise TypeError(f"engine='native' does not support: {', '.join(sorted(unsupported))}. Use engine='mplfinance'.")
+    if new_figure is None:
+        import matplotlib.pyplot as plt
+        new_figure = plt.figure
+
+    n = len(data)
+    x = np.arange(n, dtype=float)
+    opens, highs, lows, closes = (data[c].to_numpy(dtype=float) for c in ('Open', 'High', 'Low', 'Close'))
+    candle_width, candle_linewidth, volume_width = candle_widths(n)
+
+    panel_ids = {0} | ({1} if volume else set()) | {spec.get('panel', 0) for spec in addplots}
+    n_panels = max(panel_ids) + 1
+    if panel_ratios is None:
+        ratios = [5] + [2] * (n_panels - 1)
+    elif len(panel_ratios) == n_panels:
+        ratios = list(panel_ratios)
+    elif len(panel_ratios) == 2:
+        ratios = [panel_ratios[0]] + [panel_ratios[1]] * (n_panels - 1)
+    else:
+        raise ValueError(f"panel_ratios has {len(panel_ratios)} entries for {n_panels} panels.")
+
+    with matplotlib.style.context(['default', _style_rc(style or {})]):
+        fig = new_figure(figsize=figsize)
+        height = 1.0 - _TOP - _BOTTOM
+        width = 1.0 - _LEFT - _RIGHT
+        panels, twins = [], {}
+        top = 1.0 - _TOP
+        for ratio in ratios:
+            panel_height = height * ratio / sum(ratios)
+            top -= panel_height
+            ax = fig.add_axes([_LEFT, top, width, panel_height], sharex=panels[0] if panels else None)
+            ax.set_axisbelow(True)
+            panels.append(ax)
+
+        main = panels[0]
+        for collection in candle_collections(x, opens, highs, lows, closes, up_color, down_color,
+                                             candle_width, candle_linewidth):
+            main.add_collection(collection)
+        if kwargs.get('ylim') is not None:
+            main.set_ylim(*kwargs['ylim'])
+        else:
+            low, high = np.nanmin(lows), np.nanmax(highs)
+            delta = 0.01 * (high - low)
+            main.set_ylim(max(0.9 * low, low - delta) if low > 0 else low - delta, high + delta)
+        if ylabel:
+            main.set_ylabel(ylabel)
+
+        if volume:
+            volumes = data['Volume'].to_numpy(dtype=float)
+            panels[1].add_collection(volume_collection(x, volumes, opens < closes, up_color, down_color, volume_width))
+            panels[1].set_ylim(0.3 * np.nanmin(volumes), 1.1 * np.nanmax(volumes))
+            panels[1].set_ylabel(ylabel_lower)
+
+        for spec in addplots:
+            panel = spec.get('panel', 0)
+            ax = panels[panel]
+            if spec.get('secondary_y') is True:
+                if panel not in twins:
+                    twins[panel] = ax.twinx()
+                    twins[panel].grid(False)
+                ax = twins[panel]
+            _draw_addplot(ax, x, spec)
+            if spec.get('ylabel'):
+                ax.set_ylabel(spec['ylabel'])
+
+        if kwargs.get('xlim') is not None:
+            main.set_xlim(*kwargs['xlim'])
+        else:
+            pad = 0.45 * ((n - 1) / n if n > 1 else 1.0) + (0.75 if n == 1 else 0.0)
+            main.set_xlim(-pad, n - 1 + pad)
+        formatter = IndexDateFormatter(data.index, kwargs.get('datetime_format') or datetime_format(data.index))
+        for ax in panels[:-1]:
+            ax.tick_params(axis='x', labelbottom=False)
+        panels[-1].xaxis.set_major_formatter(formatter)
+        panels[-1].tick_params(axis='x', rotation=xrotation)
+        if kwargs.get('xlabel'):
+            panels[-1].set_xlabel(kwargs['xlabel'])
+
+    axes = []
+    for i, ax in enumerate(panels):
+        axes.append(ax)
+        if i in twins:
+            axes.append(twins[i])
+    return fig, axes
@@ -0,0 +1,119 @@
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Narrowest candle `max_bars='auto'` lets through, in pixels at the resolution the chart is drawn at.
+MIN_BAR_PIXELS = 3
+
+# `max_bars='auto'` (the default of `candle` and `backtest`) draws frames up to this many bars bar by bar.
+AUTO_MIN_BARS = 2_000
+
+
+def ohlc_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of `data` with a DatetimeIndex (taken from a 'time' or 'date' column if needed)
+    and capitalized 'Open', 'High', 'Low', 'Close' and 'Volume' columns.
+    """
+    frame = data.copy()
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        if 'time' in frame.columns:
+            frame = frame.set_index('time')
+        elif 'date' in frame.columns:
+            frame = frame.set_index('date')
+        frame.index = pd.to_datetime(frame.index)
+    rename_map = {c: c.capitalize() for c in frame.columns if c.lower() in ['open', 'high', 'low', 'close', 'volume']}
+    return frame.rename(columns=rename_map)
+
+
+def auto_max_bars(panel_pixels: float, min_bar_pixels: float = MIN_BAR_PIXELS) -> int:
+    """Returns how many candles fit side by side in a price panel `panel_pixels` wide."""
+    return max(1, int(panel_pixels / min_bar_pixels))
+
+
+def bucket_starts(n: int, max_bars: Union[int, str, None],
+                  panel_pixels: Union[float, Callable[[], float], None] = None) -> Optional[np.ndarray]:
+    """
+    Splits `n` consecutive bars into at most `max_bars` buckets of equal length.
+
+    Args:
+        n (int): Number of bars.
+        max_bars (int or 'auto'): Maximum number of buckets. 'auto' fits the price panel (see
+            `auto_max_bars`) once there are more than `AUTO_MIN_BARS` bars. None disables aggregation.
+        panel_pixels (float or Callable): Width of the price panel in pixels at the render resolution,
+            for 'auto'. A callable is only called when it is needed.
+
+    Returns:
+        np.ndarray: Position of the first bar of each bucket, or None if no aggregation is needed.
+    """
+    if max_bars is None:
+        return None
+    if max_bars == 'auto':
+        if n <= AUTO_MIN_BARS:
+            return None
+        max_bars = auto_max_bars(panel_pixels() if callable(panel_pixels) else panel_pixels)
+    elif not isinstance(max_bars, (int, np.integer)) or max_bars < 1:
+        raise ValueError(f"max_bars must be a positive integer, 'auto' or None, not {max_bars!r}.")
+    if n <= max_bars:
+        return None
+    return np.arange(0, n, -(-n // max_bars))
+
+
+def _first_valid(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """First non-NaN value of each bucket (NaN for empty buckets)."""
+    n = len(values)
+    positions = np.where(np.isnan(values), n, np.arange(n))
+    first = np.minimum.reduceat(positions, starts)
+    ends = np.append(starts[1:], n)
+    return np.where(first < ends, values[np.minimum(first, n - 1)], np.nan)
+
+
+def _last_valid(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Last non-NaN value of each bucket (NaN for empty buckets)."""
+    positions = np.where(np.isnan(values), -1, np.arange(len(values)))
+    last = np.maximum.reduceat(positions, starts)
+    return np.where(last >= starts, values[np.maximum(last, 0)], np.nan)
+
+
+def aggregate_ohlcv(data: pd.DataFrame, starts: np.ndarray) -> pd.DataFrame:
+    """
+    Merges consecutive bars into OHLCV buckets: first open, highest high, lowest low, last close
+    and summed volume, each computed with one NumPy reduction over the bucket boundaries.
+    Missing values are skipped. Each bucket is labelled with the timestamp of its first bar.
+
+    Args:
+        data (pd.DataFrame): Bars with 'Open', 'High', 'Low', 'Close' and optionally 'Volume' columns.
+        starts (np.ndarray): Position of the first bar of each bucket (see `bucket_starts`).
+    """
+    columns = {
+        'Open': _first_valid(data['Open'].to_numpy(dtype=float), starts),
+        'High': np.fmax.reduceat(data['High'].to_numpy(dtype=float), starts),
+        'Low': np.fmin.reduceat(data['Low'].to_numpy(dtype=float), starts),
+        'Close': _last_valid(data['Close'].to_numpy(dtype=float), starts),
+    }
+    if 'Volume' in data.columns:
+        columns['Volume'] = np.add.reduceat(np.nan_to_num(data['Volume'].to_numpy(dtype=float)), starts)
+    return pd.DataFrame(columns, index=data.index[starts])
+
+
+def aggregate_like(values, starts: np.ndarray, index: pd.Index, how: str = 'last'):
+    """
+    Aligns an overlay, subplot or marker series to aggregated bars. By default each bucket keeps its
+    last valid value, so indicators end where their bucket's close does and sparse markers survive.
+
+    Args:
+        values (pd.Series, pd.DataFrame or array-like): One value per original bar.
+        starts (np.ndarray): Bucket boundaries (see `bucket_starts`).
+        index (pd.Index): Index of the aggregated bars.
+        how (str): 'last', 'min' (e.g. drawdowns keep their trough) or 'max'.
+    """
+    reduce = {'last': lambda v: _last_valid(v, starts), 'min': lambda v: np.fmin.reduceat(v, starts),
+              'max': lambda v: np.fmax.reduceat(v, starts)}[how]
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame({c: reduce(values[c].to_numpy(dtype=float)) for c in values.columns}, index=index)
+    if isinstance(values, pd.Series):
+        return pd.Series(reduce(values.to_numpy(dtype=float)), index=index, name=values.name)
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 2:
+        return np.column_stack([reduce(column) for column in values.T])
+    return reduce(values)
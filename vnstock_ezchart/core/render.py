@@ -0,0 +1,255 @@
+import contextvars
+import functools
+import io
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from .cache import Unfingerprintable, fingerprint, render_cache
+from .context import RC_LOCK, apply_font, close_figure, pyplot_context, scoped_font
+
+# Output formats accepted by the `output` argument of every chart method.
+OUTPUT_FORMATS = ('png', 'webp', 'rgba')
+
+# Matches the `savefig` defaults used by the gallery scripts and `render_batch`.
+DEFAULT_OUTPUT_DPI = 150
+
+# Resolution the chart being built will be rendered at, set by `chart_method` for `output=` calls.
+_RENDER_DPI = contextvars.ContextVar('vnstock_ezchart_render_dpi', default=None)
+
+
+def render_dpi() -> float:
+    """
+    Returns the resolution the chart being built will be drawn at: the `output_dpi` of an
+    `output=` call (`DEFAULT_OUTPUT_DPI` if not given), otherwise the figure dpi of the rcParams.
+    """
+    dpi = _RENDER_DPI.get()
+    if dpi is None:
+        import matplotlib
+
+        dpi = matplotlib.rcParams['figure.dpi']
+    return dpi
+
+
+def rendering_output() -> bool:
+    """Returns True while a chart method runs for an `output=` call, whose only result is the image."""
+    return _RENDER_DPI.get() is not None
+
+
+def _figure_of(result):
+    """Extracts the matplotlib Figure from whatever a chart method returned."""
+    from matplotlib.figure import Figure
+
+    if isinstance(result, Figure):
+        return result
+    if isinstance(result, (tuple, list)) and result:
+        return _figure_of(result[0])
+    if hasattr(result, 'figure'):
+        return result.figure
+    raise TypeError(f"Cannot find a figure in {type(result).__name__}")
+
+
+def _tight_pixel_box(bbox, dpi: float, height: int, width: int) -> Tuple[int, int, int, int]:
+    """Returns the (top, bottom, left, right) pixel rows/columns of `bbox` (in inches), clipped to the canvas."""
+    left = max(0, int(np.floor(bbox.x0 * dpi)))
+    right = min(width, int(np.ceil(bbox.x1 * dpi)))
+    # Agg rows run top-down while figure coordinates run bottom-up
+    top = max(0, int(np.floor(height - bbox.y1 * dpi)))
+    bottom = min(height, int(np.ceil(height - bbox.y0 * dpi)))
+    if right <= left or bottom <= top:
+        return 0, height, 0, width
+    return top, bottom, left, right
+
+
+def render_figure(fig, output: str = 'png', dpi: Optional[float] = None, tight: bool = True,
+                  pad_inches: float = 0.1, quality: int = 90, close: bool = True) -> Any:
+    """
+    Draws a figure once with Agg and returns it as encoded bytes or an RGBA array.
+
+    `savefig(bbox_inches='tight')` draws the figure twice: once to measure the tight bounding
+    box and once to render it. Here the figure is drawn once and the tight box is cropped out
+    of the Agg buffer. When artists stick out of the canvas (e.g. a suptitle placed above the
+    axes), the single draw goes to a canvas enlarged to the tight box instead.
+
+    Args:
+        fig (matplotlib.figure.Figure): The figure to render.
+        output (str): 'png' or 'webp' for encoded bytes, 'rgba' for a (height, width, 4) uint8 view of the Agg buffer.
+        dpi (float): Output resolution. Defaults to 150.
+        tight (bool): Crop to the tight bounding box of the figure's artists.
+        pad_inches (float): Padding kept around the tight bounding box.
+        quality (int): WebP quality (1-100).
+        close (bool): Close the figure (and release it from pyplot) afterwards.
+
+    Returns:
+        bytes or np.ndarray: The encoded image, or the RGBA pixel array.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output '{output}'. Choose one of: {', '.join(OUTPUT_FORMATS)}.")
+    # A figure kept open (close=False) gets its own dpi and canvas back afterwards
+    original_dpi, original_canvas = fig.dpi, fig.canvas
+    dpi = dpi or DEFAULT_OUTPUT_DPI
+    try:
+        with RC_LOCK.shared():
+            fig.set_dpi(dpi)
+            canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+            if not tight:
+                canvas.draw()
+                pixels = np.asarray(canvas.buffer_rgba())
+            else:
+                # Layout engines move artists during the draw, so measure those figures afterwards
+                drawn = fig.get_layout_engine() is not None
+                if drawn:
+                    canvas.draw()
+                bbox = fig.get_tightbbox(canvas.get_renderer())
+                width, height = fig.get_size_inches()
+                tolerance = 1.0 / fig.dpi
+                if bbox.x0 < -tolerance or bbox.y0 < -tolerance or bbox.x1 > width + tolerance or bbox.y1 > height + tolerance:
+                    # Artists stick out of the canvas: draw on a canvas enlarged to the padded box instead
+                    fig.savefig(io.BytesIO(), format='rgba', dpi=fig.dpi, bbox_inches=bbox.padded(pad_inches))
+                    pixels = np.asarray(canvas.buffer_rgba())
+                else:
+                    if not drawn:
+                        canvas.draw()
+                    pixels = np.asarray(canvas.buffer_rgba())
+                    top, bottom, left, right = _tight_pixel_box(bbox.padded(pad_inches), fig.dpi, pixels.shape[0], pixels.shape[1])
+                    pixels = pixels[top:bottom, left:right]
+    finally:
+        if close:
+            close_figure(fig)
+        else:
+            fig.set_dpi(original_dpi)
+            if fig.canvas is not original_canvas:
+                fig.set_canvas(original_canvas)
+
+    return encode_pixels(pixels if close else np.array(pixels), output, dpi, quality)
+
+
+def encode_pixels(pixels: np.ndarray, output: str = 'png', dpi: float = DEFAULT_OUTPUT_DPI, quality: int = 90) -> Any:
+    """Encodes an RGBA pixel array as 'png' or 'webp' bytes ('rgba' returns the array unchanged)."""
+    if output == 'rgba':
+        return pixels
+
+    from PIL import Image
+
+    image = Image.fromarray(np.ascontiguousarray(pixels), mode='RGBA')
+    buf = io.BytesIO()
+    if output == 'png':
+        image.save(buf, format='PNG', dpi=(dpi, dpi))
+    else:
+        image.save(buf, format='WEBP', quality=quality, method=4)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version() -> str:
+    from importlib import metadata
+
+    try:
+        return metadata.version('vnstock_ezchart')
+    except metadata.PackageNotFoundError:
+        return 'dev'
+
+
+# rcParams groups that change how a chart is drawn (unlike e.g. `backend`, `keymap.*` or `webagg.*`).
+_RENDER_RC_PREFIXES = ('agg.', 'axes.', 'boxplot.', 'contour.', 'errorbar.', 'figure.', 'font.', 'grid.', 'hatch.',
+                       'image.', 'legend.', 'lines.', 'markers.', 'mathtext.', 'patch.', 'path.', 'pcolor', 'savefig.',
+                       'scatter.', 'text.', 'xtick.', 'ytick.')
+
+
+def _render_rc_params() -> str:
+    """The current values of the rcParams that affect rendering, as a string for cache keys."""
+    import matplotlib
+
+    rc = matplotlib.rcParams
+    # dict.__getitem__ skips the deprecation checks of RcParams lookups
+    return repr([(key, dict.__getitem__(rc, key)) for key in sorted(rc) if key.startswith(_RENDER_RC_PREFIXES)])
+
+
+def render_cache_key(cls, method_name: str, args, kwargs, output: str, dpi: Optional[float], tight: bool) -> Optional[str]:
+    """
+    Returns the render cache key of a chart call, or None if the call cannot be cached.
+
+    The key covers the input data buffers, the keyword arguments, the output settings, the
+    effective theme (including `theme_context` overrides and the logo file's mtime), the
+    live rcParams that affect rendering (fonts, sizes, colors, the color cycle, ...) and the
+    package and Matplotlib versions.
+    """
+    import matplotlib
+    from .assets import _logo_source_key
+
+    if kwargs.get('palette_shuffle'):
+        return None
+    logo = cls._global_logo_path
+    try:
+        logo = _logo_source_key(logo) if logo else None
+    except OSError:
+        pass
+    context = (method_name, output, dpi or DEFAULT_OUTPUT_DPI, bool(tight), cls._global_theme, logo,
+               scoped_font() or cls._global_font, cls._global_lang, _render_rc_params(),
+               _package_version(), matplotlib.__version__)
+    try:
+        return fingerprint(context, args, kwargs)
+    except Unfingerprintable:
+        return None
+
+
+def chart_method(method=None, *, exclusive: bool = False):
+    """
+    Decorator for the public chart methods.
+
+    It runs the method under the rcParams lock, so charts can be built from several threads:
+    shared for methods that only read rcParams, exclusive for those whose libraries modify
+    them (mplfinance, seaborn grids). Fonts from an active `theme_context` are applied to
+    the figure's texts.
+
+    The `pyplot` keyword argument (True/False) overrides `Chart.set_pyplot` for one call.
+
+    It also adds the `output` keyword argument. With `output='png'|'webp'|'rgba'` the chart
+    is rendered once with Agg and the method returns the encoded bytes (or the RGBA array)
+    instead of the figure, which is closed. `output_dpi` and `output_tight` control the
+    resolution and cropping (see `render_figure`); the method can read the resolution with
+    `render_dpi`.
+
+    When the render cache is enabled (`Chart.set_render_cache`), `output=` calls whose data,
+    arguments and theme match an earlier call return the cached image without drawing.
+    `cache=False` skips the cache for one call.
+    """
+    if method is None:
+        return functools.partial(chart_method, exclusive=exclusive)
+
+    @functools.wraps(method)
+    def wrapper(cls, *args, **kwargs):
+        output = kwargs.pop('output', None)
+        if output is not None and output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output '{output}'. Choose one of: {', '.join(OUTPUT_FORMATS)}.")
+        dpi = kwargs.pop('output_dpi', None)
+        tight = kwargs.pop('output_tight', True)
+        pyplot = kwargs.pop('pyplot', None)
+        use_cache = kwargs.pop('cache', True)
+        if output is not None:
+            kwargs['show'] = False
+            # The figure never outlives this call, so keep it out of pyplot's registry
+            pyplot = False if pyplot is None else pyplot
+        with pyplot_context(pyplot), (RC_LOCK.exclusive() if exclusive else RC_LOCK.shared()):
+            cache = render_cache() if output is not None and use_cache else None
+            key = render_cache_key(cls, method.__name__, args, kwargs, output, dpi, tight) if cache else None
+            if key:
+                image = cache.get(key, output)
+                if image is not None:
+                    return image
+            token = _RENDER_DPI.set(dpi or DEFAULT_OUTPUT_DPI) if output is not None else None
+            try:
+                result = method(cls, *args, **kwargs)
+            finally:
+                if token is not None:
+                    _RENDER_DPI.reset(token)
+            font_name = scoped_font()
+            if font_name:
+                apply_font(_figure_of(result), font_name)
+            if output is None:
+                return result
+            image = render_figure(_figure_of(result), output=output, dpi=dpi, tight=tight)
+            return cache.put(key, output, image) if key else image
+    return wrapper
@@ -0,0 +1,108 @@
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached, fingerprint
+
+MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def drawdown(values: np.ndarray) -> np.ndarray:
+    """
+    Relative distance of each value below its running maximum (0 at new highs, NaN where `values` is NaN).
+    A 2-D array holds one curve per column; all of them are computed in one accumulate along the time axis.
+    """
+    values = np.asarray(values, dtype=float)
+    running_max = np.fmax.accumulate(values, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (values - running_max) / running_max
+
+
+def drawdown_series(data: Union[pd.Series, pd.DataFrame]) -> Union[pd.Series, pd.DataFrame]:
+    """
+    `drawdown` of a Series, or of every column of a DataFrame. Not cached: one accumulate costs less
+    than hashing the values for a cache key.
+    """
+    result = drawdown(data.to_numpy(dtype=float))
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(result, index=data.index, columns=data.columns, copy=False)
+    return pd.Series(result, index=data.index, name=data.name)
+
+
+def final_values(values: np.ndarray) -> np.ndarray:
+    """Last valid value of each column of a 2-D array (NaN for columns without any)."""
+    values = np.asarray(values, dtype=float)
+    if not len(values):
+        return np.full(values.shape[1], np.nan)
+    last = len(values) - 1 - np.argmax(~np.isnan(values[::-1]), axis=0)
+    return values[last, np.arange(values.shape[1])]
+
+
+def _month_codes(index) -> np.ndarray:
+    index = pd.DatetimeIndex(index)
+    return index.year.to_numpy(dtype=np.int64) * 12 + index.month.to_numpy(dtype=np.int64) - 1
+
+
+def monthly_tables(values: np.ndarray, index) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Year x month returns of every column of `values` (periodic returns on the timestamps of `index`).
+
+    Series with several observations in some month are compounded per month as expm1 of the summed
+    log1p returns (one `reduceat` over the month boundaries, NaNs skipped); series with at most one
+    observation per month (monthly or coarser) are laid out as is. Months without data are NaN.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The years present, and tables[column, year, month - 1].
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    codes = _month_codes(index)
+    if len(codes) == 0:
+        return np.empty(0, dtype=np.int32), np.empty((values.shape[1], 0, 12))
+    if (np.diff(codes) < 0).any():
+        order = np.argsort(codes, kind='stable')
+        codes, values = codes[order], values[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    months = codes[starts]
+    if len(starts) == len(codes):
+        monthly = values
+    else:
+        valid = ~np.isnan(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sums = np.add.reduceat(np.log1p(np.where(valid, values, 0.0)), starts, axis=0)
+        monthly = np.where(np.add.reduceat(valid, starts, axis=0) > 0, np.expm1(sums), np.nan)
+    years, rows = np.unique(months // 12, return_inverse=True)
+    tables = np.full((values.shape[1], len(years), 12), np.nan)
+    tables[:, rows, months % 12] = monthly.T
+    return years.astype(np.int32), tables
+
+
+def monthly_returns(data: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Year x month table of returns (columns 'Jan'..'Dec') of a returns Series, see `monthly_tables`.
+
+    A DataFrame with one column per ticker gives all their tables in one pass, stacked under a
+    (ticker, Year) MultiIndex; `result.loc['FPT']` is the table of one ticker.
+    Cached per input in the derived-data cache.
+    """
+    values = data.to_numpy(dtype=float)
+    years, tables = cached('monthly_returns', fingerprint(values, data.index), (),
+                           lambda: monthly_tables(values, data.index))
+    if isinstance(data, pd.Series):
+        return pd.DataFrame(tables[0].copy(), index=pd.Index(years, name='Year'), columns=MONTH_LABELS)
+    index = pd.MultiIndex.from_product([data.columns, years], names=[data.columns.name or 'Ticker', 'Year'])
+    return pd.DataFrame(tables.reshape(-1, 12).copy(), index=index, columns=MONTH_LABELS)
+
+
+def sparkline_values(data, window: int = 30) -> Tuple[np.ndarray, float, float]:
+    """
+    Values of a sparkline and their (min, max). A Series is used as is; a price DataFrame contributes the
+    last `window` values of its 'Close' column.
+    """
+    if isinstance(data, pd.DataFrame):
+        columns = {str(c).lower(): c for c in data.columns}
+        data = data[columns.get('close', data.columns[0])].iloc[-window:]
+    spark = np.array(data, dtype=float)
+    return spark, float(np.nanmin(spark)), float(np.nanmax(spark))
@@ -0,0 +1,166 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Metrics of `rolling_risk`, in panel order.
+RISK_METRICS = ('sharpe', 'volatility', 'beta', 'max_drawdown')
+
+
+def _prefix_sums(values: np.ndarray) -> np.ndarray:
+    """Cumulative sums along the time axis with a leading row of zeros, so window sums are differences."""
+    sums = np.zeros((values.shape[0] + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=sums[1:])
+    return sums
+
+
+def _window_sums(sums: np.ndarray, window: int) -> np.ndarray:
+    """Trailing `window`-bar sums from `_prefix_sums` (NaN until the first full window)."""
+    out = np.full((sums.shape[0] - 1,) + sums.shape[1:], np.nan)
+    if window < sums.shape[0]:
+        out[window - 1:] = sums[window:] - sums[:-window]
+    return out
+
+
+def _rolling_max_drawdowns(levels: np.ndarray, windows: Sequence[int]) -> Dict[int, np.ndarray]:
+    """
+    Largest drop from a running peak within each run of `window` + 1 consecutive `levels` (log equity),
+    for the run ending at every bar, for every window.
+
+    The (max, min, drop) of two adjacent runs combine as (max, min, min(drop, drop, min_right - max_left)),
+    so each window is assembled from power-of-two runs built by doubling: O(n log window) array operations
+    across all columns at once instead of a loop per bar, and the doubling is shared by all windows.
+    """
+    n = len(levels) - 1
+    out = {window: np.full((n,) + levels.shape[1:], np.nan) for window in windows}
+    # Windows are assembled right to left: (run of points so far, accumulated (max, min, drop))
+    pending = {window: (0, None) for window in windows if window + 1 <= len(levels)}
+    if not pending:
+        return out
+    high, low, drop = levels, levels, np.zeros_like(levels)
+    size, longest = 1, max(pending) + 1
+    while True:
+        for window, (length, acc) in pending.items():
+            points = window + 1
+            if points & size:
+                # Prepend the run of `size` points that ends where the assembled suffix begins
+                offset, starts = points - length - size, len(levels) - points + 1
+                block = (high[offset:offset + starts], low[offset:offset + starts], drop[offset:offset + starts])
+                if acc is not None:
+                    block = (np.maximum(block[0], acc[0]), np.minimum(block[1], acc[1]),
+                             np.minimum(np.minimum(block[2], acc[2]), acc[1] - block[0]))
+                pending[window] = (length + size, block)
+        if size * 2 > longest:
+            break
+        # Runs of 2 * size points from runs of size points
+        m = len(high) - size
+        high, low, drop = (np.maximum(high[:m], high[size:]), np.minimum(low[:m], low[size:]),
+                           np.minimum(np.minimum(drop[:m], drop[size:]), low[size:] - high[:m]))
+        size *= 2
+    for window, (_, acc) in pending.items():
+        out[window][window - 1:] = np.expm1(acc[2])
+    return out
+
+
+def rolling_risk(returns: np.ndarray, windows: Sequence[int] = (63,), benchmark: Optional[np.ndarray] = None,
+                 periods_per_year: int = 252, risk_free: float = 0.0) -> Dict[Tuple[str, int], np.ndarray]:
+    """
+    Rolling Sharpe ratio, volatility, beta and maximum drawdown of many return series at once.
+
+    Sums and sums of squares over every window are differences of one set of cumulative sums, shared by
+    all metrics and windows, so each metric costs O(n) per series whatever the window. Returns are
+    centered on their mean first to keep the running sums precise. A window with a missing return (or
+    missing benchmark return, for beta) is NaN.
+
+    Args:
+        returns (np.ndarray): Periodic returns, (n_bars,) or (n_bars, n_series).
+        windows (Sequence[int]): Window lengths in bars, e.g. (63, 126, 252).
+        benchmark (np.ndarray): Benchmark returns on the same bars, (n_bars,). Beta is left out without it.
+        periods_per_year (int): Bars per year, to annualize volatility and Sharpe ratio.
+        risk_free (float): Annual risk-free rate subtracted from the mean return of the Sharpe ratio.
+
+    Returns:
+        Dict[Tuple[str, int], np.ndarray]: (metric, window) -> values shaped like `returns`. Volatility is
+        annualized, maximum drawdown is a negative fraction of the window's peak equity.
+    """
+    returns = np.asarray(returns, dtype=float)
+    missing = np.isnan(returns)
+    center = np.nanmean(returns, axis=0) if (~missing).any() else 0.0
+    centered = np.where(missing, 0.0, returns - center)
+    sums, squares = _prefix_sums(centered), _prefix_sums(centered * centered)
+    gaps = _prefix_sums(missing.astype(float))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        levels = _prefix_sums(np.log1p(np.where(missing, 0.0, returns)))
+    if benchmark is not None:
+        benchmark = np.asarray(benchmark, dtype=float)
+        if len(benchmark) != len(returns):
+            raise ValueError("`benchmark` must have one return per bar of the returns.")
+        bench_missing = np.isnan(benchmark)
+        bench = np.where(bench_missing, 0.0, benchmark - (np.nanmean(benchmark) if (~bench_missing).any() else 0.0))
+        if returns.ndim == 2:
+            bench, bench_missing = bench[:, None], bench_missing[:, None]
+        bench_sums, bench_squares = _prefix_sums(bench), _prefix_sums(bench * bench)
+        cross = _prefix_sums(centered * bench)
+        bench_gaps = _prefix_sums((missing | bench_missing).astype(float))
+
+    windows = [int(window) for window in windows]
+    if any(window < 2 for window in windows):
+        raise ValueError("Rolling windows need at least 2 bars.")
+    drawdowns = _rolling_max_drawdowns(levels, windows)
+    result = {}
+    scale = np.sqrt(periods_per_year)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for window in windows:
+            invalid = _window_sums(gaps, window) != 0
+            total = _window_sums(sums, window)
+            variance = np.maximum(_window_sums(squares, window) - total * total / window, 0.0) / (window - 1)
+            std = np.sqrt(variance)
+            mean = total / window + center
+            volatility = std * scale
+            sharpe = (mean - risk_free / periods_per_year) / std * scale
+            drawdown = drawdowns[window]
+            for values in (volatility, sharpe, drawdown):
+                values[invalid] = np.nan
+            result[('sharpe', window)] = sharpe
+            result[('volatility', window)] = volatility
+            if benchmark is not None:
+                bench_total = _window_sums(bench_sums, window)
+                covariance = _window_sums(cross, window) - total * bench_total / window
+                beta = covariance / (_window_sums(bench_squares, window) - bench_total * bench_total / window)
+                beta[_window_sums(bench_gaps, window) != 0] = np.nan
+                result[('beta', window)] = beta
+            result[('max_drawdown', window)] = drawdown
+    return result
+
+
+def risk_inputs(data, benchmark=None) -> Tuple[np.ndarray, Optional[np.ndarray], pd.Index, Optional[pd.Index]]:
+    """
+    Splits returns and a benchmark into the arrays of `rolling_risk`, the index of the bars and the
+    tickers (None for a single series). A benchmark Series is aligned to the index of `data` first.
+    """
+    if isinstance(benchmark, pd.DataFrame):
+        benchmark = benchmark.iloc[:, 0]
+    if isinstance(benchmark, pd.Series) and isinstance(data, (pd.Series, pd.DataFrame)):
+        benchmark = benchmark.reindex(data.index)
+    values = np.asarray(data, dtype=float)
+    index = data.index if isinstance(data, (pd.Series, pd.DataFrame)) else pd.RangeIndex(len(values))
+    tickers = None
+    if values.ndim == 2:
+        tickers = data.columns if isinstance(data, pd.DataFrame) else pd.RangeIndex(values.shape[1])
+    return values, None if benchmark is None else np.asarray(benchmark, dtype=float), index, tickers
+
+
+def risk_frame(metrics: Dict[Tuple[str, int], np.ndarray], index: pd.Index, tickers: Optional[pd.Index] = None) -> pd.DataFrame:
+    """Lays `rolling_risk` results out with (metric, window) columns, or (metric, window, ticker) ones."""
+    if tickers is None:
+        return pd.DataFrame({key: values for key, values in metrics.items()}, index=index)
+    columns = pd.MultiIndex.from_tuples([key + (ticker,) for key in metrics for ticker in tickers],
+                                        names=['metric', 'window', tickers.name or 'Ticker'])
+    return pd.DataFrame(np.concatenate(list(metrics.values()), axis=1), index=index, columns=columns)
+
+
+def rolling_risk_frame(data, windows: Sequence[int] = (63,), benchmark=None, periods_per_year: int = 252,
+                       risk_free: float = 0.0) -> pd.DataFrame:
+    """`rolling_risk` of a returns Series or DataFrame (one column per ticker), see `risk_frame`."""
+    values, benchmark, index, tickers = risk_inputs(data, benchmark)
+    return risk_frame(rolling_risk(values, windows, benchmark, periods_per_year, risk_free), index, tickers)
@@ -0,0 +1,126 @@
+from typing import Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .trades import bar_positions, check_snap_mode, trades_frame
+
+EQUITY_COLUMNS = ('equity', 'portfolio_value', 'capital', 'cumulative_return', 'return')
+DRAWDOWN_COLUMNS = ('drawdown', 'dd')
+
+
+def portfolio_frame(portfolio: pd.DataFrame) -> pd.DataFrame:
+    """Returns `portfolio` indexed by its time (a DatetimeIndex, or a 'time'/'date' column)."""
+    frame = portfolio.copy()
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        time_col = next((c for c in frame.columns if str(c).lower() in ['time', 'date']), None)
+        if time_col:
+            frame = frame.set_index(time_col)
+        frame.index = pd.to_datetime(frame.index)
+    return frame
+
+
+def portfolio_columns(frame: pd.DataFrame) -> Tuple[Any, Any]:
+    """Returns the names of the equity and drawdown columns of a portfolio frame (None when missing)."""
+    return (next((c for c in frame.columns if str(c).lower() in EQUITY_COLUMNS), None),
+            next((c for c in frame.columns if str(c).lower() in DRAWDOWN_COLUMNS), None))
+
+
+class StrategyComparison:
+    """
+    Trades and portfolios of several strategies aligned to the bars of one chart.
+
+    Attributes:
+        names (list): Strategy names, in the order given.
+        equity (pd.DataFrame): One equity column per strategy with values on the chart's bars (None if there is none).
+        drawdown (pd.DataFrame): Same for the drawdown.
+        positions (np.ndarray): Bar position of every placed trade.
+        prices (np.ndarray): Trade prices.
+        sides (np.ndarray): +1 for buys, -1 for sells.
+        strategy (np.ndarray): Index into `names` of each trade's strategy.
+        dropped (int): Number of buy/sell trades that could not be placed on a bar.
+    """
+    def __init__(self, names: List[str], equity: Optional[pd.DataFrame], drawdown: Optional[pd.DataFrame],
+                 positions: np.ndarray, prices: np.ndarray, sides: np.ndarray, strategy: np.ndarray, dropped: int):
+        self.names = names
+        self.equity = equity
+        self.drawdown = drawdown
+        self.positions = positions
+        self.prices = prices
+        self.sides = sides
+        self.strategy = strategy
+        self.dropped = dropped
+
+
+def align_strategies(strategies: Mapping[str, Any], index: pd.DatetimeIndex, snap: str = 'exact') -> StrategyComparison:
+    """
+    Aligns many strategies to the bars of `index` in one pass: the equity and drawdown columns of
+    all portfolios are concatenated, reindexed and forward-filled together, and all trades are
+    placed with a single `bar_positions` call.
+
+    Args:
+        strategies (Mapping): Strategy name -> (trades, portfolio). Either may be None, and a value may
+            also be a dict with 'trades' and 'portfolio' keys. Trades and portfolios take the formats
+            of `backtest`'s `trades` and `portfolio` arguments.
+        index (pd.DatetimeIndex): Bars of the chart.
+        snap (str): Placement of trades between bars (see `core.trades.SNAP_MODES`).
+    """
+    check_snap_mode(snap)
+    names = [str(name) for name in strategies]
+    equities, drawdowns, trade_frames = {}, {}, []
+    for i, (name, value) in enumerate(zip(names, strategies.values())):
+        if isinstance(value, dict):
+            trades, portfolio = value.get('trades'), value.get('portfolio')
+        else:
+            trades, portfolio = value
+        if portfolio is not None:
+            frame = portfolio_frame(portfolio)
+            eq_col, dd_col = portfolio_columns(frame)
+            if eq_col is not None:
+                equities[name] = frame[eq_col]
+            if dd_col is not None:
+                drawdowns[name] = frame[dd_col]
+        if trades is not None:
+            frame = trades_frame(trades)
+            trade_frames.append(frame[frame['side'].to_numpy() != 0].assign(strategy=i))
+
+    def aligned(columns):
+        if not columns:
+            return None
+        # One outer-joined frame, reindexed and forward-filled for every strategy at once;
+        # strategies with no value on any bar are left out
+        frame = pd.concat(columns, axis=1).reindex(index).ffill().dropna(axis=1, how='all')
+        return frame.reindex(columns=[n for n in names if n in frame.columns]) if len(frame.columns) else None
+
+    if trade_frames:
+        trades = pd.concat(trade_frames, ignore_index=True)
+        positions = bar_positions(pd.DatetimeIndex(trades['time']), index, snap)
+    else:
+        trades, positions = trades_frame(None).assign(strategy=0), np.empty(0, dtype=np.intp)
+    placed = positions >= 0
+    return StrategyComparison(names, aligned(equities), aligned(drawdowns), positions[placed],
+                              trades['price'].to_numpy()[placed], trades['side'].to_numpy()[placed],
+                              trades['strategy'].to_numpy()[placed], int((~placed).sum()))
+
+
+def strategy_colors(palette: List[str], n: int) -> list:
+    """
+    Colors for `n` strategies: the palette itself when it is long enough, otherwise `n` colors
+    sampled evenly from a colormap running through the palette.
+    """
+    if n <= len(palette):
+        return list(palette[:n])
+    from matplotlib.colors import LinearSegmentedColormap
+
+    return [tuple(c) for c in LinearSegmentedColormap.from_list('strategies', palette)(np.linspace(0, 1, n))]
+
+
+def line_segments(values: np.ndarray, x: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Turns an (n_bars, n_lines) matrix into the (n_lines, n_bars, 2) vertices of a LineCollection,
+    at x-coordinates `x` (bar positions by default; an (n_bars, n_lines) matrix gives each line its own).
+    """
+    segments = np.empty((values.shape[1], values.shape[0], 2))
+    segments[:, :, 0] = np.arange(values.shape[0]) if x is None else (x.T if np.ndim(x) == 2 else x)
+    segments[:, :, 1] = values.T
+    return segments
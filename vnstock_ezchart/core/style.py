@@ -5,21 +5,24 @@ import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 from ..config import *
 from ..utils import Utils
+from .assets import configure_asset_cache, get_logo, logo_pixel_size, register_font
+from .cache import configure_derived_cache, configure_render_cache, derived_cache, render_cache
+from .context import (PYPLOT_LOCK, RC_LOCK, ThemeSetting, apply_font, close_figure, new_figure, new_subplots,
+                      pyplot_context, pyplot_enabled, rc_scope, set_global_theme, set_pyplot, theme_context)
+from .heatmap import set_raster_threshold
 import matplotlib.ticker as mticker
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 class StyleMixin:
-        _global_theme = 'vnstock'
-        _global_logo_path = DEFAULT_LOGO_PATH
-        _global_font = None
-        _global_lang = 'vi'
+        # Global theme, overridable per thread/task with `theme_context`
+        _global_theme = ThemeSetting('theme_name')
+        _global_logo_path = ThemeSetting('logo_path', DEFAULT_LOGO_PATH)
+        _global_font = ThemeSetting('font_name')
+        _global_lang = ThemeSetting('lang')
         _NON_PLOT_KWARGS = {'show', 'savefig', 'logo_position', 'lang'}
 
         @staticmethod
@@ -38,26 +41,223 @@ class StyleMixin:
                 font_name (str): Name of the font to apply globally.
                 lang (str): Global language for labels ('vi' or 'en'). Defaults to 'vi'.
             """
-            cls._global_theme = theme_name
-            cls._global_logo_path = logo_path
-            cls._global_lang = lang
-        
-            # Embedding the default Inter font if available
-            import os
-            from matplotlib import font_manager
-        
-            inter_path = os.path.join(BASE_DIR, 'assets', 'fonts', 'Inter-Regular.ttf')
-            if os.path.exists(inter_path):
-                try:
-                    font_manager.fontManager.addfont(inter_path)
-                    if not font_name:
-                        font_name = 'Inter'
-                except Exception:
-                    pass
+            # Embedding the default Inter font if available (registered once per process)
+            if cls._register_inter() and not font_name:
+                font_name = 'Inter'
 
-            cls._global_font = font_name
+            set_global_theme(theme_name=theme_name, logo_path=logo_path, font_name=font_name, lang=lang)
             if font_name:
-                plt.rcParams['font.family'] = font_name
+                with RC_LOCK.exclusive():
+                    plt.rcParams['font.family'] = font_name
+        @staticmethod
+        def _register_inter() -> bool:
+            inter_path = os.path.join(BASE_DIR, 'assets', 'fonts', 'Inter-Regular.ttf')
+            if not os.path.exists(inter_path):
+                return False
+            try:
+                register_font(inter_path)
+                return True
+            except Exception:
+                return False
+        @classmethod
+        def theme_context(cls, **theme):
+            """
+            Overrides the global theme for the charts drawn inside a `with` block, in the current thread
+            (or asyncio task) only. Use it to render charts with different themes from several threads.
+
+            Args:
+                theme_name (str): Name of the color palette (e.g., 'vnstock', 'flatui').
+                logo_path (str): Path or URL to the logo image. None disables the logo.
+                font_name (str): Font family for the charts' texts.
+                lang (str): Language for labels ('vi' or 'en').
+
+            Example:
+                >>> with Chart.theme_context(theme_name='minimal', lang='en'):
+                ...     png = Chart.line(df, output='png')
+            """
+            if theme.get('font_name') == 'Inter':
+                cls._register_inter()
+            return theme_context(**theme)
+        @staticmethod
+        def set_pyplot(enabled: bool = True):
+            """
+            Chooses how chart figures are created.
+
+            With pyplot (the default) figures are registered with `matplotlib.pyplot`, so notebooks
+            display them and `plt.show()` works, but they stay in memory until `plt.close(fig)`.
+            Without pyplot, charts are plain `Figure` objects with an Agg canvas that the garbage
+            collector frees once the caller drops them, which suits long-running services.
+            A single call can also pass `pyplot=False`; `output=...` calls never use pyplot.
+
+            Args:
+                enabled (bool): True to create figures through pyplot, False to bypass it.
+            """
+            set_pyplot(enabled)
+        @staticmethod
+        def _subplots(*args, **kwargs):
+            """`plt.subplots`, guarded against concurrent figure creation, or a pyplot-free equivalent (see `set_pyplot`)."""
+            if not pyplot_enabled():
+                return new_subplots(*args, **kwargs)
+            with PYPLOT_LOCK:
+                return plt.subplots(*args, **kwargs)
+        @staticmethod
+        def _figure(**kwargs):
+            """`plt.figure`, guarded against concurrent figure creation, or a pyplot-free equivalent (see `set_pyplot`)."""
+            if not pyplot_enabled():
+                return new_figure(**kwargs)
+            with PYPLOT_LOCK:
+                return plt.figure(**kwargs)
+        @staticmethod
+        def _detach(fig):
+            """Removes a figure that a library (mplfinance, seaborn grids) created through pyplot from its registry when pyplot is disabled."""
+            if not pyplot_enabled():
+                close_figure(fig)
+            return fig
+        @classmethod
+        def _plot_candles(cls, data, engine: str, addplots: list, style: dict, up_color, down_color, plot_kwargs: dict):
+            """
+            Draws the candlestick panels of `candle` and `backtest` with mplfinance or the native engine
+            (`core.native.plot_candles`). Addplots are `mpf.make_addplot` arguments as dicts, and
+            `style` holds the `mpf.make_mpf_style` arguments. Must run inside `rc_scope()`.
+            """
+            plot_kwargs = {'type': 'candle', 'returnfig': True, 'tight_layout': True, **plot_kwargs}
+            if engine == 'native':
+                from .native import plot_candles
+
+                if plot_kwargs.pop('type') != 'candle':
+                    raise ValueError("engine='native' only draws candlesticks.")
+                for key in ('title', 'returnfig'):
+                    plot_kwargs.pop(key, None)
+                return plot_candles(data, addplots, up_color=up_color, down_color=down_color, style=style,
+                                    new_figure=cls._figure, **plot_kwargs)
+
+            import mplfinance as mpf
+
+            if 'style' not in plot_kwargs:
+                mc = mpf.make_marketcolors(up=up_color, down=down_color, edge='inherit', wick='inherit', volume='in', ohlc='inherit')
+                plot_kwargs['style'] = mpf.make_mpf_style(marketcolors=mc, **style)
+            if addplots:
+                plot_kwargs['addplot'] = [mpf.make_addplot(spec['data'], **{k: v for k, v in spec.items() if k != 'data'})
+                                          for spec in addplots]
+            fig, axes = mpf.plot(data, **plot_kwargs)
+            cls._detach(fig)
+            return fig, axes
+        @classmethod
+        def _price_panel_pixels(cls, data, engine: str, addplots: list, style: dict, up_color, down_color, plot_kwargs: dict) -> float:
+            """
+            Width in pixels, at `render_dpi()`, of the price panel `_plot_candles` lays out for these arguments.
+
+            It is measured on a throwaway figure of two buckets of `data`: the layout depends on the panels,
+            labels and value ranges, not on the number of bars.
+            """
+            from .ohlc import aggregate_like, aggregate_ohlcv
+            from .render import render_dpi
+
+            starts = np.array([0, len(data) // 2])
+            probe = aggregate_ohlcv(data, starts)
+            specs = [{**spec, 'data': aggregate_like(spec['data'], starts, probe.index)} for spec in addplots]
+            with pyplot_context(False), rc_scope():
+                fig, axes = cls._plot_candles(probe, engine, specs, style, up_color, down_color, dict(plot_kwargs))
+            try:
+                return axes[0].get_position().width * fig.get_figwidth() * render_dpi()
+            finally:
+                close_figure(fig)
+        @staticmethod
+        def _use_palette(ax, palette, plot_kwargs: dict, n_colors: int, key: str = 'color') -> dict:
+            """
+            Scopes a palette to one chart: sets the axes' own color cycle and passes explicit colors to
+            pandas, which would otherwise read the process-wide `axes.prop_cycle` rcParam.
+            """
+            if not palette:
+                return plot_kwargs
+            ax.set_prop_cycle(color=palette)
+            if key in plot_kwargs or 'colormap' in plot_kwargs:
+                return plot_kwargs
+            return {**plot_kwargs, key: [palette[i % len(palette)] for i in range(max(n_colors, 1))]}
+        @staticmethod
+        def set_asset_cache(cache_dir: Optional[str] = None, offline: Optional[bool] = None, max_age: Optional[float] = None):
+            """
+            Configures the persistent cache for remote assets (URL logos and fonts from `Utils.download_font`).
+
+            Args:
+                cache_dir (str): Cache directory. Defaults to `$VNSTOCK_EZCHART_CACHE_DIR` or `~/.cache/vnstock_ezchart`.
+                offline (bool): Never access the network; only serve assets that are already cached.
+                    Can also be enabled with the `VNSTOCK_EZCHART_OFFLINE=1` environment variable.
+                max_age (float): Seconds before a cached asset is revalidated with the server. Defaults to one day.
+            """
+            configure_asset_cache(cache_dir=cache_dir, offline=offline, max_age=max_age)
+        @staticmethod
+        def set_render_cache(enabled: bool = True, max_bytes: int = 64 << 20, disk: bool = False,
+                             cache_dir: Optional[str] = None, max_disk_bytes: int = 512 << 20):
+            """
+            Caches the images returned by `output=...` calls, keyed by their data, arguments and theme.
+
+            Dashboards that request the same chart repeatedly get the encoded bytes back without
+            re-running Matplotlib. Calls with `palette_shuffle=True` or arguments that cannot be
+            hashed (e.g. an existing `ax`) are always drawn. Pass `cache=False` to skip it once.
+
+            Args:
+                enabled (bool): False disables the cache and drops its memory tier.
+                max_bytes (int): Memory budget for cached images. Defaults to 64 MB.
+                disk (bool): Also keep PNG/WebP images on disk, shared with restarted processes.
+                cache_dir (str): Directory for the disk tier. Defaults to `renders/` in the asset cache directory.
+                max_disk_bytes (int): Disk budget for cached images. Defaults to 512 MB.
+
+            Example:
+                >>> Chart.set_render_cache(max_bytes=128 << 20, disk=True)
+                >>> png = Chart.candle(df, title='FPT', output='png')  # drawn
+                >>> png = Chart.candle(df, title='FPT', output='png')  # served from the cache
+            """
+            configure_render_cache(enabled=enabled, max_bytes=max_bytes, disk=disk, cache_dir=cache_dir,
+                                   max_disk_bytes=max_disk_bytes)
+        @staticmethod
+        def clear_render_cache(disk: bool = False):
+            """Empties the render cache (and its directory too if `disk` is True)."""
+            cache = render_cache()
+            if cache is not None:
+                cache.clear(disk=disk)
+        @staticmethod
+        def render_cache_stats() -> Optional[dict]:
+            """Returns hits, misses, hit rate, entries and bytes of the render cache, or None if it is disabled."""
+            cache = render_cache()
+            return cache.stats() if cache is not None else None
+        @staticmethod
+        def set_derived_cache(enabled: bool = True, maxsize: int = 256, max_bytes: int = 64 << 20):
+            """
+            Configures the cache of derived series shared by the chart methods.
+
+            Indicators and monthly returns are stored under a fingerprint of their source arrays (length,
+            last value or timestamp, buffer hash) and their parameters, so a candle and backtest of the same
+            ticker compute them once. Enabled by default.
+
+            Args:
+                enabled (bool): False disables the cache; every chart then recomputes its series.
+                maxsize (int): Maximum number of cached results. Defaults to 256.
+                max_bytes (int): Memory budget of the cached arrays. Defaults to 64 MB.
+            """
+            configure_derived_cache(enabled=enabled, maxsize=maxsize, max_bytes=max_bytes)
+        @staticmethod
+        def clear_derived_cache():
+            """Empties the derived-data cache and resets its counters."""
+            cache = derived_cache()
+            if cache is not None:
+                cache.clear()
+        @staticmethod
+        def derived_cache_stats() -> Optional[dict]:
+            """Returns hits, misses, hit rate, entries and bytes of the derived-data cache, or None if it is disabled."""
+            cache = derived_cache()
+            return cache.stats() if cache is not None else None
+        @staticmethod
+        def set_heatmap_raster_threshold(cells: int = 1000):
+            """
+            Sets the size above which `heatmap` (and `returns_heatmap`) draws one raster image instead of
+            a seaborn patch and annotation per cell, whose cost grows with the cell count.
+
+            Args:
+                cells (int): Number of cells (rows x columns). Defaults to 1000. A single call can pass
+                    `raster=True/False` or `raster_threshold=...` instead.
+            """
+            set_raster_threshold(cells)
         @staticmethod
         def apply_chart_style(ax, 
                             title=None, title_fontsize=14, 
@@ -101,8 +301,6 @@ class StyleMixin:
                 background_color (str): The background color for the chart.
                 bar_edge_color (str): The edge color for the bars in the chart.
             """
-            if font_name:
-                plt.rcParams['font.family'] = font_name
             if title:
                 ax.set_title(title, fontsize=title_fontsize or 16, fontweight='black', color='#111827', pad=16)
             if xlabel:
@@ -168,7 +366,7 @@ class StyleMixin:
             if ylim:
                 ax.set_ylim(ylim)
             if tick_rotation:
-                plt.xticks(rotation=tick_rotation)
+                ax.tick_params(axis='x', labelrotation=tick_rotation)
             
             if background_color:
                 ax.set_facecolor(background_color)
@@ -204,6 +402,8 @@ class StyleMixin:
             if show_yaxis is False:
                 ax.yaxis.set_visible(False)
                 ax.spines['left'].set_visible(False)
+            if font_name:
+                apply_font(ax, font_name)
         @classmethod
         def _inject_logo(cls, fig, kwargs, force_right=False):
             if not getattr(cls, '_global_logo_path', None):
@@ -225,26 +425,13 @@ class StyleMixin:
                 position (Tuple[float, float, float, float]): Bounding box (left, bottom, width, height) in figure fraction. Defaults to bottom center.
                 adjust_bottom (float): Bottom margin to avoid overlapping with chart.
             """
-            import matplotlib.image as mpimg
-            import requests
-            from io import BytesIO
-
             try:
                 # Adjust the bottom margin of the figure to prevent the logo from overlapping with the data
                 if adjust_bottom:
                     fig.subplots_adjust(bottom=adjust_bottom)
 
-                # Check if it's a URL or local path
-                if isinstance(logo_path, str) and logo_path.startswith('http'):
-                    headers = {'User-Agent': 'Mozilla/5.0'}
-                    response = requests.get(logo_path, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        img = mpimg.imread(BytesIO(response.content), format='png')
-                    else:
-                        print(f"Error: Could not download logo from {logo_path}. Status code: {response.status_code}")
-                        return
-                else:
-                    img = mpimg.imread(logo_path)
+                # Decoded (and downscaled) logos are served from a process-wide cache
+                img = get_logo(logo_path, logo_pixel_size(fig, position))
                 
                 # Create a separate axes specifically for the logo to avoid overlap
                 ax_logo = fig.add_axes(position, zorder=999)
@@ -252,6 +439,29 @@ class StyleMixin:
                 ax_logo.axis('off')
             except Exception as e:
                 print(f"Error adding logo: {e}")
+        @classmethod
+        def preload_logo(cls, logo_path: Optional[str] = None, figsizes: Optional[List[Tuple[float, float]]] = None,
+                         position: Tuple[float, float, float, float] = (0.80, 0.02, 0.12, 0.06)):
+            """
+            Warms the in-memory logo cache so the first chart does not pay for decoding (or downloading) the logo.
+
+            Args:
+                logo_path (str): Path or URL to the logo image. Defaults to the global logo set by `set_theme`.
+                figsizes (list): Optional figure sizes (in inches) to pre-downscale the logo for.
+                position (tuple): Logo bounding box in figure fraction used together with `figsizes`.
+
+            Returns:
+                np.ndarray: The decoded RGBA logo, or None if no logo is configured.
+            """
+            from matplotlib.figure import Figure
+
+            logo_path = logo_path or cls._global_logo_path
+            if not logo_path:
+                return None
+            img = get_logo(logo_path)
+            for figsize in figsizes or []:
+                get_logo(logo_path, logo_pixel_size(Figure(figsize=figsize), position))
+            return img
         def help(self, method_path):
             """
             Displays detailed information about a method based on its path.
@@ -0,0 +1,273 @@
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Trading sessions per exchange as (start, end, kind) in local (Asia/Ho_Chi_Minh) time.
+# 'open' is the opening auction (ATO); 'close' covers the closing auction (ATC) and
+# HNX's post-close session (PLO), which matches at the closing price.
+SESSIONS = {
+    'HOSE': (('09:00', '09:15', 'open'), ('09:15', '11:30', 'continuous'),
+             ('13:00', '14:30', 'continuous'), ('14:30', '14:45', 'close')),
+    'HNX': (('09:00', '11:30', 'continuous'), ('13:00', '14:30', 'continuous'),
+            ('14:30', '14:45', 'close'), ('14:45', '15:00', 'close')),
+    'UPCOM': (('09:00', '11:30', 'continuous'), ('13:00', '15:00', 'continuous')),
+}
+
+MARKET_TZ = 'Asia/Ho_Chi_Minh'
+
+AUCTION_MODES = ('merge', 'separate', 'drop')
+
+_NS = {'s': 10**9, 'm': 60 * 10**9, 'min': 60 * 10**9, 'h': 3600 * 10**9, 'd': 86_400 * 10**9}
+_DAY = _NS['d']
+_SECOND = _NS['s']
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def parse_interval(interval: Union[str, pd.Timedelta]) -> int:
+    """
+    Converts a bar interval such as '1m', '5m', '15m', '1h' or '1D' to nanoseconds.
+
+    Raises:
+        ValueError: If the interval is not a whole number of seconds, minutes or hours
+            of at most one day.
+    """
+    if isinstance(interval, pd.Timedelta):
+        step = interval.value
+    else:
+        match = re.fullmatch(r'\s*(\d+)\s*(s|m|min|h|d)\s*', str(interval), flags=re.IGNORECASE)
+        if match is None:
+            raise ValueError(f"Unsupported interval {interval!r}. Use e.g. '1m', '5m', '15m', '1h' or '1D'.")
+        step = int(match.group(1)) * _NS[match.group(2).lower()]
+    if step <= 0 or step > _DAY or step % _SECOND:
+        raise ValueError(f"Unsupported interval {interval!r}: it must be a whole number of seconds, at most one day.")
+    return step
+
+
+def _clock(value: str) -> int:
+    hours, minutes = value.split(':')
+    return int(hours) * _NS['h'] + int(minutes) * _NS['m']
+
+
+class _SessionPlan:
+    """
+    Bar layout of one trading day for an exchange, interval and auction mode.
+
+    Each bar is a half-open range of time of day [start, stop) with the label it is
+    reported under. Bars restart at every session start, so none spans the lunch break;
+    a session's end is inclusive (prints stamped exactly 11:30:00 belong to the morning)
+    unless another session starts at that instant. Merged auctions share the label of
+    the adjacent continuous bar.
+    """
+    def __init__(self, sessions: Sequence[Tuple[str, str, str]], step: int, auctions: str):
+        if auctions not in AUCTION_MODES:
+            raise ValueError(f"auctions must be one of {AUCTION_MODES}, not {auctions!r}.")
+        rows = sorted((_clock(start), _clock(end), kind) for start, end, kind in sessions)
+        continuous = [i for i, row in enumerate(rows) if row[2] == 'continuous']
+        if not continuous:
+            raise ValueError("At least one 'continuous' session is required.")
+        session_starts = {row[0] for row in rows}
+
+        def last_label(i):
+            start, end, _ = rows[i]
+            return start + (end - start - 1) // step * step
+
+        bars = []
+        for i, (start, end, kind) in enumerate(rows):
+            stop = end if end in session_starts else end + 1
+            if kind != 'continuous' and auctions == 'drop':
+                continue
+            if step >= _DAY:
+                bars.append((start, stop, 0))
+            elif kind == 'continuous':
+                bars.extend((t, min(t + step, stop), t) for t in range(start, end, step))
+                bars[-1] = (bars[-1][0], stop, bars[-1][2])
+            elif auctions == 'separate':
+                bars.append((start, stop, start))
+            elif kind == 'open':
+                # Fold the opening auction into the first bar of the next continuous session
+                bars.append((start, stop, rows[min([c for c in continuous if c > i] or continuous[-1:])][0]))
+            else:
+                # Fold closing auctions into the last bar of the previous continuous session
+                bars.append((start, stop, last_label(max([c for c in continuous if c < i] or continuous[:1]))))
+        bars.sort()
+        self.starts, self.stops, self.labels = (np.array(column, dtype=np.int64) for column in zip(*bars))
+
+    def ranges(self, first: int, last: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the absolute (start, stop, label) of every bar from the day of `first` to the day of `last` (ns)."""
+        days = np.arange(first // _DAY, last // _DAY + 1, dtype=np.int64)[:, None] * _DAY
+        return ((days + self.starts).ravel(), (days + self.stops).ravel(), (days + self.labels).ravel())
+
+
+def _combine(rows: np.ndarray) -> np.ndarray:
+    """Merges consecutive rows of (label in seconds, open, high, low, close, volume) that share a label."""
+    if len(rows) < 2 or (rows[1:, 0] != rows[:-1, 0]).all():
+        return rows
+    starts = np.concatenate(([0], np.flatnonzero(rows[1:, 0] != rows[:-1, 0]) + 1))
+    ends = np.append(starts[1:], len(rows)) - 1
+    return np.column_stack((rows[starts, 0], rows[starts, 1], np.maximum.reduceat(rows[:, 2], starts),
+                            np.minimum.reduceat(rows[:, 3], starts), rows[ends, 4], np.add.reduceat(rows[:, 5], starts)))
+
+
+class TickAggregator:
+    """
+    Streaming, vectorized aggregation of matched trades into OHLCV bars.
+
+    Feed it chunks of ticks in time order with `update`; each call returns the bars completed
+    so far and keeps only the current, still-open bar in memory, so a full trading day never
+    has to sit in one DataFrame. Bars follow the exchange sessions: they restart at every
+    session start, never span the lunch break, and the opening/closing auctions are merged
+    into the adjacent bar, given their own bar, or dropped. The result has 'Open', 'High',
+    'Low', 'Close' and 'Volume' columns on a DatetimeIndex and can be passed to
+    `Chart.candle` or `Chart.backtest` as is.
+
+    Args:
+        interval (str): Bar length, e.g. '1m', '5m', '15m', '1h' or '1D'.
+        exchange (str or sequence): 'HOSE', 'HNX', 'UPCOM', or custom sessions as
+            (start, end, kind) tuples like `SESSIONS`.
+        auctions (str): 'merge' (default) folds ATO/ATC prints into the first/last bar of
+            the adjacent continuous session, 'separate' gives each auction its own bar and
+            'drop' ignores them.
+        time_col (str): Column with the trade time. The index is used if the column is missing.
+        price_col (str): Column with the matched price.
+        volume_col (str): Column with the matched volume.
+
+    Example:
+        >>> agg = TickAggregator('5m', exchange='HOSE')
+        >>> for chunk in pd.read_csv('ticks.csv', parse_dates=['time'], chunksize=100_000):
+        ...     agg.update(chunk)
+        >>> Chart.candle(agg.bars(), title='FPT 5m')
+    """
+    def __init__(self, interval: Union[str, pd.Timedelta] = '1m', exchange: Union[str, Sequence] = 'HOSE',
+                 auctions: str = 'merge', time_col: str = 'time', price_col: str = 'price',
+                 volume_col: str = 'volume'):
+        if isinstance(exchange, str):
+            if exchange.upper() not in SESSIONS:
+                raise ValueError(f"Unknown exchange {exchange!r}. Use one of {list(SESSIONS)} or a list of sessions.")
+            exchange = SESSIONS[exchange.upper()]
+        self.plan = _SessionPlan(exchange, parse_interval(interval), auctions)
+        self.time_col, self.price_col, self.volume_col = time_col, price_col, volume_col
+        self.tz = None
+        self.ticks = 0
+        self.dropped = 0
+        self._done: List[np.ndarray] = []
+        self._open: Optional[np.ndarray] = None
+
+    def _arrays(self, ticks: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        times = ticks[self.time_col] if self.time_col in ticks.columns else ticks.index.to_series()
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            times = pd.to_datetime(times)
+        times = pd.DatetimeIndex(times)
+        if times.tz is not None:
+            self.tz = self.tz or MARKET_TZ
+            times = times.tz_convert(MARKET_TZ).tz_localize(None)
+        times = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        price = ticks[self.price_col].to_numpy(dtype=float)
+        if self.volume_col in ticks.columns:
+            volume = np.nan_to_num(ticks[self.volume_col].to_numpy(dtype=float))
+        else:
+            volume = np.zeros(len(price))
+        return times, price, volume
+
+    def _frame(self, rows: np.ndarray) -> pd.DataFrame:
+        # Labels are kept as whole seconds, which float64 holds exactly
+        index = pd.DatetimeIndex((rows[:, 0].astype(np.int64) * _SECOND).view('datetime64[ns]'), name='time')
+        if self.tz is not None:
+            index = index.tz_localize(self.tz)
+        return pd.DataFrame(rows[:, 1:], index=index, columns=OHLCV_COLUMNS)
+
+    def update(self, ticks: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds a chunk of ticks and returns the bars it completed.
+
+        Ticks outside the trading sessions, without a price, or older than the currently open
+        bar are skipped and counted in `dropped`.
+
+        Args:
+            ticks (pd.DataFrame): Trades with time, price and volume columns.
+
+        Returns:
+            pd.DataFrame: Newly completed bars (possibly empty). The last bar stays open until
+                a later tick or `flush` closes it.
+        """
+        times, price, volume = self._arrays(ticks)
+        self.ticks += len(times)
+        if len(times) > 1 and (times[1:] < times[:-1]).any():
+            order = np.argsort(times, kind='stable')
+            times, price, volume = times[order], price[order], volume[order]
+        valid = ~np.isnan(price)
+        if not valid.all():
+            times, price, volume = times[valid], price[valid], volume[valid]
+        if not len(times):
+            self.dropped += len(valid)
+            return self._frame(np.empty((0, 6)))
+        # Ticks are time-ordered, so each bar is a contiguous slice found by binary search
+        starts, stops, labels = self.plan.ranges(times[0], times[-1])
+        lo = np.searchsorted(times, starts)
+        hi = np.searchsorted(times, stops)
+        keep = hi > lo
+        if self._open is not None:
+            keep &= labels >= self._open[0] * _SECOND
+        lo, hi, labels = lo[keep], hi[keep], labels[keep]
+        self.dropped += int(len(valid) - (hi - lo).sum())
+        if not len(lo):
+            return self._frame(np.empty((0, 6)))
+        # reduceat over interleaved (lo, hi) pairs reduces each [lo, hi) slice at the even positions
+        bounds = np.column_stack((lo, hi)).ravel()
+        if bounds[-1] == len(times):
+            bounds = bounds[:-1]
+        rows = np.column_stack(((labels // _SECOND).astype(float), price[lo], np.maximum.reduceat(price, bounds)[::2],
+                                np.minimum.reduceat(price, bounds)[::2], price[hi - 1],
+                                np.add.reduceat(volume, bounds)[::2]))
+        if self._open is not None:
+            rows = np.vstack((self._open, rows))
+        rows = _combine(rows)
+        self._open = rows[-1].copy()
+        completed = rows[:-1]
+        if len(completed):
+            self._done.append(completed)
+        return self._frame(completed)
+
+    def flush(self) -> pd.DataFrame:
+        """Closes the open bar (e.g. at the end of the session) and returns it."""
+        if self._open is None:
+            return self._frame(np.empty((0, 6)))
+        last = self._open[None, :]
+        self._done.append(last)
+        self._open = None
+        return self._frame(last)
+
+    def bars(self, include_open: bool = True) -> pd.DataFrame:
+        """
+        Returns every bar aggregated so far.
+
+        Args:
+            include_open (bool): Include the bar that is still being built.
+        """
+        parts = self._done + ([self._open[None, :]] if include_open and self._open is not None else [])
+        return self._frame(np.vstack(parts) if parts else np.empty((0, 6)))
+
+
+def resample_ticks(ticks: Union[pd.DataFrame, Iterable[pd.DataFrame]], interval: Union[str, pd.Timedelta] = '1m',
+                   exchange: Union[str, Sequence] = 'HOSE', auctions: str = 'merge', **columns) -> pd.DataFrame:
+    """
+    Aggregates matched trades into session-aware OHLCV bars (see `TickAggregator`).
+
+    Args:
+        ticks (pd.DataFrame or iterable of pd.DataFrame): Trades, whole or as time-ordered chunks
+            (e.g. `pd.read_csv(..., chunksize=...)`), which are consumed one at a time.
+        interval (str): Bar length, e.g. '1m', '5m', '15m', '1h' or '1D'.
+        exchange (str or sequence): 'HOSE', 'HNX', 'UPCOM' or custom sessions.
+        auctions (str): 'merge', 'separate' or 'drop'.
+        **columns: `time_col`, `price_col` and `volume_col` overrides.
+
+    Returns:
+        pd.DataFrame: Bars with 'Open', 'High', 'Low', 'Close' and 'Volume' columns.
+    """
+    aggregator = TickAggregator(interval, exchange=exchange, auctions=auctions, **columns)
+    for chunk in ([ticks] if isinstance(ticks, pd.DataFrame) else ticks):
+        aggregator.update(chunk)
+    aggregator.flush()
+    return aggregator.bars()
@@ -0,0 +1,228 @@
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Values of the trade type column recognised as buys and sells (compared upper-cased).
+BUY_SIDES = ('MUA', 'BUY', 'LONG', '1', '1.0')
+SELL_SIDES = ('BAN', 'SELL', 'SHORT', '-1', '-1.0')
+
+# How trades whose time is not a bar of the chart are placed:
+# 'exact' drops them, 'nearest' uses the closest bar, 'backward' the last bar at or before
+# the trade (the bar that contains it when bars are labelled by their start) and 'forward'
+# the first bar at or after it.
+SNAP_MODES = ('exact', 'nearest', 'backward', 'forward')
+
+_GET_INDEXER_METHOD = {'exact': None, 'nearest': 'nearest', 'backward': 'pad', 'forward': 'backfill'}
+
+TIME_COLUMNS = ('time', 'date', 'trade_date')
+TYPE_COLUMNS = ('type', 'trade_type', 'side')
+PRICE_COLUMNS = ('price', 'exec_price')
+QUANTITY_COLUMNS = ('quantity', 'qty', 'shares', 'volume', 'size')
+
+ROUND_TRIP_COLUMNS = ('entry_time', 'exit_time', 'direction', 'quantity', 'entry_price', 'exit_price',
+                      'pnl', 'return', 'holding')
+
+
+def check_snap_mode(snap: str) -> None:
+    """Raises ValueError unless `snap` is one of `SNAP_MODES`."""
+    if snap not in SNAP_MODES:
+        raise ValueError(f"Unknown snap mode '{snap}'. Choose one of: {', '.join(SNAP_MODES)}.")
+
+
+def _find_column(frame: pd.DataFrame, names) -> Any:
+    return next((c for c in frame.columns if str(c).lower() in names), None)
+
+
+def trades_frame(trades: Union[pd.DataFrame, List[Dict[str, Any]], np.ndarray, None]) -> pd.DataFrame:
+    """
+    Normalizes the `trades` argument of `backtest` into a DataFrame with 'time' (datetime64),
+    'side' (+1 buy, -1 sell, 0 unknown), 'price' and 'quantity' columns.
+
+    Accepts a DataFrame, a list of dicts or a structured array whose columns are named like
+    'time'/'date'/'trade_date', 'type'/'trade_type'/'side' and 'price'/'exec_price' (any case).
+    The optional quantity column ('quantity'/'qty'/'shares'/'volume'/'size') defaults to 1.
+    Returns an empty frame when the input is empty or lacks one of the other columns.
+    """
+    if isinstance(trades, pd.DataFrame):
+        frame = trades
+    elif isinstance(trades, (list, np.ndarray)):
+        try:
+            frame = pd.DataFrame(trades)
+        except (ValueError, TypeError):
+            frame = pd.DataFrame()
+    else:
+        frame = pd.DataFrame()
+
+    empty = pd.DataFrame({'time': pd.Series(dtype='datetime64[ns]'), 'side': pd.Series(dtype=np.int8),
+                          'price': pd.Series(dtype=float), 'quantity': pd.Series(dtype=float)})
+    if frame.empty:
+        return empty
+    time_col, type_col, price_col = (_find_column(frame, names) for names in (TIME_COLUMNS, TYPE_COLUMNS, PRICE_COLUMNS))
+    if time_col is None or type_col is None or price_col is None:
+        return empty
+
+    # Classify each distinct type value once instead of every row
+    codes, uniques = pd.factorize(frame[type_col], use_na_sentinel=True)
+    labels = [str(value).strip().upper() for value in uniques]
+    side_of = np.array([1 if label in BUY_SIDES else -1 if label in SELL_SIDES else 0 for label in labels] + [0],
+                       dtype=np.int8)
+    quantity_col = _find_column(frame, QUANTITY_COLUMNS)
+    quantity = (pd.to_numeric(frame[quantity_col], errors='coerce').to_numpy(dtype=float) if quantity_col is not None
+                else np.ones(len(frame)))
+    return pd.DataFrame({'time': pd.to_datetime(frame[time_col]).reset_index(drop=True),
+                         'side': side_of[codes],
+                         'price': pd.to_numeric(frame[price_col], errors='coerce').to_numpy(dtype=float),
+                         'quantity': quantity})
+
+
+def bar_positions(times: pd.DatetimeIndex, index: pd.DatetimeIndex, snap: str = 'exact') -> np.ndarray:
+    """
+    Returns the position in `index` of the bar each timestamp belongs to, or -1 if it has none.
+
+    Args:
+        times (pd.DatetimeIndex): Timestamps to place.
+        index (pd.DatetimeIndex): Bar timestamps, sorted unless `snap='exact'`.
+        snap (str): One of `SNAP_MODES`. Snapped timestamps more than one typical bar spacing
+            outside the first/last bar are not placed.
+    """
+    check_snap_mode(snap)
+    if len(index) == 0 or len(times) == 0:
+        return np.full(len(times), -1, dtype=np.intp)
+    if index.tz is not None and times.tz is None:
+        times = times.tz_localize(index.tz)
+    elif index.tz is None and times.tz is not None:
+        times = times.tz_localize(None)
+
+    positions = np.arange(len(index))
+    if not index.is_unique:
+        # Duplicate bars: trades go to the first of them
+        first = ~index.duplicated()
+        positions, index = positions[first], index[first]
+    if snap != 'exact' and not index.is_monotonic_increasing:
+        raise ValueError(f"snap='{snap}' needs the data index to be sorted in ascending order.")
+
+    found = index.get_indexer(times, method=_GET_INDEXER_METHOD[snap])
+    if snap != 'exact' and len(index) > 1:
+        spacing = np.median(np.diff(index.asi8))
+        stamps = times.asi8
+        outside = (stamps < index.asi8[0] - spacing) | (stamps > index.asi8[-1] + spacing)
+        found[outside] = -1
+    found[times.isna()] = -1
+    return np.where(found >= 0, positions[np.maximum(found, 0)], -1)
+
+
+def trade_markers(trades, index: pd.DatetimeIndex, snap: str = 'exact',
+                  offset: float = 0.02) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Places buy and sell markers on the bars of `index`, without a Python loop over the trades.
+
+    Buy markers sit `offset` below the trade price and sell markers `offset` above it. When several
+    trades of one side land on the same bar, the lowest buy and the highest sell marker are kept.
+
+    Args:
+        trades: Anything `trades_frame` accepts.
+        index (pd.DatetimeIndex): Bar timestamps of the chart.
+        snap (str): How to place trades between bars (see `SNAP_MODES`).
+        offset (float): Relative distance between the marker and the trade price.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, int]: Buy and sell marker prices aligned to `index` (NaN where
+        there is no trade) and the number of buy/sell trades that could not be placed on a bar.
+    """
+    check_snap_mode(snap)
+    frame = trades_frame(trades)
+    buys, sells = np.full(len(index), np.nan), np.full(len(index), np.nan)
+    frame = frame[frame['side'].to_numpy() != 0]
+    if frame.empty:
+        return buys, sells, 0
+
+    positions = bar_positions(pd.DatetimeIndex(frame['time']), index, snap)
+    side, price = frame['side'].to_numpy(), frame['price'].to_numpy()
+    placed = positions >= 0
+    is_buy, is_sell = placed & (side == 1), placed & (side == -1)
+    np.fmin.at(buys, positions[is_buy], price[is_buy] * (1 - offset))
+    np.fmax.at(sells, positions[is_sell], price[is_sell] * (1 + offset))
+    return buys, sells, int((~placed).sum())
+
+
+def round_trips(trades) -> pd.DataFrame:
+    """
+    Pairs entries with exits first-in first-out and returns one row per matched (entry, exit) pair.
+
+    The position is tracked through the trades in time order, so a sell closes long units before
+    it opens a short, and a buy that flips a short position both closes and opens. Each trade is
+    split into its closing and opening quantity; the units closed in each direction are matched
+    with the oldest open units by cutting the cumulative opened and closed quantities at the lot
+    boundaries of both (one `searchsorted`, no loop over the trades). Units still open after the
+    last trade are not reported.
+
+    Args:
+        trades: Anything `trades_frame` accepts. Trades without a quantity count as 1 unit.
+
+    Returns:
+        pd.DataFrame: Columns 'entry_time', 'exit_time', 'direction' (+1 long, -1 short), 'quantity',
+        'entry_price', 'exit_price', 'pnl', 'return' and 'holding' (exit_time - entry_time), sorted
+        by exit and then entry.
+    """
+    frame = trades_frame(trades)
+    quantity = np.abs(frame['quantity'].to_numpy())
+    valid = (frame['side'].to_numpy() != 0) & (quantity > 0) & frame['price'].notna().to_numpy() & frame['time'].notna().to_numpy()
+    frame, quantity = frame[valid], quantity[valid]
+    order = np.argsort(frame['time'].to_numpy(), kind='stable')
+    times = pd.DatetimeIndex(frame['time'])[order]
+    side, price, quantity = frame['side'].to_numpy()[order], frame['price'].to_numpy()[order], quantity[order]
+
+    pieces = []
+    if len(quantity):
+        tol = 1e-9 * quantity.max()
+        signed = side * quantity
+        before = np.cumsum(signed) - signed
+        before[np.abs(before) <= tol] = 0.0
+        # A trade against the current position first closes it, the rest opens one in its own direction
+        closing = np.where(np.sign(before) == -side, np.minimum(quantity, np.abs(before)), 0.0)
+        opening = quantity - closing
+        for direction in (1, -1):
+            opens = np.flatnonzero((side == direction) & (opening > tol))
+            closes = np.flatnonzero((side == -direction) & (closing > tol))
+            if not len(opens) or not len(closes):
+                continue
+            opened, closed = np.cumsum(opening[opens]), np.cumsum(closing[closes])
+            # Cut the closed units at every lot boundary of either side: each piece has one entry and one exit
+            edges = np.union1d(opened, closed)
+            edges = edges[edges <= closed[-1] + tol]
+            sizes = np.diff(edges, prepend=0.0)
+            edges, sizes = edges[sizes > tol], sizes[sizes > tol]
+            entry = opens[np.minimum(np.searchsorted(opened, edges - tol), len(opens) - 1)]
+            exit_ = closes[np.minimum(np.searchsorted(closed, edges - tol), len(closes) - 1)]
+            pieces.append((np.full(len(edges), direction, dtype=np.int8), entry, exit_, sizes))
+
+    if not pieces:
+        return pd.DataFrame({'entry_time': times[:0], 'exit_time': times[:0], 'direction': np.empty(0, dtype=np.int8),
+                             **{c: np.empty(0) for c in ROUND_TRIP_COLUMNS[3:8]}, 'holding': pd.to_timedelta([])},
+                            columns=list(ROUND_TRIP_COLUMNS))
+    direction, entry, exit_, sizes = (np.concatenate(parts) for parts in zip(*pieces))
+    order = np.lexsort((entry, exit_))
+    direction, entry, exit_, sizes = direction[order], entry[order], exit_[order], sizes[order]
+    entry_price, exit_price = price[entry], price[exit_]
+    return pd.DataFrame({'entry_time': times[entry], 'exit_time': times[exit_], 'direction': direction,
+                         'quantity': sizes, 'entry_price': entry_price, 'exit_price': exit_price,
+                         'pnl': direction * (exit_price - entry_price) * sizes,
+                         'return': direction * (exit_price / entry_price - 1),
+                         'holding': times[exit_] - times[entry]})
+
+
+def merge_spans(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges bar ranges [start, end] that overlap or touch into their union, returned sorted.
+
+    Thousands of overlapping holding periods shade the same pixels as their union, which takes
+    one polygon per disjoint run of bars instead of one per round trip.
+    """
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    reach = np.maximum.accumulate(ends)
+    first = np.flatnonzero(np.r_[True, starts[1:] > reach[:-1] + 1])
+    return starts[first], np.maximum.reduceat(ends, first)
@@ -0,0 +1,160 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .context import rc_scope
+
+# Figure sizes used by the chart methods' defaults; the logo is pre-downscaled for each.
+_WARM_FIGSIZES = [(6.4, 4.8), (10, 6), (10, 5), (12, 8), (14, 10), (9, 5)]
+
+
+def warm_up(theme: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Pays every one-off cost of the first chart in the current process without changing its settings.
+
+    This imports Matplotlib, seaborn and mplfinance, loads the font cache (registering the bundled
+    Inter font and looking up the theme's font), preloads the logo and performs a first Agg draw of
+    the text, line and candlestick code paths. The backend and the global theme are left as they
+    are: workers apply them in `_init_worker` / `_configure_worker`.
+
+    Args:
+        theme (dict): Keyword arguments for `Chart.set_theme`, used to pick the font to preload.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn  # noqa: F401
+    import mplfinance as mpf
+    from matplotlib import font_manager
+    from ..static.chart import Chart
+    from .context import close_figure, new_subplots
+
+    Chart._register_inter()
+    font_name = (theme or {}).get('font_name') or plt.rcParams['font.family']
+    font_manager.findfont(font_manager.FontProperties(family=font_name))
+    Chart.preload_logo(figsizes=_WARM_FIGSIZES)
+
+    # Agg figures outside pyplot, whatever backend the process uses
+    fig, ax = new_subplots(figsize=(2, 1))
+    ax.plot([0, 1], [0, 1])
+    ax.set_title('warm-up', fontweight='black')
+    fig.canvas.draw()
+
+    index = pd.date_range('2024-01-01', periods=5, freq='D')
+    ohlc = pd.DataFrame({'Open': [1, 2, 3, 2, 1], 'High': [2, 3, 4, 3, 2], 'Low': [0.5, 1, 2, 1, 0.5],
+                         'Close': [2, 3, 2, 1, 2], 'Volume': [10, 20, 30, 20, 10]}, index=index, dtype=float)
+    with rc_scope():
+        fig, _ = mpf.plot(ohlc, type='candle', volume=True, returnfig=True, figsize=(2, 1))
+    fig.canvas.draw()
+    close_figure(fig)
+
+
+def _configure_worker(theme: Dict[str, Any], backend: Optional[str] = 'Agg') -> None:
+    """Selects the backend and applies the theme in a worker process."""
+    import matplotlib
+    if backend:
+        matplotlib.use(backend)
+    from ..static.chart import Chart
+
+    if theme:
+        Chart.set_theme(**theme)
+
+
+def _init_worker(theme: Dict[str, Any]) -> None:
+    _configure_worker(theme)
+    warm_up(theme)
+
+
+class WarmPool:
+    """
+    Fork-server style renderer pool for latency-sensitive services (e.g. chat alert bots).
+
+    The constructor warms up the caches of the current process once (see `warm_up`, which
+    leaves its backend and theme alone) and then forks the worker processes from it, so every child starts with Matplotlib, fonts, styles
+    and the logo already loaded and its first chart costs about as much as any later one.
+    Platforms without `fork` fall back to spawning workers that warm up individually.
+
+    Args:
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        theme (dict): Keyword arguments for `Chart.set_theme`. Defaults to the current global theme.
+
+    Example:
+        >>> pool = WarmPool(workers=2, theme={'theme_name': 'vnstock', 'lang': 'en'})
+        >>> png = pool.render('candle', df, title='FPT')
+    """
+    def __init__(self, workers: Optional[int] = None, theme: Optional[Dict[str, Any]] = None):
+        from .batch import _current_theme
+
+        self.workers = workers or os.cpu_count() or 1
+        self.theme = {**_current_theme(), **(theme or {})}
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Warm the caches here so the forked workers inherit them; the backend and theme are
+            # only applied in the workers, leaving this process's settings alone
+            warm_up(self.theme)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('fork'),
+                                                initializer=_configure_worker, initargs=(self.theme,))
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.theme,))
+        # Start every worker now rather than on the first request
+        for future in [self.executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def submit(self, method: str, *args, output: Optional[str] = None, format: str = 'png',
+               savefig: Optional[Dict[str, Any]] = None, **kwargs) -> Future:
+        """
+        Schedules a chart and returns a Future resolving to the result dict of `render_batch`.
+
+        Args:
+            method (str): Chart method name, e.g. 'candle'.
+            *args: Positional arguments of the chart method.
+            output (str): File path to save to. If omitted, the result carries the encoded image bytes.
+            format (str): Image format when no output path is given.
+            savefig (dict): Extra `savefig` arguments.
+            **kwargs: Keyword arguments of the chart method.
+        """
+        from .batch import _collect_image, _render_spec, _share
+
+        spec = {'method': method, 'args': args, 'kwargs': kwargs, 'output': output, 'format': format, 'savefig': savefig or {}}
+        segments = []
+        inner = self.executor.submit(_render_spec, 0, _share(spec, segments))
+        future = Future()
+
+        def _done(f):
+            try:
+                future.set_result(_collect_image(f.result()))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                for shm in segments:
+                    shm.close()
+                    shm.unlink()
+
+        inner.add_done_callback(_done)
+        return future
+
+    def render(self, method: str, *args, **kwargs):
+        """
+        Renders one chart in a warm worker and returns the encoded image (or the output path).
+
+        Raises:
+            RuntimeError: If the chart method failed in the worker.
+        """
+        result = self.submit(method, *args, **kwargs).result()
+        if result['error']:
+            raise RuntimeError(result['error'])
+        return result['image'] if result['image'] is not None else result['output']
+
+    def render_batch(self, specs: Iterable[Dict[str, Any]], ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """Renders chart specs on the warm workers. See `Chart.render_batch` for the spec format."""
+        from .batch import render_batch
+
+        return render_batch(specs, ordered=ordered, pool=self.executor)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -5,18 +5,20 @@ import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 from ..config import *
 from ..utils import Utils
+from ..core.context import apply_font
+from ..core.decimate import decimate_columns, decimate_frame, decimate_lines
+from ..core.density import DENSITY_POINTS, density_grid
+from ..core.render import chart_method
 import matplotlib.ticker as mticker
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 class BasicMixin:
         @classmethod
+        @chart_method
         def bar(cls, data: Union['pd.DataFrame', 'pd.Series'], **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -50,8 +52,7 @@ class BasicMixin:
                 background_color (str): Background hex color.
                 bar_edge_color (str): Bar edge hex color.
             """
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
         
             style_kwargs = {k: kwargs.pop(k, None) for k in ['title', 'xlabel', 'ylabel', 'grid', 'data_labels', 'data_label_format',
                                                             'legend_title', 'series_names', 'font_name', 
@@ -65,8 +66,10 @@ class BasicMixin:
         
             ax = kwargs.pop('ax', None)
             if ax is None:
-                fig, ax = plt.subplots()
-            plot_kwargs = cls._filter_plot_kwargs(kwargs)
+                fig, ax = cls._subplots()
+            else:
+                fig = ax.figure
+            plot_kwargs = cls._use_palette(ax, palette, cls._filter_plot_kwargs(kwargs), data.shape[1] if data.ndim > 1 else 1)
             data.plot(kind='bar', ax=ax, **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
             if show_plot and plt.get_backend().lower() != 'agg':
@@ -74,6 +77,7 @@ class BasicMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method
         def hist(cls, data: Union['pd.DataFrame', 'pd.Series'], **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -107,12 +111,11 @@ class BasicMixin:
                 background_color (str): Background hex color.
                 bar_edge_color (str): Bar edge hex color.
             """
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
 
             ax = kwargs.pop('ax', None)
             if ax is None:
-                fig, ax = plt.subplots()
+                fig, ax = cls._subplots()
             else:
                 fig = ax.figure
         
@@ -125,7 +128,7 @@ class BasicMixin:
                                                             'background_color', 'bar_edge_color', 'grid_axis',
                                                             'data_label_position', 'data_label_color', 'data_label_fontsize']}
 
-            plot_kwargs = cls._filter_plot_kwargs(kwargs)
+            plot_kwargs = cls._use_palette(ax, palette, cls._filter_plot_kwargs(kwargs), data.shape[1] if data.ndim > 1 else 1)
             data.plot(kind='hist', ax=ax, **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
             if show_plot and plt.get_backend().lower() != 'agg':
@@ -133,6 +136,7 @@ class BasicMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method
         def pie(cls, data: Union[list, 'pd.Series'], labels: list, **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -152,9 +156,8 @@ class BasicMixin:
                 title_fontsize (int): The font size for the title.
                 legend_fontsize (int): The font size for the legend.
             """
-            fig, ax = plt.subplots()
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            fig, ax = cls._subplots()
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
         
             style_kwargs = {k: kwargs.pop(k, None) for k in ['title', 'legend_title', 'series_names', 'font_name', 
                                                             'show_legend', 'title_fontsize', 'legend_fontsize', 
@@ -165,7 +168,7 @@ class BasicMixin:
             if 'textprops' not in kwargs:
                 kwargs['textprops'] = {'color': '#111827', 'fontweight': 'medium'}
 
-            plot_kwargs = cls._filter_plot_kwargs(kwargs)
+            plot_kwargs = cls._use_palette(ax, palette, cls._filter_plot_kwargs(kwargs), len(data), key='colors')
             data.plot(kind='pie', labels=labels, ax=ax, autopct='%1.1f%%', **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
             if show_plot and plt.get_backend().lower() != 'agg':
@@ -173,6 +176,7 @@ class BasicMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method
         def line(cls, data: Union['pd.DataFrame', 'pd.Series'], **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -205,13 +209,17 @@ class BasicMixin:
                 ylim (Tuple[float, float]): Y-axis limits.
                 background_color (str): Background hex color.
                 bar_edge_color (str): Bar edge hex color.
+                decimate (int/str): Keep only the first, last, minimum and maximum point per pixel column of long
+                    lines (M4, see `core.decimate`), which draws nearly the same image from a few thousand vertices
+                    (antialiased edges can differ). 'auto' uses one column per pixel of the axes at the render
+                    resolution; an int sets their number; None (the default) keeps every point.
             """
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            decimate = kwargs.pop('decimate', None)
             
             ax = kwargs.pop('ax', None)
             if ax is None:
-                fig, ax = plt.subplots()
+                fig, ax = cls._subplots()
             else:
                 fig = ax.figure
             style_kwargs = {k: kwargs.pop(k, None) for k in ['title', 'xlabel', 'ylabel', 'grid', 'data_labels', 'data_label_format',
@@ -223,14 +231,21 @@ class BasicMixin:
                                                             'background_color', 'bar_edge_color', 'grid_axis',
                                                             'data_label_position', 'data_label_color', 'data_label_fontsize']}
 
-            plot_kwargs = cls._filter_plot_kwargs(kwargs)
+            plot_kwargs = cls._use_palette(ax, palette, cls._filter_plot_kwargs(kwargs), data.shape[1] if data.ndim > 1 else 1)
+            drawn = len(ax.get_lines())
+            columns = decimate_columns(ax, decimate)
+            if columns is not None and not drawn and style_kwargs.get('xlim') is None:
+                # Decimate before pandas, which converts every timestamp of the index
+                data = decimate_frame(data, columns)
             data.plot(ax=ax, **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
+            decimate_lines(ax, ax.get_lines()[drawn:], columns)
             if show_plot and plt.get_backend().lower() != 'agg':
                 plt.show()
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method
         def scatter(cls, data: 'pd.DataFrame', x: str, y: str, **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -263,13 +278,29 @@ class BasicMixin:
                 ylim (tuple): The limits for the Y-axis, e.g., (0, 100).
                 background_color (str): The background color for the chart.
                 bar_edge_color (str): The edge color for the bars in the chart.
+                density (bool/str): Bin the points into one image (`core.density.DensityGrid`) instead of drawing
+                    a marker per point. 'auto' (the default) does so above 50,000 points and for chunked input.
+                bins (int or tuple): Number of density bins along x and y. Defaults to the axes size in pixels.
+                outliers (int): In density mode, bins with at most this many points are drawn as markers
+                    instead. Defaults to 1 (isolated points); 0 draws every bin in the image.
+                cmap: Colormap of the density image. Defaults to shades of the palette's first color.
+
+            `data` can also be an iterable of DataFrame chunks (e.g. `pd.read_csv(..., chunksize=...)`), which
+            are binned one at a time so the full point set never needs to be in memory.
             """
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            density = kwargs.pop('density', 'auto')
+            bins = kwargs.pop('bins', None)
+            outliers = kwargs.pop('outliers', 1)
+            chunked = not isinstance(data, pd.DataFrame)
+            if density == 'auto':
+                density = chunked or len(data) > DENSITY_POINTS
+            elif chunked and not density:
+                data = pd.concat(list(data))
 
             ax = kwargs.pop('ax', None)
             if ax is None:
-                fig, ax = plt.subplots()
+                fig, ax = cls._subplots()
             else:
                 fig = ax.figure
         
@@ -281,14 +312,51 @@ class BasicMixin:
                                                             'background_color', 'bar_edge_color', 'grid_axis',
                                                             'data_label_position', 'data_label_color', 'data_label_fontsize']}
 
-            plot_kwargs = cls._filter_plot_kwargs(kwargs)
-            data.plot(kind='scatter', x=x, y=y, ax=ax, **plot_kwargs)
+            plot_kwargs = cls._use_palette(ax, palette, cls._filter_plot_kwargs(kwargs), 1)
+            if density:
+                cls._density_scatter(fig, ax, data, x, y, bins, outliers, style_kwargs, plot_kwargs)
+            else:
+                data.plot(kind='scatter', x=x, y=y, ax=ax, **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
             if show_plot and plt.get_backend().lower() != 'agg':
                 plt.show()
             cls._inject_logo(fig, kwargs)
             return fig, ax
+        @staticmethod
+        def _density_scatter(fig, ax, data, x: str, y: str, bins, outliers: int, style_kwargs: dict, plot_kwargs: dict):
+            """
+            The density mode of `scatter`: a log-scaled image of the point counts at about one bin per pixel
+            of the axes, and the points of the sparsest bins as markers.
+            """
+            from matplotlib.colors import LinearSegmentedColormap, LogNorm, to_rgba
+
+            if bins is None:
+                width, height = ax.get_position().size * fig.get_size_inches() * fig.dpi
+                bins = (int(min(max(width, 16), 2048)), int(min(max(height, 16), 2048)))
+            grid = density_grid(data, x, y, bins=bins, xlim=style_kwargs.get('xlim'), ylim=style_kwargs.get('ylim'),
+                                outliers=outliers)
+            counts, points = grid.result()
+            color = plot_kwargs.get('color', plot_kwargs.get('c', '#1f77b4'))
+            if isinstance(color, (list, tuple)) and not isinstance(color[0], (int, float)):
+                color = color[0]
+            dark = tuple(0.45 * np.asarray(to_rgba(color)[:3])) + (1.0,)
+            cmap = plot_kwargs.get('cmap') or LinearSegmentedColormap.from_list('density', [to_rgba(color, 0.4), to_rgba(color), dark])
+            if counts.count():
+                image = ax.imshow(counts, origin='lower', extent=grid.extent, aspect='auto', interpolation='nearest',
+                                  cmap=cmap, norm=LogNorm(max(counts.min(), 1), max(counts.max(), 2)))
+                fig.colorbar(image, ax=ax, shrink=0.8)
+            if len(points):
+                ax.scatter(points[:, 0], points[:, 1], s=plot_kwargs.get('s', 3), color=color,
+                           alpha=plot_kwargs.get('alpha', 0.5), linewidths=0)
+            (x0, x1), (y0, y1) = grid.data_limits
+            if np.isfinite([x0, x1]).all() and x1 > x0:
+                ax.set_xlim(x0, x1)
+            if np.isfinite([y0, y1]).all() and y1 > y0:
+                ax.set_ylim(y0, y1)
+            ax.set_xlabel(x)
+            ax.set_ylabel(y)
         @classmethod
+        @chart_method
         def combo(cls, bar_data: Union['pd.Series', 'pd.DataFrame'], line_data: Union['pd.Series', 'pd.DataFrame'], left_ylabel: str = 'Bar Data', right_ylabel: str = 'Line Data', **kwargs) -> Tuple['plt.Figure', 'plt.Axes', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -300,11 +368,7 @@ class BasicMixin:
                 **kwargs: Additional keyword arguments for styling.
             """
             # Setup figure and primary axis
-            fig, ax1 = plt.subplots()
-            mpl_plot_instance = cls()
-            
-            palette_name = kwargs.get('color_palette', cls._global_theme)
-            mpl_plot_instance.utils.apply_palette(palette_name, kwargs.pop('palette_shuffle', False))
+            fig, ax1 = cls._subplots()
 
             style_kwargs = {k: kwargs.pop(k, None) for k in ['title', 'xlabel', 'grid', 
                                                             'data_labels', 'data_label_format', 'legend_title', 'series_names', 
@@ -315,16 +379,14 @@ class BasicMixin:
                                                             'tick_rotation', 'background_color', 'bar_edge_color', 'grid_axis',
                                                             'data_label_position', 'data_label_color', 'data_label_fontsize']}
 
-            # Get palette colors
+            # Get palette colors: the bar and the third color of a named palette, or the first two of a custom one
             palette_name = kwargs.pop('color_palette', cls._global_theme)
+            line_slot = 2 if isinstance(palette_name, str) else 1
             if isinstance(palette_name, str):
-                palette = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
-                bar_color = palette[0]
-                line_color = palette[2] if len(palette) > 2 else '#FFB74D'
-            else:
-                palette = palette_name
-                bar_color = palette[0] if len(palette) > 0 else '#66BB6A'
-                line_color = palette[1] if len(palette) > 1 else '#FFB74D'
+                palette_name = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
+            palette = Utils.resolve_palette(palette_name, kwargs.pop('palette_shuffle', False))
+            bar_color = palette[0] if len(palette) > 0 else '#66BB6A'
+            line_color = palette[line_slot] if len(palette) > line_slot else '#FFB74D'
 
             # Bar chart
             plot_kwargs = cls._filter_plot_kwargs(kwargs)
@@ -347,6 +409,8 @@ class BasicMixin:
             handles1, labels1 = ax1.get_legend_handles_labels()
             handles2, labels2 = ax2.get_legend_handles_labels()
             ax1.legend(handles1 + handles2, labels1 + labels2, loc='upper left')
+            if style_kwargs.get('font_name'):
+                apply_font(ax1, style_kwargs['font_name'])
 
             if show_plot and plt.get_backend().lower() != 'agg':
                 plt.show()
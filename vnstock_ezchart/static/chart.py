@@ -10,9 +10,6 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 from ..core.style import StyleMixin
@@ -27,11 +24,125 @@ class Chart(StyleMixin, BasicMixin, FinancialMixin, StatisticalMixin, Specialize
     """
     Core static charting library for investment analysis.
     Provides methods to draw modern, AI-agent compatible charts using Matplotlib and Seaborn.
+
+    Every chart method also accepts `output='png'|'webp'|'rgba'` to get the rendered chart
+    back as encoded bytes (or a NumPy RGBA array) instead of `(fig, ax)`; the figure is drawn
+    once and closed. `output_dpi` (default 150) and `output_tight` (default True) tune it.
     """
     def __init__(self):
         """Initialize the Chart object."""
         self.utils = Utils()
 
+    @classmethod
+    def render_batch(cls, specs, workers: Optional[int] = None, ordered: bool = False):
+        """
+        Renders many charts on a persistent pool of warmed worker processes.
+
+        Each spec is a dict such as `{'method': 'candle', 'data': df, 'kwargs': {'title': 'FPT'}, 'output': 'fpt.png'}`.
+        Large DataFrames are passed to the workers through shared memory, and encoded images
+        for specs without an 'output' path come back the same way. See `core.batch.render_batch`.
+
+        Args:
+            specs (Iterable[dict]): Chart specs.
+            workers (int): Number of worker processes. Defaults to the CPU count.
+            ordered (bool): Yield results in spec order instead of completion order.
+
+        Yields:
+            dict: Results with keys 'index', 'method', 'output', 'image', 'error' and 'elapsed'.
+        """
+        from ..core.batch import render_batch
+        return render_batch(specs, workers=workers, ordered=ordered)
+
+    @staticmethod
+    def prefork(workers: Optional[int] = None, **theme):
+        """
+        Warms up this process once and forks ready-to-draw renderer processes from it.
+
+        Useful for latency-sensitive services such as alert bots: the first chart rendered by
+        the returned pool costs about as much as any later one.
+
+        Args:
+            workers (int): Number of worker processes. Defaults to the CPU count.
+            **theme: Keyword arguments for `set_theme` (e.g. theme_name='minimal', lang='en').
+
+        Returns:
+            WarmPool: Pool with `render`, `submit`, `render_batch` and `shutdown` methods.
+        """
+        from ..core.warm import WarmPool
+        return WarmPool(workers=workers, theme=theme)
+
+    @staticmethod
+    def resample_ticks(ticks, interval: str = '1m', exchange: str = 'HOSE', auctions: str = 'merge', **columns):
+        """
+        Aggregates matched trades (time, price, volume) into OHLCV bars ready for `candle` and `backtest`.
+
+        Bars follow the HOSE/HNX/UPCOM sessions: they never span the lunch break, and the
+        ATO/ATC auctions are merged into the adjacent bar, kept as their own bar or dropped.
+        Chunked input (e.g. `pd.read_csv(..., chunksize=...)`) is consumed one chunk at a time;
+        for live feeds use `core.ticks.TickAggregator` directly.
+
+        Args:
+            ticks (pd.DataFrame or iterable of pd.DataFrame): Trades with 'time', 'price' and 'volume' columns.
+            interval (str): Bar length, e.g. '1m', '5m', '15m', '1h' or '1D'.
+            exchange (str): 'HOSE', 'HNX' or 'UPCOM'.
+            auctions (str): 'merge', 'separate' or 'drop'.
+            **columns: `time_col`, `price_col` and `volume_col` to use other column names.
+
+        Returns:
+            pd.DataFrame: Bars with 'Open', 'High', 'Low', 'Close' and 'Volume' columns.
+        """
+        from ..core.ticks import resample_ticks
+        return resample_ticks(ticks, interval=interval, exchange=exchange, auctions=auctions, **columns)
+
+    @staticmethod
+    def round_trips(trades):
+        """
+        Pairs the entries and exits of a trade list first-in first-out into round trips.
+
+        Sells close long units before opening a short (and buys close shorts first), partial
+        fills split a lot across several round trips, and units still open at the end are left
+        out. The pairing is vectorized, so tens of thousands of trades take milliseconds.
+
+        Args:
+            trades (pd.DataFrame, list, np.ndarray): Trades as accepted by `backtest`, with an optional
+                'quantity' (or 'qty'/'shares'/'volume'/'size') column; trades without one count as 1 unit.
+
+        Returns:
+            pd.DataFrame: One row per matched entry/exit pair with 'entry_time', 'exit_time', 'direction'
+            (+1 long, -1 short), 'quantity', 'entry_price', 'exit_price', 'pnl', 'return' and 'holding'.
+        """
+        from ..core.trades import round_trips
+        return round_trips(trades)
+
+    @staticmethod
+    def monthly_returns(data):
+        """
+        Year x Month returns table, as drawn by `returns_heatmap`.
+
+        Daily or intraday returns are compounded per month (expm1 of summed log1p returns);
+        monthly data is laid out as is. A DataFrame with one returns column per ticker (e.g. the
+        VN30 basket) is computed in one pass and the tables are stacked under a (ticker, Year) index.
+
+        Args:
+            data (pd.Series, pd.DataFrame): Periodic returns with a DatetimeIndex.
+
+        Returns:
+            pd.DataFrame: Columns 'Jan'..'Dec', one row per year (per ticker and year for a DataFrame).
+
+        Example:
+            >>> table = Chart.monthly_returns(vn30_returns)
+            >>> for ticker in vn30_returns.columns:
+            ...     Chart.returns_heatmap(table.loc[ticker], title=ticker, output='png')
+        """
+        from ..core.returns import monthly_returns
+        return monthly_returns(data)
+
+    @staticmethod
+    def shutdown_batch_pool():
+        """Stops the worker processes started by `render_batch`."""
+        from ..core.batch import shutdown_pools
+        shutdown_pools()
+
 class MPlot(Chart):
     """
     Deprecated alias for Chart. Maintained for backward compatibility.
@@ -5,19 +5,24 @@ import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 from ..config import *
 from ..utils import Utils
+from ..core.context import rc_scope
+from ..core.decimate import decimate_columns, decimate_lines, m4_indices
+from ..core.indicators import indicator_plots
+from ..core.ohlc import aggregate_like, aggregate_ohlcv, bucket_starts, ohlc_frame
+from ..core.render import chart_method
+from ..core.returns import MONTH_LABELS, drawdown_series, final_values, monthly_returns
+from ..core.strategies import line_segments
 import matplotlib.ticker as mticker
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 class FinancialMixin:
         @classmethod
-        def candle(cls, data: 'pd.DataFrame', title: str = '', figsize: Tuple[float, float] = (12, 8), volume: bool = True, overlays: list = None, subplots: list = None, **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
+        @chart_method(exclusive=True)
+        def candle(cls, data: 'pd.DataFrame', title: str = '', figsize: Tuple[float, float] = (12, 8), volume: bool = True, overlays: list = None, subplots: list = None, engine: str = 'mplfinance', max_bars: Union[int, str, None] = 'auto', indicators: list = None, **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             """
             Draws a candlestick chart combining volume data.
             Input data must be a pandas DataFrame with a Datetime index containing 'Open', 'High', 'Low', 'Close' columns. The 'Volume' column is optional.
@@ -27,11 +32,24 @@ class FinancialMixin:
                 title (str): The title of the chart.
                 figsize (tuple): The size of the chart.
                 volume (bool): Displays trading volume. Defaults to True.
+                engine (str): 'mplfinance' (default) or 'native'. The native engine draws all candles, wicks and
+                    volume bars as a few NumPy-built collections, which is much faster for thousands of bars.
+                    It supports overlays, subplots, ylim, xlim, datetime_format and xlabel.
+                max_bars (int or str): Merge consecutive bars into at most this many OHLCV buckets before drawing
+                    (first open, highest high, lowest low, last close, summed volume); overlays and subplots keep the
+                    last value of each bucket. 'auto' (the default) leaves frames of up to 2,000 bars as they are and merges
+                    longer ones to about 3 pixels per candle of the price panel, measured at the `output_dpi` of an
+                    `output=` call or the figure dpi otherwise. None draws every bar.
+                indicators (list): Indicators computed from the closes and laid out automatically, e.g.
+                    ['sma20', 'ema50', 'bbands20', 'rsi14', 'macd']. Moving averages and Bollinger Bands are drawn over
+                    the candles (with a legend), RSI and MACD get a panel each below the other subplots. A dict such as
+                    {'name': 'sma20', 'color': '#f59e0b', 'width': 2} overrides the styling. See `core.indicators`.
                 color_palette (str): The color palette to use. Defaults to 'vnstock'.
                 **kwargs: Additional keyword arguments for styling.
             """
-            import mplfinance as mpf
-        
+            if engine not in ('mplfinance', 'native'):
+                raise ValueError(f"Unknown engine '{engine}'. Choose 'mplfinance' or 'native'.")
+
             mpl_plot_instance = cls()
             palette_name = kwargs.pop('color_palette', cls._global_theme)
             palette = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
@@ -43,17 +61,7 @@ class FinancialMixin:
             bg_color = '#ffffff'
             text_color = '#475569'
 
-            mc = mpf.make_marketcolors(
-                up=up_color,
-                down=down_color,
-                edge='inherit',
-                wick='inherit',
-                volume='in',
-                ohlc='inherit'
-            )
-        
-            s = mpf.make_mpf_style(
-                marketcolors=mc,
+            style = dict(
                 gridstyle='-',
                 gridcolor=grid_color,
                 facecolor=bg_color,
@@ -73,28 +81,25 @@ class FinancialMixin:
             )
         
             # Ensure index is Datetime
-            plot_df = data.copy()
-            if not isinstance(plot_df.index, pd.DatetimeIndex):
-                if 'time' in plot_df.columns:
-                    plot_df = plot_df.set_index('time')
-                elif 'date' in plot_df.columns:
-                    plot_df = plot_df.set_index('date')
-                plot_df.index = pd.to_datetime(plot_df.index)
-            
-            rename_map = {c: c.capitalize() for c in plot_df.columns if c.lower() in ['open', 'high', 'low', 'close', 'volume']}
-            plot_df = plot_df.rename(columns=rename_map)
+            plot_df = ohlc_frame(data)
 
-            font_name = kwargs.pop('font_name', plt.rcParams['font.family'])
+            font_name = kwargs.pop('font_name', cls._global_font or plt.rcParams['font.family'])
             if isinstance(font_name, list):
                 font_name = font_name[0]
             
+            indicator_legend = []
+            if indicators:
+                indicator_overlays, indicator_panels, indicator_legend = indicator_plots(plot_df, indicators, palette, up_color, down_color)
+                overlays = list(overlays or []) + indicator_overlays
+                subplots = list(subplots or []) + indicator_panels
+
             apds = []
             if overlays:
                 for overlay in overlays:
                     if isinstance(overlay, dict):
-                        apds.append(mpf.make_addplot(overlay['data'], type=overlay.get('type', 'line'), color=overlay.get('color', None), panel=0, alpha=overlay.get('alpha', 0.8), width=overlay.get('width', 1.0)))
+                        apds.append(dict(data=overlay['data'], type=overlay.get('type', 'line'), color=overlay.get('color', None), panel=0, alpha=overlay.get('alpha', 0.8), width=overlay.get('width', 1.0)))
                     else:
-                        apds.append(mpf.make_addplot(overlay, type='line', panel=0, alpha=0.8, width=1.0))
+                        apds.append(dict(data=overlay, type='line', panel=0, alpha=0.8, width=1.0))
                     
             if subplots:
                 panel_idx = 2 if volume else 1
@@ -105,6 +110,7 @@ class FinancialMixin:
                     for subplot in subplot_group:
                         if isinstance(subplot, dict):
                             kwargs_addplot = {
+                                'data': subplot['data'],
                                 'type': subplot.get('type', 'line'),
                                 'panel': panel_idx,
                                 'secondary_y': subplot.get('secondary_y', False),
@@ -115,9 +121,9 @@ class FinancialMixin:
                             if 'ylabel' in subplot and subplot['ylabel']:
                                 kwargs_addplot['ylabel'] = subplot['ylabel']
                                 
-                            apds.append(mpf.make_addplot(subplot['data'], **kwargs_addplot))
+                            apds.append(kwargs_addplot)
                         else:
-                            apds.append(mpf.make_addplot(subplot, type='line', panel=panel_idx, width=1.0))
+                            apds.append(dict(data=subplot, type='line', panel=panel_idx, width=1.0))
                     panel_idx += 1
                 
             # If we added subplots, we need to adjust panel_ratios
@@ -133,26 +139,29 @@ class FinancialMixin:
             price_label = 'Price' if is_en else 'Giá'
 
             mpf_kwargs = {
-                'type': 'candle', 
                 'volume': volume, 
-                'style': s,
                 'figsize': figsize,
                 'title': "",
                 'ylabel': price_label,
                 'ylabel_lower': vol_label if volume else '',
-                'returnfig': True,
-                'tight_layout': True,
                 'xrotation': 0,
             }
             show_plot = kwargs.pop('show', True)
-            if apds:
-                mpf_kwargs['addplot'] = apds
             if len(panel_ratios) > 1:
                 mpf_kwargs['panel_ratios'] = panel_ratios
             
             mpf_kwargs.update(kwargs)
 
-            fig, axes = mpf.plot(plot_df, **mpf_kwargs)
+            # Level of detail: merge bars that would be drawn narrower than a few pixels of the price panel
+            starts = bucket_starts(len(plot_df), max_bars, lambda: cls._price_panel_pixels(
+                plot_df, engine, apds, style, up_color, down_color, mpf_kwargs))
+            if starts is not None:
+                plot_df = aggregate_ohlcv(plot_df, starts)
+                for spec in apds:
+                    spec['data'] = aggregate_like(spec['data'], starts, plot_df.index)
+
+            with rc_scope():
+                fig, axes = cls._plot_candles(plot_df, engine, apds, style, up_color, down_color, mpf_kwargs)
         
             # Customize font title
             if title:
@@ -187,9 +196,15 @@ class FinancialMixin:
                 ax.spines['right'].set_visible(False)
                 ax.spines['left'].set_linewidth(1.5)
                 ax.spines['bottom'].set_linewidth(1.5)
+
+            if indicator_legend:
+                from matplotlib.lines import Line2D
+                handles = [Line2D([], [], color=color, linewidth=1.5) for _, color in indicator_legend]
+                axes[0].legend(handles, [label for label, _ in indicator_legend], loc='upper left', fontsize=9, frameon=False,
+                               ncol=min(len(indicator_legend), 4))
             
             # Add extra padding for the title
-            plt.subplots_adjust(top=0.92)
+            fig.subplots_adjust(top=0.92)
             if show_plot and plt.get_backend().lower() != 'agg':
                 plt.show()
             cls._inject_logo(fig, kwargs)
@@ -200,80 +215,216 @@ class FinancialMixin:
             warnings.warn("'candlestick' is deprecated. Please use 'candle' instead.", DeprecationWarning, stacklevel=2)
             return cls.candle(data, **kwargs)
         @classmethod
-        def equity_curve(cls, data: Union['pd.Series', 'pd.DataFrame'], benchmark: Optional[Union['pd.Series', 'pd.DataFrame']] = None, title: str = 'Equity Curve & Drawdown', figsize: Tuple[float, float] = (10, 6), **kwargs) -> Tuple['plt.Figure', 'plt.Axes', 'plt.Axes']:
+        def live_candle(cls, data: 'pd.DataFrame', capacity: int = 300, headroom: Optional[int] = None, title: str = '', figsize: Tuple[float, float] = (12, 8), volume: bool = True, overlays: list = None, **kwargs):
+            """
+            Draws a candlestick chart that can be updated in place, for live screens refreshed several times per second.
+
+            The chart keeps the last `capacity` bars in a ring buffer and, on each update, redraws only the last
+            candle, its volume bar and the last overlay points on top of a cached background (blitting). It is
+            drawn with the native engine and styled like `candle`.
+
+            Args:
+                data (pd.DataFrame): Initial bars, as for `candle`. Only the last `capacity - headroom` are kept.
+                capacity (int): Number of bar slots on screen (and in the ring buffer). Defaults to 300.
+                headroom (int): Empty slots left on the right for new bars; when they run out, the chart scrolls by
+                    this many bars. Defaults to `capacity // 5`.
+                title (str): The title of the chart.
+                figsize (tuple): The size of the chart.
+                volume (bool): Displays trading volume. Defaults to True.
+                overlays (list): Line overlays (Series aligned with `data`, or dicts with 'data', 'color', 'width',
+                    'alpha'). A Series with a DatetimeIndex is aligned by time; other values are matched to the last
+                    bars and need at least as many values as bars are kept. `append` and `update_last` take their new
+                    values in the same order.
+                **kwargs: Additional keyword arguments for `candle` (color_palette, font_name, datetime_format...).
+                    The rendering options `output`, `output_dpi`, `output_tight`, `pyplot` and `cache` are not accepted,
+                    nor is `max_bars`: every slot of the ring buffer is one candle.
+
+            Returns:
+                LiveCandle: Chart object with `append(bar)`, `update_last(bar)`, `redraw()` and `frame(output)`,
+                    and the Matplotlib `figure` and `axes`.
+
+            Example:
+                >>> live = Chart.live_candle(df, title='FPT 1m', overlays=[df['Close'].rolling(20).mean()])
+                >>> live.update_last({'Open': 95.1, 'High': 95.6, 'Low': 95.0, 'Close': 95.4, 'Volume': 120_500}, overlays=[95.2])
+                >>> live.append({'time': '2024-06-03 10:16', 'Open': 95.4, 'High': 95.4, 'Low': 95.3, 'Close': 95.3, 'Volume': 800})
+            """
+            from ..core.context import scoped_font
+            from ..core.live import LiveCandle
+            from ..core.native import datetime_format
+
+            unsupported = sorted({'output', 'output_dpi', 'output_tight', 'pyplot', 'cache', 'max_bars'} & set(kwargs))
+            if unsupported:
+                raise TypeError(f"live_candle() does not accept {', '.join(unsupported)}: the live chart is a figure kept "
+                                "open and redrawn in place; render frames with `frame(output)`.")
+            headroom = capacity // 5 if headroom is None else headroom
+            if capacity < 2 or not 0 <= headroom < capacity:
+                raise ValueError("capacity must be at least 2 and headroom between 0 and capacity - 1.")
+            plot_df = ohlc_frame(data).iloc[-(capacity - headroom):]
+            specs, values = [], []
+            for overlay in overlays or []:
+                spec = dict(overlay) if isinstance(overlay, dict) else {'data': overlay}
+                series = spec['data']
+                if isinstance(series, pd.Series) and isinstance(series.index, pd.DatetimeIndex):
+                    series = series.reindex(plot_df.index)
+                else:
+                    series = np.asarray(series, dtype=float)
+                    if series.ndim != 1 or len(series) < len(plot_df):
+                        raise ValueError(f"Overlay {len(specs)} has {len(series)} values but the chart starts with "
+                                         f"{len(plot_df)} bars; pass one value per bar of `data`, or a Series with a "
+                                         "DatetimeIndex to align it by time.")
+                    series = series[-len(plot_df):]
+                spec['data'], spec['type'] = pd.Series(np.asarray(series, dtype=float), index=plot_df.index), 'line'
+                specs.append(spec)
+                values.append(spec['data'].to_numpy())
+
+            palette = Utils.brand_palettes.get(kwargs.get('color_palette', cls._global_theme), Utils.brand_palettes['vnstock'])
+            up_color = palette[0] if len(palette) > 0 else '#4CAF50'
+            down_color = palette[3] if len(palette) > 3 else '#EF5350'
+            fmt = kwargs.get('datetime_format') or datetime_format(plot_df.index)
+            fig, axes = cls.candle(plot_df, figsize=figsize, volume=volume, overlays=specs, engine='native',
+                                   max_bars=None, show=False, **kwargs)
+            title_text = None
+            if title:
+                font_name = scoped_font() or kwargs.get('font_name', cls._global_font or plt.rcParams['font.family'])
+                if isinstance(font_name, list):
+                    font_name = font_name[0]
+                title_text = fig.suptitle(title, fontweight="black", fontname=font_name, fontsize=16, color='#111827')
+            return LiveCandle(fig, axes, plot_df, values, capacity, headroom, volume, up_color, down_color, fmt,
+                              title=title_text)
+        @classmethod
+        @chart_method
+        def equity_curve(cls, data: Union['pd.Series', 'pd.DataFrame', 'np.ndarray'], benchmark: Optional[Union['pd.Series', 'pd.DataFrame']] = None, title: str = 'Equity Curve & Drawdown', figsize: Tuple[float, float] = (10, 6), highlight: Union[bool, List[str]] = True, decimate: Union[int, str, None] = None, **kwargs) -> Tuple['plt.Figure', 'plt.Axes', 'plt.Axes']:
             """
             Draws an equity curve (cumulative returns) with an underwater drawdown subplot.
         
             Args:
-                data (pd.Series/pd.DataFrame): Cumulative returns series.
+                data (pd.Series/pd.DataFrame/np.ndarray): Cumulative returns series. A DataFrame with several columns
+                    (or a 2-D array, one column per curve) draws every column, e.g. the strategies of a parameter
+                    sweep: all curves and drawdowns are computed at once and drawn as one LineCollection each.
                 benchmark (pd.Series): Optional benchmark cumulative returns.
                 title (str): Chart title.
                 figsize (tuple): Figure size.
+                highlight (bool/list): With several curves, draws the 'best', 'worst' and 'median' curve (by final
+                    value) on top with a legend. Pass a subset such as ['best', 'worst'], or False for none.
+                decimate (int/str): Draw only the first, last, minimum and maximum point per pixel column of long series
+                    (M4, see `core.decimate`): nearly the same image from a few thousand vertices (antialiased edges can
+                    differ). 'auto' uses one column per pixel of the axes at the render resolution; an int sets their
+                    number; None (the default) keeps every point.
             """
+            import matplotlib.dates as mdates
             import numpy as np
         
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize, gridspec_kw={'height_ratios': [3, 1]}, sharex=True)
+            fig, (ax1, ax2) = cls._subplots(2, 1, figsize=figsize, gridspec_kw={'height_ratios': [3, 1]}, sharex=True)
+            columns = decimate_columns(ax1, decimate)
         
             palette_name = kwargs.pop('color_palette', cls._global_theme)
             palette = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
             main_color = palette[0] if len(palette) > 0 else '#4CAF50'
             bench_color = palette[1] if len(palette) > 1 else '#94a3b8'
+            drawdown_color = palette[3] if len(palette) > 3 else '#ef4444'
         
-            # Plot Equity Curve
-            if isinstance(data, pd.DataFrame):
-                data = data.iloc[:, 0]
-            ax1.plot(data.index, data.values, color=main_color, linewidth=2, label='Strategy')
+            if isinstance(data, np.ndarray):
+                data = pd.DataFrame(data) if data.ndim == 2 else pd.Series(data)
+            if isinstance(data, pd.DataFrame) and data.shape[1] > 1:
+                cls._equity_curves(ax1, ax2, data, palette, highlight, columns)
+            else:
+                # Plot Equity Curve
+                if isinstance(data, pd.DataFrame):
+                    data = data.iloc[:, 0]
+                ax1.plot(data.index, data.values, color=main_color, linewidth=2, label='Strategy')
         
             if benchmark is not None:
                 if isinstance(benchmark, pd.DataFrame):
                     benchmark = benchmark.iloc[:, 0]
                 ax1.plot(benchmark.index, benchmark.values, color=bench_color, linewidth=1.5, linestyle='--', label='Benchmark')
             
-            # Plot Drawdown
-            running_max = data.cummax()
-            drawdown = (data - running_max) / running_max
-            drawdown_color = palette[3] if len(palette) > 3 else '#ef4444'
-            ax2.fill_between(drawdown.index, drawdown.values, 0, color=drawdown_color, alpha=0.3)
-            ax2.plot(drawdown.index, drawdown.values, color=drawdown_color, linewidth=1)
+            if isinstance(data, pd.Series):
+                # Plot Drawdown
+                drawdown = drawdown_series(data)
+                keep = None
+                if columns is not None:
+                    x = mdates.date2num(drawdown.index) if isinstance(drawdown.index, pd.DatetimeIndex) else np.asarray(drawdown.index, dtype=float)
+                    keep = m4_indices(x, drawdown.to_numpy(), columns)
+                filled = drawdown if keep is None else drawdown.iloc[keep]
+                ax2.fill_between(filled.index, filled.values, 0, color=drawdown_color, alpha=0.3)
+                ax2.plot(drawdown.index, drawdown.values, color=drawdown_color, linewidth=1)
         
             style_kwargs = cls._filter_plot_kwargs(kwargs)
             cls.apply_chart_style(ax1, title=title, ylabel='Cumulative Return', show_xaxis=False, show_legend=True, **style_kwargs)
             cls.apply_chart_style(ax2, ylabel='Drawdown', ytick_format='{:.1%}', **style_kwargs)
+            for ax in (ax1, ax2):
+                decimate_lines(ax, columns=columns)
         
-            plt.tight_layout()
+            fig.tight_layout()
             cls._inject_logo(fig, kwargs)
             return fig, ax1, ax2
+        @staticmethod
+        def _equity_curves(ax1, ax2, data: 'pd.DataFrame', palette: List[str], highlight: Union[bool, List[str]],
+                           columns: Optional[int] = None) -> None:
+            """
+            Draws the columns of `data` and their drawdowns as one LineCollection per axes, highlighted curves on top.
+            Long curves keep their `m4_indices` points for `columns` pixel columns.
+            """
+            import matplotlib.dates as mdates
+            from matplotlib.collections import LineCollection
+
+            values = data.to_numpy(dtype=float)
+            drawdowns = drawdown_series(data).to_numpy()
+            dates = isinstance(data.index, pd.DatetimeIndex)
+            x = mdates.date2num(data.index) if dates else np.asarray(data.index, dtype=float)
+            main_color = palette[0] if len(palette) > 0 else '#4CAF50'
+            drawdown_color = palette[3] if len(palette) > 3 else '#ef4444'
+            # Fainter lines as curves pile up, so dense regions read as density
+            alpha = float(np.clip(8.0 / values.shape[1], 0.04, 0.6))
+            for ax, matrix, color in ((ax1, values, '#94a3b8'), (ax2, drawdowns, drawdown_color)):
+                keep = None if columns is None else m4_indices(x, matrix, columns)
+                segments = line_segments(matrix, x) if keep is None else line_segments(np.take_along_axis(matrix, keep, axis=0), x[keep])
+                ax.add_collection(LineCollection(segments, colors=color, linewidths=0.8, alpha=alpha))
+                if np.isfinite(matrix).any():
+                    low, high = np.nanmin(matrix), np.nanmax(matrix)
+                    margin = 0.05 * (high - low) or 0.05 * abs(high) or 0.05
+                    ax.set_ylim(low - margin, high + margin)
+            if len(x):
+                ax1.set_xlim(x.min(), x.max())
+            if dates:
+                ax1.xaxis_date()
+
+            finals = final_values(values)
+            if highlight is False or highlight is None or not np.isfinite(finals).any():
+                return
+            names = ('best', 'worst', 'median') if highlight is True else tuple(highlight)
+            unknown = set(names) - {'best', 'worst', 'median'}
+            if unknown:
+                raise ValueError(f"Unknown highlight {sorted(unknown)}. Use 'best', 'worst' and/or 'median'.")
+            ranked = np.flatnonzero(np.isfinite(finals))
+            ranked = ranked[np.argsort(finals[ranked], kind='stable')]
+            picks = {'best': (ranked[-1], main_color), 'worst': (ranked[0], drawdown_color),
+                     'median': (ranked[(len(ranked) - 1) // 2], palette[2] if len(palette) > 2 else '#f59e0b')}
+            for name in names:
+                column, color = picks[name]
+                label = f"{name.capitalize()}: {data.columns[column]}"
+                ax1.plot(x, values[:, column], color=color, linewidth=2, label=label, zorder=3)
+                ax2.plot(x, drawdowns[:, column], color=color, linewidth=1, zorder=3)
         @classmethod
+        @chart_method
         def returns_heatmap(cls, data: Union['pd.Series', 'pd.DataFrame'], title: str = 'Monthly Returns Heatmap', figsize: Tuple[float, float] = (10, 5), **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             """
             Draws a monthly returns heatmap (Year x Month matrix).
         
             Args:
                 data (pd.Series/pd.DataFrame): Returns series (daily or monthly). If daily, it will be resampled to monthly.
+                    A Year x Month table from `Chart.monthly_returns` (e.g. `table.loc['FPT']` of a basket) is drawn as is.
+                raster (bool): See `heatmap`; tables larger than its `raster_threshold` are drawn as one image.
             """
             import numpy as np
             import seaborn as sns
         
-            if isinstance(data, pd.DataFrame):
-                data = data.iloc[:, 0]
-            
-            # Ensure it is monthly. We check if the frequency is roughly daily
-            if len(data) > 0 and (data.index[1] - data.index[0]).days < 20:
-                try:
-                    monthly_ret = data.resample('ME').apply(lambda x: (1 + x).prod() - 1)
-                except ValueError:
-                    monthly_ret = data.resample('M').apply(lambda x: (1 + x).prod() - 1)
+            if isinstance(data, pd.DataFrame) and list(data.columns) == MONTH_LABELS:
+                pivot = data
             else:
-                monthly_ret = data
-            
-            df_heatmap = pd.DataFrame({'Year': monthly_ret.index.year, 'Month': monthly_ret.index.month, 'Return': monthly_ret.values})
-            pivot = df_heatmap.pivot(index='Year', columns='Month', values='Return')
-        
-            for m in range(1, 13):
-                if m not in pivot.columns:
-                    pivot[m] = np.nan
-            pivot = pivot[range(1, 13)]
-            pivot.columns = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+                if isinstance(data, pd.DataFrame):
+                    data = data.iloc[:, 0]
+                pivot = monthly_returns(data)
         
             from matplotlib.colors import LinearSegmentedColormap
             palette_name = kwargs.get('color_palette', cls._global_theme)
@@ -289,8 +440,10 @@ class FinancialMixin:
             # Improve display interface for y and x axes
             if ax.get_yticklabels():
                 ax.set_yticklabels(ax.get_yticklabels(), rotation=0)
-            ax.set_ylabel('')
-            ax.set_xlabel('')
+            if not kwargs.get('ylabel'):
+                ax.set_ylabel('')
+            if not kwargs.get('xlabel'):
+                ax.set_xlabel('')
         
             cls._inject_logo(fig, kwargs)
             return fig, ax
@@ -1,14 +1,22 @@
 import os
+import warnings
 from typing import Union, List, Optional, Tuple, Dict, Any
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import mplfinance as mpf
 import matplotlib.ticker as mticker
 from ..utils import Utils
+from ..core.context import rc_scope
+from ..core.indicators import indicator_plots
+from ..core.ohlc import aggregate_like, aggregate_ohlcv, bucket_starts, ohlc_frame
+from ..core.render import chart_method, rendering_output
+from ..core.risk import RISK_METRICS, risk_frame, risk_inputs, rolling_risk as risk_kernels
+from ..core.strategies import align_strategies, line_segments, portfolio_columns, portfolio_frame, strategy_colors
+from ..core.trades import bar_positions, merge_spans, round_trips as fifo_round_trips, trade_markers
 
 class QuantMixin:
     @classmethod
+    @chart_method(exclusive=True)
     def backtest(
         cls, 
         data: pd.DataFrame, 
@@ -18,6 +26,12 @@ class QuantMixin:
         figsize: Tuple[float, float] = (14, 10), 
         volume: bool = True,
         overlays: list = None,
+        engine: str = 'mplfinance',
+        max_bars: Union[int, str, None] = 'auto',
+        snap_trades: str = 'exact',
+        strategies: Optional[Dict[str, Any]] = None,
+        round_trips: bool = False,
+        indicators: list = None,
         **kwargs
     ) -> Tuple['plt.Figure', 'plt.Axes']:
         """
@@ -32,8 +46,32 @@ class QuantMixin:
             figsize (tuple): Chart size.
             volume (bool): Show volume panel.
             overlays (list): Additional indicators for the main candlestick panel.
+            engine (str): 'mplfinance' (default) or 'native' for the vectorized candlestick renderer (see `candle`).
+            max_bars (int or str): Merge bars into at most this many OHLCV buckets, or 'auto' (the default) to fit
+                the price panel once there are more than 2,000 bars; None draws every bar (see `candle`). Trade markers, overlays and portfolio panels are aligned to the buckets.
+            snap_trades (str): Placement of trades whose time is not a bar of `data`: 'exact' (default) leaves them
+                out with a warning, 'nearest' uses the closest bar, 'backward' the bar at or before the trade and
+                'forward' the bar at or after it. When several trades hit the same bar, the lowest buy and the
+                highest sell are marked.
+            strategies (dict): Compare several strategies (e.g. parameter variants) on one chart instead of passing
+                `trades` and `portfolio`: a mapping of strategy name -> (trades, portfolio), or -> {'trades': ...,
+                'portfolio': ...}. The candles are drawn once; the equity curves and drawdowns of all strategies share
+                one panel each and are drawn as a single LineCollection per panel, and the trade markers are colored
+                by strategy.
+            round_trips (bool): Pair entries with exits first-in first-out (see `Chart.round_trips`), shade each
+                holding period on the price panel (up color for winners, down color for losers) and return
+                `(fig, axes, round_trips)` with the round-trip table. Not available with `strategies`, nor with
+                `output=`, which returns only the image: compute the table with `Chart.round_trips` instead.
+            indicators (list): Indicators computed from the closes, e.g. ['sma20', 'ema50', 'rsi14', 'macd'] (see
+                `candle`). Overlays join the price panel, RSI and MACD get a panel each below the drawdown.
             **kwargs: Styling parameters.
         """
+        if engine not in ('mplfinance', 'native'):
+            raise ValueError(f"Unknown engine '{engine}'. Choose 'mplfinance' or 'native'.")
+        if round_trips and rendering_output():
+            raise ValueError("`round_trips=True` returns the round-trip table with the figure, which `output=` would "
+                             "drop. Draw the figure without `output=`, or get the table from `Chart.round_trips(trades)`.")
+
         palette_name = kwargs.pop('color_palette', cls._global_theme)
         palette = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
         
@@ -49,12 +87,8 @@ class QuantMixin:
         equity_color = palette[1] if len(palette) > 1 else '#3b82f6'
         drawdown_color = palette[3] if len(palette) > 3 else '#ef4444'
 
-        mc = mpf.make_marketcolors(
-            up=up_color, down=down_color, edge='inherit', wick='inherit', volume='in', ohlc='inherit'
-        )
-    
-        s = mpf.make_mpf_style(
-            marketcolors=mc, gridstyle='-', gridcolor=grid_color, facecolor=bg_color,
+        style = dict(
+            gridstyle='-', gridcolor=grid_color, facecolor=bg_color,
             edgecolor=bg_color, figcolor=bg_color, y_on_right=False,
             rc={
                 'patch.edgecolor': '#FFFFFF', 'patch.force_edgecolor': True, 'patch.linewidth': 1.0,
@@ -65,148 +99,163 @@ class QuantMixin:
         )
     
         # 1. Process Main Data
-        plot_df = data.copy()
-        if not isinstance(plot_df.index, pd.DatetimeIndex):
-            if 'time' in plot_df.columns:
-                plot_df = plot_df.set_index('time')
-            elif 'date' in plot_df.columns:
-                plot_df = plot_df.set_index('date')
-            plot_df.index = pd.to_datetime(plot_df.index)
-        
-        rename_map = {c: c.capitalize() for c in plot_df.columns if c.lower() in ['open', 'high', 'low', 'close', 'volume']}
-        plot_df = plot_df.rename(columns=rename_map)
+        plot_df = ohlc_frame(data)
 
         # 2. Process Trades
-        buy_markers = pd.Series(index=plot_df.index, dtype=float)
-        sell_markers = pd.Series(index=plot_df.index, dtype=float)
-
-        if trades is not None:
-            if isinstance(trades, pd.DataFrame):
-                tr_df = trades.copy()
-            elif isinstance(trades, list):
-                tr_df = pd.DataFrame(trades)
-            elif isinstance(trades, np.ndarray):
-                # Attempt to convert to dataframe assuming structured array or record array
-                try:
-                    tr_df = pd.DataFrame(trades)
-                except:
-                    tr_df = pd.DataFrame()
-            else:
-                tr_df = pd.DataFrame()
-
-            if not tr_df.empty:
-                # Find time column
-                time_col = next((c for c in tr_df.columns if str(c).lower() in ['time', 'date', 'trade_date']), None)
-                type_col = next((c for c in tr_df.columns if str(c).lower() in ['type', 'trade_type', 'side']), None)
-                price_col = next((c for c in tr_df.columns if str(c).lower() in ['price', 'exec_price']), None)
-
-                if time_col and type_col and price_col:
-                    tr_df[time_col] = pd.to_datetime(tr_df[time_col])
-                    for _, row in tr_df.iterrows():
-                        t_date = row[time_col]
-                        t_type = str(row[type_col]).upper()
-                        t_price = float(row[price_col])
-
-                        if pd.notna(t_date) and t_date in plot_df.index:
-                            if t_type in ['MUA', 'BUY', 'LONG', '1', '1.0']:
-                                buy_markers.loc[t_date] = t_price * 0.98 # Place below low
-                            elif t_type in ['BAN', 'SELL', 'SHORT', '-1', '-1.0']:
-                                sell_markers.loc[t_date] = t_price * 1.02 # Place above high
+        comparison = None
+        if strategies is not None:
+            if trades is not None or portfolio is not None:
+                raise ValueError("Pass either `trades`/`portfolio` or `strategies`, not both.")
+            comparison = align_strategies(strategies, plot_df.index, snap=snap_trades)
+            dropped = comparison.dropped
+            buy = sell = np.full(len(plot_df), np.nan)
+        else:
+            buy, sell, dropped = trade_markers(trades, plot_df.index, snap=snap_trades)
+
+        trips, trip_bars = None, None
+        if round_trips:
+            if comparison is not None:
+                raise ValueError("`round_trips` is not available with `strategies`.")
+            trips = fifo_round_trips(trades)
+            # Entry and exit bar of each round trip, -1 when it has none
+            trip_bars = np.column_stack([bar_positions(pd.DatetimeIndex(trips[col]), plot_df.index, snap_trades)
+                                         for col in ('entry_time', 'exit_time')])
+        if dropped:
+            warnings.warn(f"{dropped} trade(s) do not fall on a bar of `data` and are not shown. "
+                          "Pass snap_trades='nearest' (or 'backward'/'forward') to place them on a nearby bar.",
+                          UserWarning, stacklevel=3)
+        buy_markers = pd.Series(buy, index=plot_df.index)
+        sell_markers = pd.Series(sell, index=plot_df.index)
 
         # 3. Process Portfolio (Equity & Drawdown)
         equity_series = None
         drawdown_series = None
-        if portfolio is not None:
-            port_df = portfolio.copy()
-            if not isinstance(port_df.index, pd.DatetimeIndex):
-                time_col = next((c for c in port_df.columns if str(c).lower() in ['time', 'date']), None)
-                if time_col:
-                    port_df = port_df.set_index(time_col)
-                port_df.index = pd.to_datetime(port_df.index)
-            
+        if comparison is not None:
+            # One column per strategy
+            equity_series, drawdown_series = comparison.equity, comparison.drawdown
+        elif portfolio is not None:
             # Reindex to match plot_df
-            port_df = port_df.reindex(plot_df.index).ffill()
-            
-            eq_col = next((c for c in port_df.columns if str(c).lower() in ['equity', 'portfolio_value', 'capital', 'cumulative_return', 'return']), None)
-            dd_col = next((c for c in port_df.columns if str(c).lower() in ['drawdown', 'dd']), None)
+            port_df = portfolio_frame(portfolio).reindex(plot_df.index).ffill()
+            eq_col, dd_col = portfolio_columns(port_df)
 
             if eq_col:
                 equity_series = port_df[eq_col]
             if dd_col:
                 drawdown_series = port_df[dd_col]
 
-        # 4. Construct AddPlots
-        apds = []
-        
-        # Overlays
-        if overlays:
-            for overlay in overlays:
-                if isinstance(overlay, dict):
-                    apds.append(mpf.make_addplot(overlay['data'], type=overlay.get('type', 'line'), color=overlay.get('color', None), panel=0, alpha=overlay.get('alpha', 0.8), width=overlay.get('width', 1.0)))
-                else:
-                    apds.append(mpf.make_addplot(overlay, type='line', panel=0, alpha=0.8, width=1.0))
-
-        # Trade Markers
-        if not buy_markers.isna().all():
-            apds.append(mpf.make_addplot(buy_markers, type='scatter', markersize=150, marker='^', color=buy_color, panel=0))
-        if not sell_markers.isna().all():
-            apds.append(mpf.make_addplot(sell_markers, type='scatter', markersize=150, marker='v', color=sell_color, panel=0))
-
-        # Determine Panel Layout
-        panel_idx = 1 if volume else 0
-        if volume:
-            panel_idx = 1
-        else:
-            panel_idx = 0
-            
-        panel_ratios = [5]
-        if volume:
-            panel_ratios.append(1)
-
-        eq_panel = None
-        if equity_series is not None:
-            panel_idx += 1
-            eq_panel = panel_idx
-            apds.append(mpf.make_addplot(equity_series, type='line', color=equity_color, panel=eq_panel, width=1.5, ylabel='Equity'))
-            panel_ratios.append(1.5)
-
-        dd_panel = None
-        if drawdown_series is not None:
-            panel_idx += 1
-            dd_panel = panel_idx
-            # We use line here, and will fill_between in post-processing
-            apds.append(mpf.make_addplot(drawdown_series, type='line', color=drawdown_color, panel=dd_panel, width=1.0, ylabel='Drawdown'))
-            panel_ratios.append(1)
-
-        font_name = kwargs.pop('font_name', plt.rcParams['font.family'])
+        indicator_panels, legend_entries = [], []
+        if indicators:
+            indicator_overlays, indicator_panels, legend_entries = indicator_plots(plot_df, indicators, palette, up_color, down_color)
+            overlays = list(overlays or []) + indicator_overlays
+
+        font_name = kwargs.pop('font_name', cls._global_font or plt.rcParams['font.family'])
         if isinstance(font_name, list):
             font_name = font_name[0]
-
-        # 5. Plot!
         savefig_kwargs = kwargs.pop('savefig', None)
         show_kwargs = kwargs.pop('show', True)
-        
-        plot_kwargs = {
-            'type': 'candle',
-            'volume': volume,
-            'style': s,
-            'figsize': figsize,
-            'title': "",
-            'ylabel': 'Giá',
-            'ylabel_lower': 'Khối lượng' if volume else '',
-            'returnfig': True,
-            'tight_layout': True,
-            'xrotation': 0
-        }
-        
-        if apds:
-            plot_kwargs['addplot'] = apds
-        if len(panel_ratios) > 1:
-            plot_kwargs['panel_ratios'] = panel_ratios
-            
-        plot_kwargs.update(kwargs)
-        
-        fig, axes = mpf.plot(plot_df, **plot_kwargs)
+
+        def build_panels(buy_markers, sell_markers, equity_series, drawdown_series, overlays, indicator_panels):
+            """Addplots and `_plot_candles` arguments of the panel layout."""
+            # 4. Construct AddPlots
+            apds = []
+
+            # Overlays
+            if overlays:
+                for overlay in overlays:
+                    if isinstance(overlay, dict):
+                        apds.append(dict(data=overlay['data'], type=overlay.get('type', 'line'), color=overlay.get('color', None), panel=0, alpha=overlay.get('alpha', 0.8), width=overlay.get('width', 1.0)))
+                    else:
+                        apds.append(dict(data=overlay, type='line', panel=0, alpha=0.8, width=1.0))
+
+            # Trade Markers
+            if not buy_markers.isna().all():
+                apds.append(dict(data=buy_markers, type='scatter', markersize=150, marker='^', color=buy_color, panel=0))
+            if not sell_markers.isna().all():
+                apds.append(dict(data=sell_markers, type='scatter', markersize=150, marker='v', color=sell_color, panel=0))
+
+            # Determine Panel Layout
+            panel_idx = 1 if volume else 0
+            if volume:
+                panel_idx = 1
+            else:
+                panel_idx = 0
+
+            panel_ratios = [5]
+            if volume:
+                panel_ratios.append(1)
+
+            eq_panel = None
+            if equity_series is not None:
+                panel_idx += 1
+                eq_panel = panel_idx
+                if comparison is not None:
+                    # mplfinance only creates a panel for an addplot with some finite data, so the median curve lays
+                    # the panel out; `add_strategy_lines` replaces it with the strategies' LineCollection
+                    apds.append(dict(data=equity_series.median(axis=1), type='line', color=equity_color, panel=eq_panel, width=1.5, ylabel='Equity'))
+                else:
+                    apds.append(dict(data=equity_series, type='line', color=equity_color, panel=eq_panel, width=1.5, ylabel='Equity'))
+                panel_ratios.append(1.5)
+
+            dd_panel = None
+            if drawdown_series is not None:
+                panel_idx += 1
+                dd_panel = panel_idx
+                # We use line here, and will fill_between in post-processing
+                if comparison is not None:
+                    apds.append(dict(data=drawdown_series.median(axis=1), type='line', color=drawdown_color, panel=dd_panel, width=1.0, ylabel='Drawdown'))
+                else:
+                    apds.append(dict(data=drawdown_series, type='line', color=drawdown_color, panel=dd_panel, width=1.0, ylabel='Drawdown'))
+                panel_ratios.append(1)
+
+            for group in indicator_panels:
+                panel_idx += 1
+                apds.extend({**spec, 'panel': panel_idx} for spec in group)
+                panel_ratios.append(1.2)
+
+            # 5. Plot!
+            plot_kwargs = {
+                'volume': volume,
+                'figsize': figsize,
+                'title': "",
+                'ylabel': 'Giá',
+                'ylabel_lower': 'Khối lượng' if volume else '',
+                'xrotation': 0
+            }
+
+            if len(panel_ratios) > 1:
+                plot_kwargs['panel_ratios'] = panel_ratios
+
+            plot_kwargs.update(kwargs)
+            return apds, plot_kwargs
+
+        # Level of detail: merge bars that would be drawn narrower than a few pixels of the price panel
+        def panel_pixels():
+            apds, plot_kwargs = build_panels(buy_markers, sell_markers, equity_series, drawdown_series, overlays, indicator_panels)
+            return cls._price_panel_pixels(plot_df, engine, apds, style, up_color, down_color, plot_kwargs)
+
+        starts = bucket_starts(len(plot_df), max_bars, panel_pixels)
+        if starts is not None:
+            lod_index = plot_df.index[starts]
+            buy_markers = aggregate_like(buy_markers, starts, lod_index)
+            sell_markers = aggregate_like(sell_markers, starts, lod_index)
+            if equity_series is not None:
+                equity_series = aggregate_like(equity_series, starts, lod_index)
+            if drawdown_series is not None:
+                drawdown_series = aggregate_like(drawdown_series, starts, lod_index, how='min')
+            if overlays:
+                overlays = [{**o, 'data': aggregate_like(o['data'], starts, lod_index)} if isinstance(o, dict)
+                            else aggregate_like(o, starts, lod_index) for o in overlays]
+            if comparison is not None:
+                comparison.positions = np.searchsorted(starts, comparison.positions, side='right') - 1
+            if trip_bars is not None:
+                trip_bars = np.searchsorted(starts, trip_bars, side='right') - 1
+            indicator_panels = [[{**spec, 'data': aggregate_like(spec['data'], starts, lod_index)} for spec in group]
+                                for group in indicator_panels]
+            plot_df = aggregate_ohlcv(plot_df, starts)
+
+        apds, plot_kwargs = build_panels(buy_markers, sell_markers, equity_series, drawdown_series, overlays, indicator_panels)
+        with rc_scope():
+            fig, axes = cls._plot_candles(plot_df, engine, apds, style, up_color, down_color, plot_kwargs)
 
         # 6. Post-processing styling
         if title:
@@ -218,6 +267,66 @@ class QuantMixin:
             elif x >= 1e3: return f'{x*1e-3:.0f}K'
             return f'{x:.0f}'
         
+        if comparison is not None:
+            from matplotlib.collections import LineCollection
+            from matplotlib.colors import to_rgba_array
+
+            names = comparison.names
+            strategy_rgba = to_rgba_array(strategy_colors(palette, len(names)))
+            color_index = {name: i for i, name in enumerate(names)}
+
+            def add_strategy_lines(ax, frame, width):
+                # Remove the median line that created the panel, so that neither the drawing nor the data
+                # limits (autoscaling) depend on it
+                for line in list(ax.lines):
+                    line.remove()
+                ax.relim()
+                values = frame.to_numpy(dtype=float)
+                colors = strategy_rgba[[color_index[c] for c in frame.columns]]
+                ax.add_collection(LineCollection(line_segments(values), colors=colors, linewidths=width, alpha=0.9))
+                low, high = np.nanmin(values), np.nanmax(values)
+                margin = 0.05 * (high - low) or 0.05 * abs(high) or 0.05
+                ax.set_ylim(low - margin, high + margin)
+
+            # Trade markers of every strategy in one scatter per side, colored by strategy
+            marker_prices = comparison.prices * np.where(comparison.sides == 1, 0.98, 1.02)
+            for side, marker in ((1, '^'), (-1, 'v')):
+                mask = comparison.sides == side
+                if mask.any():
+                    axes[0].scatter(comparison.positions[mask], marker_prices[mask], s=60, marker=marker,
+                                    c=strategy_rgba[comparison.strategy[mask]], edgecolors='white', linewidths=0.5, zorder=3)
+            if np.isfinite(marker_prices).any():
+                # Keep markers beyond the candles' range inside the price panel, as the addplot scatter does
+                low, high = axes[0].get_ylim()
+                low, high = min(low, np.nanmin(marker_prices)), max(high, np.nanmax(marker_prices))
+                axes[0].set_ylim(low - 0.02 * (high - low), high + 0.02 * (high - low))
+
+            if 0 < len(names) <= 12:
+                legend_entries = list(zip(names, strategy_rgba)) + legend_entries
+
+        if legend_entries:
+            from matplotlib.lines import Line2D
+
+            handles = [Line2D([], [], color=color, linewidth=1.5) for _, color in legend_entries]
+            axes[0].legend(handles, [label for label, _ in legend_entries], loc='upper left', fontsize=9, frameon=False,
+                           ncol=min(len(legend_entries), 4))
+
+        if trip_bars is not None:
+            from matplotlib.collections import PolyCollection
+
+            # Holding periods of winners and losers, each merged into disjoint bar runs, as one collection
+            # of full-height spans (x in bars, y in axes coordinates)
+            placed = (trip_bars >= 0).all(axis=1)
+            wins = trips['pnl'].to_numpy() > 0
+            runs = [merge_spans(trip_bars[placed & mask, 0], trip_bars[placed & mask, 1]) for mask in (wins, ~wins)]
+            spans = np.empty((sum(len(run[0]) for run in runs), 4, 2))
+            spans[:, :2, 0] = np.concatenate([run[0] for run in runs])[:, None] - 0.5
+            spans[:, 2:, 0] = np.concatenate([run[1] for run in runs])[:, None] + 0.5
+            spans[:, :, 1] = [0, 1, 1, 0]
+            colors = [up_color] * len(runs[0][0]) + [down_color] * len(runs[1][0])
+            axes[0].add_collection(PolyCollection(spans, facecolors=colors, edgecolors='none', alpha=0.12, zorder=0,
+                                                  transform=axes[0].get_xaxis_transform()), autolim=False)
+
         # Soft spines and custom labels
         for ax in axes:
             ylabel = ax.get_ylabel()
@@ -237,19 +346,26 @@ class QuantMixin:
 
             # Fill Drawdown Panel
             if 'Drawdown' in ylabel and drawdown_series is not None:
-                # mplfinance axes have the index mapping as x-coordinates (0, 1, 2, ...)
-                x_vals = np.arange(len(plot_df))
-                ax.fill_between(x_vals, drawdown_series.values, 0, color=drawdown_color, alpha=0.2)
+                if comparison is not None:
+                    add_strategy_lines(ax, drawdown_series, 1.0)
+                else:
+                    # mplfinance axes have the index mapping as x-coordinates (0, 1, 2, ...)
+                    x_vals = np.arange(len(plot_df))
+                    ax.fill_between(x_vals, drawdown_series.values, 0, color=drawdown_color, alpha=0.2)
                 # Format y-axis as percentage if values are decimals
-                if drawdown_series.min() > -10.0 and drawdown_series.max() <= 1.0:
+                dd_values = drawdown_series.to_numpy(dtype=float)
+                if np.nanmin(dd_values) > -10.0 and np.nanmax(dd_values) <= 1.0:
                     ax.yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
 
             # Format Equity Panel
             if 'Equity' in ylabel and equity_series is not None:
-                # Fill equity area
-                x_vals = np.arange(len(plot_df))
-                min_eq = equity_series.min()
-                ax.fill_between(x_vals, equity_series.values, min_eq, color=equity_color, alpha=0.1)
+                if comparison is not None:
+                    add_strategy_lines(ax, equity_series, 1.5)
+                else:
+                    # Fill equity area
+                    x_vals = np.arange(len(plot_df))
+                    min_eq = equity_series.min()
+                    ax.fill_between(x_vals, equity_series.values, min_eq, color=equity_color, alpha=0.1)
 
             # Soft spines
             ax.spines['top'].set_visible(False)
@@ -257,17 +373,114 @@ class QuantMixin:
             ax.spines['left'].set_linewidth(1.5)
             ax.spines['bottom'].set_linewidth(1.5)
 
-        plt.subplots_adjust(top=0.92)
+        fig.subplots_adjust(top=0.92)
         
         cls._inject_logo(fig, kwargs)
         
         if savefig_kwargs:
             if isinstance(savefig_kwargs, dict):
-                plt.savefig(**savefig_kwargs)
+                fig.savefig(**savefig_kwargs)
             else:
-                plt.savefig(savefig_kwargs)
+                fig.savefig(savefig_kwargs)
                 
         if show_kwargs and plt.get_backend().lower() != 'agg':
             plt.show()
             
+        if round_trips:
+            return fig, axes, trips
         return fig, axes
+
+    @classmethod
+    @chart_method
+    def rolling_risk(
+        cls,
+        data: Union[pd.Series, pd.DataFrame, np.ndarray],
+        benchmark: Optional[Union[pd.Series, np.ndarray]] = None,
+        windows: Union[int, List[int]] = (63, 126, 252),
+        metrics: Optional[List[str]] = None,
+        periods_per_year: int = 252,
+        risk_free: float = 0.0,
+        title: str = 'Rolling Risk',
+        figsize: Tuple[float, float] = (12, 9),
+        **kwargs
+    ) -> Tuple['plt.Figure', 'plt.Axes', pd.DataFrame]:
+        """
+        Draws rolling Sharpe ratio, volatility, beta and maximum drawdown panels, one line per window.
+
+        All metrics come from NumPy kernels (see `core.risk.rolling_risk`): window sums are differences of
+        shared cumulative sums, so many tickers and windows are computed in one pass. With several tickers
+        (a DataFrame or 2-D array of returns), every ticker is drawn faintly as one LineCollection per
+        window and the cross-sectional median on top.
+
+        Args:
+            data (pd.Series/pd.DataFrame/np.ndarray): Periodic returns (e.g. `prices.pct_change()`), one column per ticker.
+            benchmark (pd.Series/np.ndarray): Benchmark returns such as VN-Index for the beta panel, aligned to `data`.
+            windows (int/list): Window lengths in bars. Defaults to 63, 126 and 252 days.
+            metrics (list): Panels to draw among 'sharpe', 'volatility', 'beta' and 'max_drawdown'. Defaults to all
+                (beta needs a benchmark).
+            periods_per_year (int): Bars per year, to annualize volatility and Sharpe ratio.
+            risk_free (float): Annual risk-free rate for the Sharpe ratio.
+            title (str): Chart title.
+            figsize (tuple): Figure size.
+
+        Returns:
+            Tuple[plt.Figure, np.ndarray, pd.DataFrame]: The figure, its axes and the metrics with (metric, window)
+            columns, or (metric, window, ticker) columns for several tickers.
+        """
+        import matplotlib.dates as mdates
+        from matplotlib.collections import LineCollection
+
+        windows = [windows] if isinstance(windows, (int, np.integer)) else list(windows)
+        metrics = list(metrics) if metrics is not None else [m for m in RISK_METRICS if m != 'beta' or benchmark is not None]
+        unknown = set(metrics) - set(RISK_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metric(s) {sorted(unknown)}. Choose from {', '.join(RISK_METRICS)}.")
+        if 'beta' in metrics and benchmark is None:
+            raise ValueError("The 'beta' panel needs a `benchmark`.")
+
+        values, bench, index, tickers = risk_inputs(data, benchmark)
+        arrays = risk_kernels(values, windows, bench, periods_per_year, risk_free)
+        risk = risk_frame(arrays, index, tickers)
+        dates = isinstance(index, pd.DatetimeIndex)
+        x = mdates.date2num(index) if dates else np.asarray(index, dtype=float)
+
+        palette_name = kwargs.pop('color_palette', cls._global_theme)
+        palette = Utils.brand_palettes.get(palette_name, Utils.brand_palettes['vnstock'])
+        colors = strategy_colors([c for i, c in enumerate(palette) if i not in (0, 3)] or list(palette), len(windows))
+        labels = {'sharpe': 'Sharpe', 'volatility': 'Volatility', 'beta': 'Beta', 'max_drawdown': 'Max Drawdown'}
+
+        fig, axes = cls._subplots(len(metrics), 1, figsize=figsize, sharex=True, squeeze=False)
+        axes = axes[:, 0]
+        for ax, metric in zip(axes, metrics):
+            for window, color in zip(windows, colors):
+                values = arrays[(metric, window)]
+                if values.ndim == 2 and values.shape[1] > 1:
+                    # Every ticker faintly, the median across tickers on top
+                    alpha = float(np.clip(8.0 / values.shape[1], 0.03, 0.4))
+                    ax.add_collection(LineCollection(line_segments(values, x), colors=color, linewidths=0.6, alpha=alpha))
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', RuntimeWarning)
+                        values = np.nanmedian(values, axis=1)
+                    label = f'{window} (median)'
+                else:
+                    values = values.reshape(len(x), -1)[:, 0]
+                    label = str(window)
+                ax.plot(x, values, color=color, linewidth=1.5, label=label)
+            ax.autoscale_view()
+            if metric == 'sharpe':
+                ax.axhline(0, color='#94a3b8', linewidth=0.8, linestyle='--')
+            elif metric == 'beta':
+                ax.axhline(1, color='#94a3b8', linewidth=0.8, linestyle='--')
+            style_kwargs = cls._filter_plot_kwargs(kwargs)
+            cls.apply_chart_style(ax, title=title if ax is axes[0] else None, ylabel=labels[metric],
+                                  show_legend=ax is axes[0], **style_kwargs)
+            if metric in ('volatility', 'max_drawdown'):
+                ax.yaxis.set_major_formatter(mticker.PercentFormatter(1.0))
+        if dates:
+            axes[0].xaxis_date()
+        if len(x):
+            axes[0].set_xlim(x.min(), x.max())
+
+        fig.tight_layout()
+        cls._inject_logo(fig, kwargs)
+        return fig, axes, risk
@@ -4,19 +4,23 @@ from typing import Union, List, Optional, Tuple, Dict, Any
 import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 from ..config import *
+from ..config import import_optional
 from ..utils import Utils
+from ..core.context import close_figure
+from ..core.correlation import correlation_frame
+from ..core.heatmap import color_scale, draw_matrix, raster_threshold
+from ..core.render import chart_method
+from ..core.returns import sparkline_values
 import matplotlib.ticker as mticker
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 class SpecializedMixin:
         @classmethod
+        @chart_method
         def treemap(cls, values, labels, title='', color_palette='vnstock', palette_shuffle=False, figsize=(10,8), title_fontsize=14, **kwargs):
             """
             Draws a treemap.
@@ -32,12 +36,13 @@ class SpecializedMixin:
                 fontsize (int): The font size for the text inside the treemap. Defaults to 10.
                 color (str): The text color. Defaults to 'white'.
             """
+            squarify = import_optional('squarify', extra='all')
             colors = Utils.brand_palettes[color_palette]
 
             if palette_shuffle:
                 random.shuffle(colors)
 
-            fig, ax = plt.subplots(figsize=figsize) 
+            fig, ax = cls._subplots(figsize=figsize)
             squarify.plot(sizes=values, label=labels, pad=0.2,
                         text_kwargs={'fontsize': 10, 'color': 'white', 'fontweight': 'bold'},
                         color=colors, ax=ax, edgecolor='white', linewidth=2)
@@ -46,6 +51,7 @@ class SpecializedMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method
         def heatmap(cls, data: 'pd.DataFrame', **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -58,21 +64,38 @@ class SpecializedMixin:
                 figsize (tuple): The size of the chart, e.g., (10, 6).
                 xlim (tuple): The limits for the X-axis, e.g., (0, 100).
                 ylim (tuple): The limits for the Y-axis, e.g., (0, 100).
+                xlabel (str): The label for the X-axis. Defaults to the name of the columns.
+                ylabel (str): The label for the Y-axis. Defaults to the name of the index.
                 title_fontsize (int): The font size for the title.
                 background_color (str): The background color for the chart.
+                raster (bool): Draw the cells as one image with precomputed colors (see `core.heatmap.draw_matrix`)
+                    instead of one seaborn patch and text per cell. Annotations too small to read are left out and
+                    `linewidths` is ignored. Defaults to True above `raster_threshold` cells.
+                raster_threshold (int): Cell count above which `raster` turns on. Defaults to 1000, see
+                    `Chart.set_heatmap_raster_threshold`.
             """
+            import seaborn as sns
+
             figsize = kwargs.get('figsize', (10, 6))
-            fig, ax = plt.subplots(figsize=figsize)
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            raster = kwargs.pop('raster', None)
+            threshold = kwargs.pop('raster_threshold', None)
+            fig, ax = cls._subplots(figsize=figsize)
+            # Heatmaps are colored by `cmap`; the palette arguments do not apply
+            kwargs.pop('color_palette', None)
+            kwargs.pop('palette_shuffle', None)
         
             # Note: For heatmaps, not all styling arguments apply (e.g., data_labels)
             style_kwargs = {k: kwargs.pop(k, None) for k in ['title', 'font_name', 'figsize', 'xlim', 'ylim', 
-                                                            'title_fontsize', 'background_color']}
+                                                            'title_fontsize', 'background_color', 'xlabel', 'ylabel']}
 
             plot_kwargs = cls._filter_plot_kwargs(kwargs)
-            sns.heatmap(data, ax=ax, **plot_kwargs)
-            cls.apply_chart_style(ax, **style_kwargs)
+            if raster is None:
+                raster = np.size(data) > (raster_threshold() if threshold is None else threshold)
+            if raster:
+                cls._raster_heatmap(fig, ax, data, plot_kwargs, style_kwargs)
+            else:
+                sns.heatmap(data, ax=ax, **plot_kwargs)
+                cls.apply_chart_style(ax, **style_kwargs)
         
             # Remove tick marks that intrude into heatmap cells causing "crosshairs"
             ax.tick_params(length=0)
@@ -83,6 +106,98 @@ class SpecializedMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        def _raster_heatmap(cls, fig, ax, data, plot_kwargs: dict, style_kwargs: dict):
+            """
+            The `raster` path of `heatmap`: the colors, colorbar and labels `seaborn.heatmap` would draw for
+            `plot_kwargs` (cmap, vmin, vmax, center, robust, mask, annot, fmt, annot_kws, cbar, cbar_kws,
+            xticklabels, yticklabels, square), over a single `draw_matrix` image.
+            """
+            from matplotlib.cm import ScalarMappable
+
+            frame = pd.DataFrame(data)
+            values = frame.to_numpy(dtype=float)
+            if plot_kwargs.get('mask') is not None:
+                values = np.where(np.asarray(plot_kwargs['mask'], dtype=bool), np.nan, values)
+            cmap, norm = color_scale(values, plot_kwargs.get('cmap'), plot_kwargs.get('vmin'), plot_kwargs.get('vmax'),
+                                     plot_kwargs.get('center'), plot_kwargs.get('robust', False))
+            if plot_kwargs.get('cbar', True):
+                fig.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax, **(plot_kwargs.get('cbar_kws') or {}))
+            limits = {k: style_kwargs.pop(k, None) for k in ['xlim', 'ylim']}
+            # Axis labels from the index names, as seaborn sets them, unless the caller gave their own
+            if not style_kwargs.get('xlabel'):
+                ax.set_xlabel('-'.join(str(name) for name in frame.columns.names if name is not None))
+            if not style_kwargs.get('ylabel'):
+                ax.set_ylabel('-'.join(str(name) for name in frame.index.names if name is not None))
+            cls.apply_chart_style(ax, **style_kwargs)
+
+            def tick_labels(key, labels):
+                option = plot_kwargs.get(key, 'auto')
+                if option is False:
+                    return None
+                return list(option) if isinstance(option, (list, tuple, np.ndarray, pd.Index)) else labels
+
+            draw_matrix(ax, values, cmap, norm, tick_labels('xticklabels', frame.columns), tick_labels('yticklabels', frame.index),
+                        annot=plot_kwargs.get('annot', False), fmt=plot_kwargs.get('fmt', '.2g'),
+                        fontsize=(plot_kwargs.get('annot_kws') or {}).get('size', 8.0))
+            for spine in ax.spines.values():
+                spine.set_visible(False)
+            if plot_kwargs.get('square'):
+                ax.set_aspect('equal')
+            if limits['xlim']:
+                ax.set_xlim(limits['xlim'])
+            if limits['ylim']:
+                ax.set_ylim(limits['ylim'])
+        @classmethod
+        @chart_method
+        def correlation_heatmap(cls, data: 'pd.DataFrame', cluster: bool = True, min_periods: int = 2, annot: Union[bool, str] = 'auto',
+                                title: str = 'Correlation Matrix', figsize: Tuple[float, float] = (10, 8), **kwargs) -> Tuple['plt.Figure', 'plt.Axes', 'pd.DataFrame']:
+            """
+            Draws the correlation matrix of many series, e.g. the daily returns of every HOSE ticker.
+
+            Correlations are computed in float32 blocks with missing values handled pairwise, rows and
+            columns are ordered by hierarchical clustering so correlated groups sit together, and the
+            matrix is drawn as a single raster, so 400 x 400 tickers take well under a second.
+
+            Args:
+                data (pd.DataFrame): One column per series (returns rather than prices), one row per observation.
+                cluster (bool): Order the tickers by average-linkage clustering (SciPy if installed, else NumPy).
+                min_periods (int): Fewer common observations than this leave a pair blank.
+                annot (bool/str): Write the correlations in the cells. 'auto' writes them for up to 20 series;
+                    they are never written in cells too small for a readable font.
+                title (str): Chart title.
+                figsize (tuple): Figure size.
+                cmap: Colormap. Defaults to the palette's down color, white and up color.
+
+            Returns:
+                Tuple[plt.Figure, plt.Axes, pd.DataFrame]: The figure, its axes and the (reordered) correlation matrix.
+            """
+            from matplotlib.cm import ScalarMappable
+            from matplotlib.colors import LinearSegmentedColormap, Normalize
+
+            corr = correlation_frame(data, min_periods=min_periods, cluster=cluster)
+            palette = Utils.brand_palettes.get(kwargs.pop('color_palette', cls._global_theme), Utils.brand_palettes['vnstock'])
+            pos_color = palette[0] if len(palette) > 0 else '#66BB6A'
+            neg_color = palette[3] if len(palette) > 3 else '#EF5350'
+            cmap = kwargs.pop('cmap', None) or LinearSegmentedColormap.from_list('correlation', [neg_color, '#ffffff', pos_color])
+            if isinstance(cmap, str):
+                cmap = plt.get_cmap(cmap)
+            if annot == 'auto':
+                annot = len(corr) <= 20
+
+            fig, ax = cls._subplots(figsize=figsize)
+            norm = Normalize(-1.0, 1.0)
+            fig.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax, shrink=0.8)
+            style_kwargs = {k: kwargs.pop(k, None) for k in ['font_name', 'title_fontsize', 'background_color']}
+            cls.apply_chart_style(ax, title=title, **style_kwargs)
+            draw_matrix(ax, corr.to_numpy(), cmap, norm, corr.columns, corr.index, annot=annot, fmt='.2f')
+            ax.tick_params(length=0)
+            ax.grid(False)
+            for spine in ax.spines.values():
+                spine.set_visible(False)
+            cls._inject_logo(fig, kwargs)
+            return fig, ax, corr
+        @classmethod
+        @chart_method
         def wordcloud(cls, text, title="Word Cloud", color_palette='vnstock', palette_shuffle=False,
                         max_words=100, width=800, height=400, figsize=(10, 8),
                         fontname=None, savefig=None, show=True):
@@ -102,7 +217,7 @@ class SpecializedMixin:
                 savefig (str): Path to save the image file. Defaults to None.
                 show (bool): Displays the chart. Defaults to True.
             """
-        
+            WordCloud = import_optional('wordcloud', 'WordCloud', extra='all')
             colors = Utils.brand_palettes[color_palette]
 
             if palette_shuffle:
@@ -120,7 +235,7 @@ class SpecializedMixin:
             wordcloud = WordCloud(width=width, height=height, background_color="white", colormap=custom_cmap, max_words=max_words, **font_kwargs).generate(text)
 
             # Create plot
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = cls._subplots(figsize=figsize)
             ax.imshow(wordcloud, interpolation='bilinear')
             ax.axis("off")
 
@@ -130,7 +245,7 @@ class SpecializedMixin:
             ax.set_facecolor("white")
 
             try:
-                plt.subplots_adjust(hspace=0, bottom=0, top=0.9)
+                fig.subplots_adjust(hspace=0, bottom=0, top=0.9)
             except Exception:
                 pass
 
@@ -138,14 +253,15 @@ class SpecializedMixin:
 
             if savefig:
                 if isinstance(savefig, dict):
-                    plt.savefig(**savefig)
+                    fig.savefig(**savefig)
                 else:
-                    plt.savefig(savefig)
+                    fig.savefig(savefig)
             if show and plt.get_backend().lower() != 'agg':
                 plt.show()
             
             return fig, ax
         @classmethod
+        @chart_method
         def table(
             cls,
             data,
@@ -190,8 +306,8 @@ class SpecializedMixin:
                 except Exception:
                     pass
 
-            fig = plt.figure(figsize=figsize)
-            ax = plt.subplot(111, frame_on=False)
+            fig = cls._figure(figsize=figsize)
+            ax = fig.add_subplot(111, frame_on=False)
 
             if title != "":
                 ax.set_title(
@@ -245,7 +361,7 @@ class SpecializedMixin:
             ax.set_yticks([])
 
             try:
-                plt.subplots_adjust(hspace=0)
+                fig.subplots_adjust(hspace=0)
             except Exception:
                 pass
             try:
@@ -255,14 +371,14 @@ class SpecializedMixin:
 
             if savefig:
                 if isinstance(savefig, dict):
-                    plt.savefig(**savefig)
+                    fig.savefig(**savefig)
                 else:
-                    plt.savefig(savefig)
+                    fig.savefig(savefig)
 
             if show and plt.get_backend().lower() != 'agg':
                 plt.show(block=False)
 
-            plt.close()
+            close_figure(fig)
 
             if not show:
                 cls._inject_logo(fig, {})
@@ -271,8 +387,9 @@ class SpecializedMixin:
             return None
 
         @classmethod
+        @chart_method
         def summary_card(cls, ticker: str, company_name: str, current_price: float, price_change: float, price_change_pct: float,
-                         metrics: dict, sparkline_data: pd.Series, signal: str, **kwargs):
+                         metrics: dict, sparkline_data: Union[pd.Series, pd.DataFrame], signal: str, **kwargs):
             """
             Draws a Stock Summary Card.
             
@@ -283,7 +400,8 @@ class SpecializedMixin:
                 price_change (float): Absolute price change.
                 price_change_pct (float): Percentage price change.
                 metrics (dict): Dictionary of fundamental/technical metrics. Max 6 items recommended.
-                sparkline_data (pd.Series): Data for the miniature trend chart (last 30 days).
+                sparkline_data (pd.Series/pd.DataFrame): Data for the miniature trend chart (last 30 days). A price
+                    DataFrame is reduced to its last 30 closes.
                 signal (str): Technical signal (e.g., 'Tích cực', 'Tiêu cực', 'Trung tính').
             """
             from matplotlib.patches import FancyBboxPatch
@@ -296,7 +414,7 @@ class SpecializedMixin:
             sec_color = palette[2] if len(palette) > 2 else '#f59e0b'
             
             figsize = kwargs.get('figsize', (9, 5))
-            fig = plt.figure(figsize=figsize, facecolor='#f8fafc')
+            fig = cls._figure(figsize=figsize, facecolor='#f8fafc')
             
             # Create a main axis that fills the figure for placing text and patches
             ax = fig.add_axes([0, 0, 1, 1])
@@ -361,12 +479,11 @@ class SpecializedMixin:
             # Create a small axes for the sparkline
             ax_spark = fig.add_axes([0.65, 0.62, 0.29, 0.12])
             ax_spark.axis('off')
-            ax_spark.plot(sparkline_data.values, color=change_color, lw=2)
+            spark, spark_min, spark_max = sparkline_values(sparkline_data)
+            ax_spark.plot(spark, color=change_color, lw=2)
             # Add subtle fill
-            ax_spark.fill_between(range(len(sparkline_data)), sparkline_data.values, sparkline_data.min(), 
-                                  color=change_color, alpha=0.1)
-            ax_spark.set_ylim(sparkline_data.min() - (sparkline_data.max()-sparkline_data.min())*0.1, 
-                              sparkline_data.max() + (sparkline_data.max()-sparkline_data.min())*0.1)
+            ax_spark.fill_between(range(len(spark)), spark, spark_min, color=change_color, alpha=0.1)
+            ax_spark.set_ylim(spark_min - (spark_max - spark_min) * 0.1, spark_max + (spark_max - spark_min) * 0.1)
             ax.text(0.94, 0.58, l['trend'], fontsize=10, color='#64748b', fontname=kwargs.get('font_name', 'Inter'), ha='right', va='center')
 
             # --- METRICS GRID ---
@@ -5,18 +5,18 @@ import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 from ..config import *
 from ..utils import Utils
+from ..core.context import rc_scope
+from ..core.render import chart_method
 import matplotlib.ticker as mticker
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, 'assets', 'vnstock_logo.png')
 import pandas as pd
 import random
-from wordcloud import WordCloud
-import seaborn as sns
-import mplfinance as mpf
 import numpy as np
 
 class StatisticalMixin:
         @classmethod
+        @chart_method
         def boxplot(cls, data: 'pd.DataFrame', **kwargs) -> Tuple['plt.Figure', 'plt.Axes']:
             show_plot = kwargs.pop('show', True)
             """
@@ -51,12 +51,11 @@ class StatisticalMixin:
                 background_color (str): The background color for the chart.
                 bar_edge_color (str): The edge color for the bars in the chart.
             """
-            mpl_plot_instance = cls()
-            mpl_plot_instance.utils.apply_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
+            palette = Utils.resolve_palette(kwargs.pop('color_palette', cls._global_theme), kwargs.pop('palette_shuffle', False))
 
             ax = kwargs.pop('ax', None)
             if ax is None:
-                fig, ax = plt.subplots()
+                fig, ax = cls._subplots()
             else:
                 fig = ax.figure
         
@@ -69,6 +68,10 @@ class StatisticalMixin:
                                                             'data_label_position', 'data_label_color', 'data_label_fontsize']}
 
             plot_kwargs = cls._filter_plot_kwargs(kwargs)
+            if palette and 'color' not in plot_kwargs and 'colormap' not in plot_kwargs:
+                # Same element colors pandas derives from the first three entries of the color cycle
+                box_colors = [palette[i % len(palette)] for i in range(3)]
+                plot_kwargs['color'] = {'boxes': box_colors[0], 'whiskers': box_colors[0], 'medians': box_colors[2], 'caps': box_colors[0]}
             data.plot(kind='box', ax=ax, **plot_kwargs)
             cls.apply_chart_style(ax, **style_kwargs)
             if show_plot and plt.get_backend().lower() != 'agg':
@@ -76,6 +79,7 @@ class StatisticalMixin:
             cls._inject_logo(fig, kwargs)
             return fig, ax
         @classmethod
+        @chart_method(exclusive=True)
         def pairplot(cls, data, **kwargs):
             """
             Represents data using a pairplot.
@@ -84,6 +88,11 @@ class StatisticalMixin:
                 data (pd.DataFrame): Input data to represent.
                 **kwargs: Custom parameters for the chart (supports Seaborn options).
             """
-            g = sns.pairplot(data, **kwargs)
+            import seaborn as sns
+
+            # Seaborn grids toggle `figure.autolayout` while they build the figure
+            with rc_scope():
+                g = sns.pairplot(data, **cls._filter_plot_kwargs(kwargs))
+            cls._detach(g.figure)
             cls._inject_logo(g.figure, kwargs)
             return g
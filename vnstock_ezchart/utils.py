@@ -65,30 +65,54 @@ class Utils:
     }
 
     @classmethod
-    def apply_palette(cls, color_palette: Union[str, List[str]], palette_shuffle: bool = False) -> None:
+    def resolve_palette(cls, color_palette: Union[str, List[str]], palette_shuffle: bool = False) -> Optional[List[str]]:
         """
-        Applies a color palette to the current matplotlib/seaborn context.
+        Returns the list of colors of a palette without changing any global setting.
 
         Args:
             color_palette (Union[str, List[str]]): The name of a predefined palette or a custom list of hex colors.
             palette_shuffle (bool): If True, shuffles the colors in the palette randomly.
+
+        Returns:
+            Optional[List[str]]: The colors, or None if the palette name is unknown.
         """
         if isinstance(color_palette, str):
             palette = cls.brand_palettes.get(color_palette, None)
             if palette is None:
                 print(f"Palette '{color_palette}' not found. Available palettes: {list(cls.brand_palettes.keys())}")
-                return
+                return None
         else:
             palette = color_palette
 
-        # Ensure palette is a list for shuffling and manipulation
+        # Copy so that shuffling never reorders the shared palette definition
         palette_list = list(palette)
 
         if palette_shuffle:
             random.shuffle(palette_list)
+        return palette_list
+
+    @classmethod
+    def apply_palette(cls, color_palette: Union[str, List[str]], palette_shuffle: bool = False) -> None:
+        """
+        Applies a color palette to the current matplotlib/seaborn context.
 
-        sns.set_palette(palette_list)
-        plt.rcParams['axes.prop_cycle'] = cycler('color', palette_list)
+        This changes the process-wide color cycle. Chart methods do not use it; they scope their
+        palette to their own axes (see `resolve_palette`).
+
+        Args:
+            color_palette (Union[str, List[str]]): The name of a predefined palette or a custom list of hex colors.
+            palette_shuffle (bool): If True, shuffles the colors in the palette randomly.
+        """
+        from .core.context import RC_LOCK
+
+        palette_list = cls.resolve_palette(color_palette, palette_shuffle)
+        if palette_list is None:
+            return
+
+        # Seaborn reads its default palette from the same rcParams cycle, so there is
+        # no need to import it here just to call `sns.set_palette`.
+        with RC_LOCK.exclusive():
+            plt.rcParams['axes.prop_cycle'] = cycler('color', palette_list)
 
     @staticmethod
     def readable_format(num: Union[int, float], fmt: Optional[str] = None) -> str:
@@ -141,33 +165,18 @@ class Utils:
     @staticmethod
     def download_font(font_family: str) -> None:
         """
-        Downloads a font from Google Fonts and registers it with Matplotlib.
+        Downloads a font from Google Fonts (once, into the asset cache) and registers it with Matplotlib.
 
         Args:
             font_family (str): The exact font family name as it appears on Google Fonts.
         """
-        font_url = f'https://fonts.google.com/download?family={font_family.replace(" ", "+")}'
-        response = requests.get(font_url, allow_redirects=True)
-        if response.status_code != 200:
-            raise Exception(f"Failed to download font: {font_family}")
-        zip_path = os.path.join('fonts', f'{font_family}.zip')
-        os.makedirs(os.path.dirname(zip_path), exist_ok=True)
-
-        with open(zip_path, 'wb') as font_file:
-            font_file.write(response.content)
-
-        extract_dir = os.path.join('fonts', font_family)
-        shutil.unpack_archive(zip_path, extract_dir)
-        os.remove(zip_path)
-
-        # Add the font to matplotlib's font list
-        for root, dirs, files in os.walk(os.path.join('fonts', font_family)):
-            for file in files:
-                if file.endswith('.ttf'):
-                    font_path = os.path.join(root, file)
-                    print(font_path)
-                    font_manager.fontManager.addfont(font_path)
-                    plt.rcParams['font.family'] = font_family
+        from .core.assets import fetch_font_family, register_font
+
+        # Archives are cached in the asset cache directory (see `Chart.set_asset_cache`),
+        # so only the first call on a machine downloads anything.
+        for font_path in fetch_font_family(font_family):
+            register_font(font_path)
+        Utils.set_font(font_family)
 
     @staticmethod
     def set_font(font_family: str) -> None:
@@ -178,7 +187,10 @@ class Utils:
         Args:
             font_family (str): The name of the font family to apply globally.
         """
-        plt.rcParams['font.family'] = font_family
+        from .core.context import RC_LOCK
+
+        with RC_LOCK.exclusive():
+            plt.rcParams['font.family'] = font_family
 
     @staticmethod
     def list_cmap() -> pd.Series: